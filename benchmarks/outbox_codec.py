@@ -0,0 +1,136 @@
+"""Per-event encode and decode cost of the outbox codecs.
+
+Compares OutboxCodec with the previous CustomJSONEncoder/CustomJSONDecoder
+pair, which is reproduced below. The old pair deep-copied every event
+through dataclasses.asdict. It also tried UUID() and
+datetime.fromisoformat() on every decoded string. Each event type is timed
+separately. orjson is measured as well when it is installed.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/outbox_codec.py
+"""
+import dataclasses
+import json
+from datetime import date, datetime
+from timeit import Timer
+from typing import Any
+from uuid import UUID, uuid4
+
+from meetups.domain.meetup.events import (
+    MeetupCreated,
+    MeetupDeleted,
+    MeetupStatusChanged,
+)
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.domain.meetup.velue_objects import Location, TimeSlot
+from meetups.domain.shared.event_id import EventId
+from meetups.domain.shared.events import DomainEvent
+from meetups.domain.shared.user_id import UserId
+from meetups.infrastructure.outbox.outbox_codec import (
+    MEETUP_EVENT_TYPES,
+    JsonBackend,
+    OutboxCodec,
+)
+
+ITERATIONS = 20_000
+
+
+class LegacyJSONEncoder(json.JSONEncoder):
+    def default(self, obj: object) -> Any:
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, UUID):
+            return str(obj)
+        return None
+
+
+class LegacyJSONDecoder(json.JSONDecoder):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(object_hook=self.object_hook, **kwargs)
+
+    def object_hook(self, obj: dict[str, Any]) -> dict[str, Any]:
+        for key, value in obj.items():
+            if isinstance(value, str):
+                try:
+                    obj[key] = UUID(value)
+                    continue
+                except ValueError:
+                    pass
+
+                try:
+                    obj[key] = datetime.fromisoformat(value)
+                    continue
+                except ValueError:
+                    pass
+        return obj
+
+
+def make_events() -> list[DomainEvent]:
+    now = datetime.now()
+    events: list[DomainEvent] = [
+        MeetupCreated(
+            meetup_id=MeetupId(uuid4()),
+            creator=UserId(uuid4()),
+            time=TimeSlot(date(2025, 1, 1), date(2025, 1, 2)),
+            location=Location("Main street 1", "Berlin", "Germany"),
+            title="Python meetup",
+            description="Talks about asyncio, typing and packaging.",
+            event_date=now,
+        ),
+        MeetupStatusChanged(
+            meetup_id=MeetupId(uuid4()),
+            status=MeetupStatus.STARTED,
+            event_date=now,
+        ),
+        MeetupDeleted(meetup_id=MeetupId(uuid4()), event_date=now),
+    ]
+
+    for event in events:
+        event.set_event_id(EventId(uuid4()))
+
+    return events
+
+
+def per_call_us(function: Any) -> float:
+    timer = Timer(function)
+    return min(timer.repeat(repeat=5, number=ITERATIONS)) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    codecs = {"OutboxCodec/json": OutboxCodec(MEETUP_EVENT_TYPES)}
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        codecs["OutboxCodec/orjson"] = OutboxCodec(
+            MEETUP_EVENT_TYPES, JsonBackend(orjson.dumps, orjson.loads)
+        )
+
+    print(f"{'event':<22}{'codec':<22}{'encode us':>11}{'decode us':>11}")
+
+    for event in make_events():
+        legacy_data = json.dumps(event, cls=LegacyJSONEncoder)
+        print(
+            f"{event.event_type:<22}{'legacy':<22}"
+            f"{per_call_us(lambda: json.dumps(event, cls=LegacyJSONEncoder)):>11.2f}"
+            f"{per_call_us(lambda: json.loads(legacy_data, cls=LegacyJSONDecoder)):>11.2f}"
+        )
+
+        for name, codec in codecs.items():
+            data = codec.encode(event)
+            assert codec.decode(event.event_type, data) == event
+            print(
+                f"{event.event_type:<22}{name:<22}"
+                f"{per_call_us(lambda: codec.encode(event)):>11.2f}"
+                f"{per_call_us(lambda: codec.decode(event.event_type, data)):>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
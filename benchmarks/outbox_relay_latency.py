@@ -0,0 +1,144 @@
+"""Commit-to-publish latency of the long-running OutboxRelay.
+
+A writer commits one outbox message at a time with random gaps while an
+OutboxRelay drains the outbox with a fake publisher. The benchmark reports
+latency percentiles from the writer's commit to the publish call. It runs
+once with the in-process signal and once on adaptive polling alone.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/outbox_relay_latency.py [DATABASE_URI]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+from meetups.infrastructure.outbox.outbox_processor import OutboxProcessor
+from meetups.infrastructure.outbox.outbox_publisher import OutboxPublisher
+from meetups.infrastructure.outbox.outbox_telemetry import OutboxTelemetry
+from meetups.infrastructure.outbox.outbox_relay import OutboxRelay
+from meetups.infrastructure.persistence.adapters.sql_outbox_gateway import (
+    SqlOutboxGateway,
+)
+from meetups.infrastructure.persistence.sql_tables import METADATA, OUTBOX_TABLE
+from meetups.infrastructure.utc_time_provider import UtcTimeProvider
+
+from outbox_relay_throughput import ConnectionTransaction
+
+MESSAGES = 300
+MAX_GAP = 0.05
+MIN_POLL_DELAY = 0.01
+MAX_POLL_DELAY = 1.0
+
+
+class RecordingOutboxPublisher(OutboxPublisher):
+    def __init__(self, committed_at: dict[str, float]) -> None:
+        self._committed_at = committed_at
+        self.latencies: list[float] = []
+
+    async def publish(self, message: OutboxMessage) -> None:
+        self.latencies.append(
+            perf_counter() - self._committed_at[message.data.hex()]
+        )
+
+
+async def write(
+    engine: AsyncEngine,
+    notify: InProcessOutboxSignal | None,
+    committed_at: dict[str, float],
+) -> None:
+    async with engine.connect() as connection:
+        for _ in range(MESSAGES):
+            await asyncio.sleep(random.uniform(0, MAX_GAP))
+            message_id = uuid7()
+            await connection.execute(
+                OUTBOX_TABLE.insert().values(
+                    message_id=message_id,
+                    data=message_id.bytes,
+                    event_type="MeetupStatusChanged",
+                )
+            )
+            committed_at[message_id.hex] = perf_counter()
+            await connection.commit()
+            # What OutboxNotificationBehavior does after CommitionBehavior.
+            if notify is not None:
+                await notify.notify()
+
+
+async def run_case(engine: AsyncEngine, signalled: bool) -> list[float]:
+    committed_at: dict[str, float] = {}
+    publisher = RecordingOutboxPublisher(committed_at)
+    signal = InProcessOutboxSignal()
+
+    @asynccontextmanager
+    async def open_outbox_processor() -> AsyncIterator[OutboxProcessor]:
+        async with engine.connect() as connection:
+            yield OutboxProcessor(
+                ConnectionTransaction(connection),
+                SqlOutboxGateway(connection),
+                publisher,
+                OutboxTelemetry(UtcTimeProvider(), max_lag=60.0),
+                batch_size=100,
+                max_batches_per_run=100,
+            )
+
+    relay = OutboxRelay(
+        open_outbox_processor, signal, MIN_POLL_DELAY, MAX_POLL_DELAY
+    )
+    relay_task = asyncio.create_task(relay.run())
+    await write(engine, signal if signalled else None, committed_at)
+
+    while len(publisher.latencies) < MESSAGES:
+        await asyncio.sleep(MIN_POLL_DELAY)
+
+    relay_task.cancel()
+    return publisher.latencies
+
+
+async def run(database_uri: str) -> None:
+    engine = create_async_engine(database_uri)
+
+    async with engine.connect() as connection:
+        await connection.run_sync(METADATA.create_all)
+        await connection.execute(OUTBOX_TABLE.delete())
+        await connection.commit()
+
+    print(f"{'wake-up':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+
+    for signalled in (True, False):
+        latencies = await run_case(engine, signalled)
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{'signal' if signalled else 'polling':>10}"
+            f"{percentiles[49] * 1000:>10.1f}"
+            f"{percentiles[98] * 1000:>10.1f}"
+            f"{max(latencies) * 1000:>10.1f}"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("database_uri", nargs="?")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(
+            run(
+                arguments.database_uri
+                or f"sqlite+aiosqlite:///{directory}/outbox.db"
+            )
+        )
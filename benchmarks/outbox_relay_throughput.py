@@ -0,0 +1,121 @@
+"""Outbox relay throughput with a fake OutboxPublisher.
+
+Fills the outbox with N messages and drains it with OutboxProcessor for a
+few batch sizes, reporting messages per second and commits per run. The
+publisher only counts messages (plus an optional simulated broker latency),
+so the numbers isolate the claim/delete/commit cost of the relay.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/outbox_relay_throughput.py \
+        [DATABASE_URI] [--publish-latency-ms N]
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+from meetups.infrastructure.outbox.outbox_processor import OutboxProcessor
+from meetups.infrastructure.outbox.outbox_publisher import OutboxPublisher
+from meetups.infrastructure.outbox.outbox_telemetry import OutboxTelemetry
+from meetups.infrastructure.persistence.adapters.sql_outbox_gateway import (
+    SqlOutboxGateway,
+)
+from meetups.infrastructure.persistence.sql_tables import METADATA, OUTBOX_TABLE
+from meetups.infrastructure.utc_time_provider import UtcTimeProvider
+from meetups.infrastructure.persistence.transaction import Transaction
+
+MESSAGES = 20_000
+BATCH_SIZES = (1, 10, 100, 1000)
+
+
+class ConnectionTransaction(Transaction):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+        await self._connection.commit()
+
+    async def rollback(self) -> None:
+        await self._connection.rollback()
+
+
+class FakeOutboxPublisher(OutboxPublisher):
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+        self.published = 0
+
+    async def publish(self, message: OutboxMessage) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self.published += 1
+
+
+async def fill_outbox(connection: AsyncConnection) -> None:
+    await connection.execute(OUTBOX_TABLE.delete())
+    await connection.execute(
+        OUTBOX_TABLE.insert(),
+        [
+            {
+                "message_id": uuid7(),
+                "data": b'{"meetup_id": "benchmark"}',
+                "event_type": "MeetupStatusChanged",
+            }
+            for _ in range(MESSAGES)
+        ],
+    )
+    await connection.commit()
+
+
+async def run(database_uri: str, publish_latency: float) -> None:
+    engine = create_async_engine(database_uri)
+
+    async with engine.connect() as connection:
+        await connection.run_sync(METADATA.create_all)
+        await connection.commit()
+
+        print(f"{'batch':>8}{'published':>12}{'commits':>10}{'msg/s':>12}")
+
+        for batch_size in BATCH_SIZES:
+            await fill_outbox(connection)
+
+            transaction = ConnectionTransaction(connection)
+            publisher = FakeOutboxPublisher(publish_latency)
+            processor = OutboxProcessor(
+                transaction,
+                SqlOutboxGateway(connection),
+                publisher,
+                OutboxTelemetry(UtcTimeProvider(), max_lag=60.0),
+                batch_size=batch_size,
+                max_batches_per_run=MESSAGES,
+            )
+
+            started_at = perf_counter()
+            await processor.process()
+            elapsed = perf_counter() - started_at
+
+            print(
+                f"{batch_size:>8}{publisher.published:>12}"
+                f"{transaction.commits:>10}"
+                f"{publisher.published / elapsed:>12.0f}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "database_uri", nargs="?", default="sqlite+aiosqlite://"
+    )
+    parser.add_argument("--publish-latency-ms", type=float, default=0.0)
+    arguments = parser.parse_args()
+
+    asyncio.run(
+        run(arguments.database_uri, arguments.publish_latency_ms / 1000)
+    )
@@ -0,0 +1,106 @@
+"""Cost of recording request metrics.
+
+Times PrometheusRequestMetrics.observe_request and observe_phase directly,
+and a no-op query sent through the mediator with and without
+RequestMetricsBehavior in its pipeline. The difference is what every
+command and query pays for /metrics. Rendering is timed separately; it
+only runs when /metrics is scraped.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/request_metrics_overhead.py
+"""
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+
+from bazario.asyncio import Dispatcher, Registry, RequestHandler
+from bazario.asyncio.resolvers.dishka import DishkaResolver
+from dishka import Provider, Scope, make_async_container, provide
+
+from meetups.application.common.behaviors.request_metrics_behavior import (
+    RequestMetricsBehavior,
+)
+from meetups.application.common.markers.query import Query
+from meetups.application.ports.request_metrics import RequestMetrics
+from meetups.infrastructure.metrics.prometheus_request_metrics import (
+    PrometheusRequestMetrics,
+)
+
+ITERATIONS = 200_000
+REQUEST_TYPES = 20
+
+
+@dataclass(frozen=True)
+class Noop(Query[None]): ...
+
+
+class NoopHandler(RequestHandler[Noop, None]):
+    async def handle(self, request: Noop) -> None:
+        return None
+
+
+class BenchmarkProvider(Provider):
+    scope = Scope.APP
+
+    handler = provide(NoopHandler)
+    behavior = provide(RequestMetricsBehavior)
+
+    @provide
+    def request_metrics(self) -> RequestMetrics:
+        return PrometheusRequestMetrics()
+
+
+def time_observations(metrics: PrometheusRequestMetrics) -> float:
+    started_at = perf_counter()
+
+    for _ in range(ITERATIONS):
+        metrics.observe_request(Noop, 0.004, failed=False)
+
+    return (perf_counter() - started_at) / ITERATIONS * 1_000_000_000
+
+
+async def time_dispatch(with_metrics: bool) -> float:
+    registry = Registry()
+    registry.add_request_handler(Noop, NoopHandler)
+    if with_metrics:
+        registry.add_pipeline_behaviors(Query, RequestMetricsBehavior)
+
+    container = make_async_container(BenchmarkProvider())
+    dispatcher = Dispatcher(DishkaResolver(container), registry)
+    request = Noop()
+
+    started_at = perf_counter()
+    for _ in range(ITERATIONS):
+        await dispatcher.send(request)
+    elapsed = perf_counter() - started_at
+
+    await container.close()
+
+    return elapsed / ITERATIONS * 1_000_000_000
+
+
+async def run() -> None:
+    metrics = PrometheusRequestMetrics()
+    print(f"{'observe_request':<24}{time_observations(metrics):>10.0f} ns")
+
+    for number in range(REQUEST_TYPES):
+        request_type = type(f"Request{number}", (), {})
+        metrics.observe_request(request_type, 0.01 * number, failed=False)
+        metrics.observe_phase(request_type, "commit", 0.002)
+        metrics.observe_phase(request_type, "publish", 0.001)
+
+    started_at = perf_counter()
+    body = metrics.render()
+    elapsed = (perf_counter() - started_at) * 1_000_000
+    print(f"{'render':<24}{elapsed:>10.0f} us ({len(body)} bytes)")
+
+    await time_dispatch(with_metrics=False)  # warm up
+    without_metrics = await time_dispatch(with_metrics=False)
+    with_metrics = await time_dispatch(with_metrics=True)
+    print(f"{'send without metrics':<24}{without_metrics:>10.0f} ns")
+    print(f"{'send with metrics':<24}{with_metrics:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
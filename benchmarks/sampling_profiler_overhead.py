@@ -0,0 +1,77 @@
+"""Cost of the sampling profiler on the code it watches.
+
+Runs a CPU-bound coroutine mix for a fixed number of rounds, first alone
+and then while SamplingProfiler samples the process at several intervals.
+The slowdown is what /debug/profile costs live traffic while it runs.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/sampling_profiler_overhead.py
+"""
+import asyncio
+import contextlib
+import json
+from time import perf_counter
+
+from meetups.infrastructure.profiling.sampling_profiler import (
+    SamplingProfiler,
+)
+
+ROUNDS = 20_000
+TASKS = 20
+INTERVALS = (0.001, 0.005, 0.01)
+
+DOCUMENT = {
+    "meetups": [
+        {"title": f"Meetup {number}", "tags": list(range(20))}
+        for number in range(20)
+    ]
+}
+
+
+async def work() -> None:
+    for _ in range(ROUNDS // TASKS):
+        json.loads(json.dumps(DOCUMENT))
+        await asyncio.sleep(0)
+
+
+async def time_work() -> float:
+    started_at = perf_counter()
+    await asyncio.gather(*(work() for _ in range(TASKS)))
+    return perf_counter() - started_at
+
+
+async def time_profiled_work(interval: float) -> float:
+    # The profile is cancelled once the work is done; cancelling stops the
+    # sampler the same way a disconnecting client would.
+    profiler = SamplingProfiler(interval, max_seconds=3600.0)
+    profile_task = asyncio.create_task(profiler.profile(3600.0))
+    await asyncio.sleep(0)
+
+    elapsed = await time_work()
+
+    profile_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await profile_task
+
+    return elapsed
+
+
+async def run() -> None:
+    await time_work()  # warm up
+    baseline = await time_work()
+
+    print(f"{'interval':<12}{'ms':>10}{'slowdown':>10}")
+    print(f"{'off':<12}{baseline * 1000:>10.1f}{'':>10}")
+
+    for interval in INTERVALS:
+        elapsed = await time_profiled_work(interval)
+        slowdown = (elapsed / baseline - 1) * 100
+        print(
+            f"{interval * 1000:<9.0f} ms{elapsed * 1000:>10.1f}"
+            f"{slowdown:>9.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
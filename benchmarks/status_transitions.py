@@ -0,0 +1,173 @@
+"""Throughput and peak memory of set-based meetup status transitions.
+
+Fills the meetups table with N rows spread over past, current and future
+dates. MeetupStatusTransitionProcessor then moves them all in one run. The
+benchmark reports the resulting statuses, outbox messages, elapsed time and
+peak Python memory. Peak memory should stay flat as N grows. It also times
+a second, idle run, which should not depend on N.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/status_transitions.py [DATABASE_URI]
+"""
+import asyncio
+import sys
+import tracemalloc
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.cache.in_memory_cache_backend import (
+    InMemoryCacheBackend,
+)
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.outbox_codec import (
+    MEETUP_EVENT_TYPES,
+    OutboxCodec,
+)
+from meetups.infrastructure.persistence.adapters.sql_change_versions import (
+    SqlChangeVersions,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_status_transitioner import (
+    SqlMeetupStatusTransitioner,
+)
+from meetups.infrastructure.persistence.adapters.sql_outbox_gateway import (
+    SqlOutboxGateway,
+)
+from meetups.infrastructure.persistence.sql_tables import (
+    MEETUPS_TABLE,
+    METADATA,
+    OUTBOX_TABLE,
+)
+from meetups.infrastructure.utc_time_provider import UtcTimeProvider
+from meetups.infrastructure.uuid7_id_generator import UUID7IdGenerator
+
+from unit_of_work_flush import ConnectionTransaction
+
+SIZES = (10_000, 100_000)
+BATCH_SIZE = 1000
+INSERT_CHUNK = 10_000
+
+
+async def fill_meetups(connection: AsyncConnection, amount: int) -> None:
+    today = datetime.now(UTC).date()
+    # Finished, ongoing and upcoming meetups in equal shares.
+    time_slots = (
+        (today - timedelta(days=10), today - timedelta(days=9)),
+        (today - timedelta(days=1), today + timedelta(days=1)),
+        (today + timedelta(days=9), today + timedelta(days=10)),
+    )
+
+    for offset in range(0, amount, INSERT_CHUNK):
+        await connection.execute(
+            MEETUPS_TABLE.insert(),
+            [
+                {
+                    "meetup_id": uuid7(),
+                    "user_id": uuid4(),
+                    "title": f"Meetup {number}",
+                    "description": "Benchmark meetup",
+                    "address": "Main st. 1",
+                    "city": "Berlin",
+                    "country": "Germany",
+                    "start_date": time_slots[number % 3][0],
+                    "finish_date": time_slots[number % 3][1],
+                    "status": MeetupStatus.COMING,
+                    "posted_at": datetime.now(UTC),
+                    "next_transition_at": time_slots[number % 3][0],
+                }
+                for number in range(
+                    offset, min(offset + INSERT_CHUNK, amount)
+                )
+            ],
+        )
+    await connection.commit()
+
+
+async def run(database_uri: str) -> None:
+    engine = create_async_engine(database_uri)
+
+    print(
+        f"{'n':>8}{'moved':>8}{'outbox':>8}{'ms':>10}{'idle ms':>10}"
+        f"{'peak KiB':>10}"
+        "  statuses"
+    )
+
+    for amount in SIZES:
+        async with engine.connect() as connection:
+            await connection.run_sync(METADATA.drop_all)
+            await connection.run_sync(METADATA.create_all)
+            await connection.commit()
+            await fill_meetups(connection, amount)
+
+            processor = MeetupStatusTransitionProcessor(
+                ConnectionTransaction(connection),
+                SqlMeetupStatusTransitioner(connection),
+                SqlOutboxGateway(connection),
+                OutboxCodec(MEETUP_EVENT_TYPES),
+                InProcessOutboxSignal(),
+                SqlChangeVersions(connection),
+                MeetupCacheInvalidator(InMemoryCacheBackend(1, 1.0)),
+                UUID7IdGenerator(),
+                UtcTimeProvider(),
+                batch_size=BATCH_SIZE,
+            )
+
+            tracemalloc.start()
+            started_at = perf_counter()
+            moved = await processor.process()
+            elapsed = (perf_counter() - started_at) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            # Nothing is due any more, so this is the cost of an idle tick.
+            started_at = perf_counter()
+            await processor.process()
+            idle_tick = (perf_counter() - started_at) * 1000
+
+            outbox = await connection.scalar(
+                select(func.count()).select_from(OUTBOX_TABLE)
+            )
+            statuses = Counter(
+                dict(
+                    (await connection.execute(
+                        select(MEETUPS_TABLE.c.status, func.count())
+                        .group_by(MEETUPS_TABLE.c.status)
+                    )).tuples().all()
+                )
+            )
+            next_transition_date = await processor.load_next_transition_date()
+            print(
+                f"{amount:>8}{moved:>8}{outbox:>8}{elapsed:>10.0f}"
+                f"{idle_tick:>10.1f}"
+                f"{peak / 1024:>10.0f}  "
+                + ", ".join(
+                    f"{status.value}={count}"
+                    for status, count in sorted(
+                        statuses.items(), key=lambda item: item[0].value
+                    )
+                )
+                + f", next transition on {next_transition_date}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        run(sys.argv[1] if len(sys.argv) > 1 else "sqlite+aiosqlite://")
+    )
@@ -0,0 +1,155 @@
+"""Round trips and commit latency of UnitOfWorkImpl flushes.
+
+Compares flushing N new, dirty and deleted meetups one statement per entity
+against the batched ``*_many`` DataMapper path.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/unit_of_work_flush.py [DATABASE_URI]
+"""
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.domain.meetup.velue_objects import Location, TimeSlot
+from meetups.domain.shared.user_id import UserId
+from meetups.infrastructure.domain_events import DomainEvents
+from meetups.infrastructure.persistence.adapters.sql_change_versions import (
+    SqlChangeVersions,
+)
+from meetups.infrastructure.persistence.adapters.sql_data_mappers_registry import (
+    SqlDataMappersRegistry,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_data_mapper import (
+    SqlMeetupDataMapper,
+)
+from meetups.infrastructure.persistence.adapters.unit_of_work import (
+    UnitOfWorkImpl,
+)
+from meetups.infrastructure.persistence.sql_tables import METADATA
+from meetups.infrastructure.persistence.transaction import Transaction
+from meetups.infrastructure.tracing.tracer import Tracer
+
+SIZES = (1, 100, 10_000)
+
+
+class ConnectionTransaction(Transaction):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def commit(self) -> None:
+        await self._connection.commit()
+
+    async def rollback(self) -> None:
+        await self._connection.rollback()
+
+
+class RoundTripCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: object) -> None:
+        self.count += 1
+
+
+def make_meetups(
+    unit_of_work: UnitOfWorkImpl, amount: int
+) -> list[Meetup]:
+    return [
+        Meetup(
+            MeetupId(uuid7()),
+            DomainEvents(),
+            unit_of_work,
+            creator_id=UserId(uuid4()),
+            title=f"Meetup {number}",
+            description="Benchmark meetup",
+            location=Location("Main st. 1", "Berlin", "Germany"),
+            time=TimeSlot(date(2030, 1, 1), date(2030, 1, 2)),
+            posted_at=datetime.now(UTC),
+        )
+        for number in range(amount)
+    ]
+
+
+async def measure(
+    counter: RoundTripCounter, action: Callable[[], Awaitable[None]]
+) -> tuple[int, float]:
+    counter.count = 0
+    started_at = perf_counter()
+    await action()
+    return counter.count, (perf_counter() - started_at) * 1000
+
+
+async def run(database_uri: str) -> None:
+    engine = create_async_engine(database_uri)
+    counter = RoundTripCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    print(f"{'phase':<8}{'n':>8}{'mode':>10}{'round trips':>14}{'ms':>12}")
+
+    for amount in SIZES:
+        async with engine.connect() as connection:
+            await connection.run_sync(METADATA.drop_all)
+            await connection.run_sync(METADATA.create_all)
+            await connection.commit()
+
+            data_mapper = SqlMeetupDataMapper(connection)
+            unit_of_work = UnitOfWorkImpl(
+                ConnectionTransaction(connection),
+                SqlDataMappersRegistry(data_mapper),
+                SqlChangeVersions(connection),
+                Tracer(),
+            )
+
+            async def per_entity(
+                operation: Callable[[Meetup], Awaitable[None]],
+                meetups: list[Meetup],
+            ) -> None:
+                for meetup in meetups:
+                    await operation(meetup)
+                await connection.commit()
+
+            baseline = make_meetups(unit_of_work, amount)
+            batched = make_meetups(unit_of_work, amount)
+
+            for phase, single, register in (
+                ("insert", data_mapper.insert, unit_of_work.register_new),
+                ("update", data_mapper.update, unit_of_work.register_dirty),
+                ("delete", data_mapper.delete, unit_of_work.register_deleted),
+            ):
+                if phase == "update":
+                    for meetup in (*baseline, *batched):
+                        meetup.edit_meetup_status(
+                            MeetupStatus.STARTED, datetime.now(UTC)
+                        )
+                    unit_of_work._clear()  # noqa: SLF001
+
+                trips, elapsed = await measure(
+                    counter, lambda: per_entity(single, baseline)
+                )
+                print(f"{phase:<8}{amount:>8}{'single':>10}{trips:>14}"
+                      f"{elapsed:>12.2f}")
+
+                for meetup in batched:
+                    register(meetup)
+                trips, elapsed = await measure(counter, unit_of_work.commit)
+                print(f"{phase:<8}{amount:>8}{'batched':>10}{trips:>14}"
+                      f"{elapsed:>12.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        run(sys.argv[1] if len(sys.argv) > 1 else "sqlite+aiosqlite://")
+    )
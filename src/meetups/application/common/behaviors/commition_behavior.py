@@ -1,16 +1,26 @@
+from time import perf_counter
+
 from bazario.asyncio import HandleNext, PipelineBehavior
 
 from meetups.application.common.markers.command import Command
 from meetups.application.ports.committer import Committer
+from meetups.application.ports.request_metrics import RequestMetrics
 
 
 class CommitionBehavior[C: Command, R](PipelineBehavior[C, R]):
-    def __init__(self, committer: Committer) -> None:
+    def __init__(
+        self, committer: Committer, request_metrics: RequestMetrics
+    ) -> None:
         self._committer = committer
+        self._request_metrics = request_metrics
 
     async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
         response = await handle_next(request)
 
+        started_at = perf_counter()
         await self._committer.commit()
+        self._request_metrics.observe_phase(
+            type(request), "commit", perf_counter() - started_at
+        )
 
         return response
@@ -13,8 +13,11 @@ class EventIdGenerationBehavior(PipelineBehavior[DomainEvent, None]):
         request: DomainEvent,
         handle_next: HandleNext[DomainEvent, None],
     ) -> None:
-        request.set_event_id(
-            self._id_generator.generate_event_id(),
-        )
+        # The chain runs once per notification handler, so the event may
+        # already carry the id given to it for an earlier handler.
+        if request.event_id is None:
+            request.set_event_id(
+                self._id_generator.generate_event_id(),
+            )
 
         return await handle_next(request)
@@ -1,7 +1,10 @@
+from time import perf_counter
+
 from bazario.asyncio import HandleNext, PipelineBehavior, Publisher
 
 from meetups.application.common.markers.command import Command
 from meetups.application.ports.event_raiser import DomainEventsRaiser
+from meetups.application.ports.request_metrics import RequestMetrics
 
 
 class EventPublishingBehavior[C: Command, R](PipelineBehavior[C, R]):
@@ -9,14 +12,20 @@ class EventPublishingBehavior[C: Command, R](PipelineBehavior[C, R]):
         self,
         publisher: Publisher,
         events_raiser: DomainEventsRaiser,
+        request_metrics: RequestMetrics,
     ) -> None:
         self._publisher = publisher
         self._events_raiser = events_raiser
+        self._request_metrics = request_metrics
 
     async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
         response = await handle_next(request)
 
+        started_at = perf_counter()
         for event in self._events_raiser.raise_events():
             await self._publisher.publish(event)
+        self._request_metrics.observe_phase(
+            type(request), "publish", perf_counter() - started_at
+        )
 
         return response
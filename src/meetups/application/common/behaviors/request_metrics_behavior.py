@@ -0,0 +1,28 @@
+from time import perf_counter
+
+from bazario import Request
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from meetups.application.ports.request_metrics import RequestMetrics
+
+
+class RequestMetricsBehavior[Q: Request, R](PipelineBehavior[Q, R]):
+    def __init__(self, request_metrics: RequestMetrics) -> None:
+        self._request_metrics = request_metrics
+
+    async def handle(self, request: Q, handle_next: HandleNext[Q, R]) -> R:
+        started_at = perf_counter()
+
+        try:
+            response = await handle_next(request)
+        except Exception:
+            self._request_metrics.observe_request(
+                type(request), perf_counter() - started_at, failed=True
+            )
+            raise
+
+        self._request_metrics.observe_request(
+            type(request), perf_counter() - started_at, failed=False
+        )
+
+        return response
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class BatchItemError:
+    index: int
+    message: str
+
+
+@dataclass(frozen=True)
+class BatchResult[T]:
+    """Outcome of a batch command; items are referred to by their index."""
+
+    succeeded: list[T] = field(default_factory=list)
+    errors: list[BatchItemError] = field(default_factory=list)
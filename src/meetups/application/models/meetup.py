@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -17,3 +18,9 @@ class MeetupReadModel:
     time: TimeSlot
     status: MeetupStatus
     posted_at: datetime
+
+
+@dataclass(frozen=True)
+class MeetupsPage:
+    meetups: Iterable[MeetupReadModel]
+    next_cursor: str | None = None
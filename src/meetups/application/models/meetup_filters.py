@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.domain.shared.user_id import UserId
+
+
+@dataclass(frozen=True)
+class MeetupFilters:
+    city: str | None = field(default=None)
+    country: str | None = field(default=None)
+    status: MeetupStatus | None = field(default=None)
+    creator_id: UserId | None = field(default=None)
+    start_from: date | None = field(default=None)
+    finish_to: date | None = field(default=None)
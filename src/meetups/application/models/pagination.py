@@ -1,7 +1,42 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
 from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from meetups.domain.meetup.meetup_id import MeetupId
+
+_CURSOR_SEPARATOR = "|"
 
 
 @dataclass(frozen=True)
 class Pagination:
     limit: int = field(default=20)
-    offset: int = field(default=0)
\ No newline at end of file
+    offset: int = field(default=0)
+
+
+@dataclass(frozen=True)
+class MeetupsCursor:
+    """Keyset position in the ``(posted_at, meetup_id)`` ordering."""
+
+    posted_at: datetime
+    meetup_id: MeetupId
+
+    def encode(self) -> str:
+        raw = _CURSOR_SEPARATOR.join(
+            (self.posted_at.isoformat(), self.meetup_id.hex),
+        )
+        return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "MeetupsCursor":
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            raw = urlsafe_b64decode(cursor + padding).decode()
+            posted_at, meetup_id = raw.split(_CURSOR_SEPARATOR)
+            return cls(
+                posted_at=datetime.fromisoformat(posted_at),
+                meetup_id=MeetupId(UUID(hex=meetup_id)),
+            )
+        except (Base64Error, UnicodeDecodeError, ValueError) as error:
+            raise ValueError(f"Invalid cursor {cursor!r}") from error
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from collections.abc import AsyncIterator
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.markers.query import Query
+from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.ports.meetup_gateway import MeetupGateway
+
+
+@dataclass(frozen=True)
+class ExportMeetups(Query[AsyncIterator[MeetupReadModel]]): ...
+
+
+class ExportMeetupsHandler(
+    RequestHandler[ExportMeetups, AsyncIterator[MeetupReadModel]]
+):
+    def __init__(self, meetup_gateway: MeetupGateway) -> None:
+        self._meetup_gateway = meetup_gateway
+
+    async def handle(
+        self, request: ExportMeetups
+    ) -> AsyncIterator[MeetupReadModel]:
+        return self._meetup_gateway.stream_all()
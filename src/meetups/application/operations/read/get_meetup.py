@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.common.markers.query import Query
+from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.ports.meetup_gateway import MeetupGateway
+from meetups.domain.meetup.meetup_id import MeetupId
+
+
+@dataclass(frozen=True)
+class GetMeetup(Query[MeetupReadModel]):
+    meetup_id: MeetupId
+
+
+class GetMeetupHandler(RequestHandler[GetMeetup, MeetupReadModel]):
+    def __init__(self, meetup_gateway: MeetupGateway) -> None:
+        self._meetup_gateway = meetup_gateway
+
+    async def handle(self, request: GetMeetup) -> MeetupReadModel:
+        meetup = await self._meetup_gateway.load(request.meetup_id)
+
+        if meetup is None:
+            raise ApplicationError(
+                message="Meetup not found",
+                error_type=ErrorType.NOT_FOUND,
+            )
+
+        return meetup
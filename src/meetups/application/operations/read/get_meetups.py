@@ -1,26 +1,79 @@
-from dataclasses import dataclass
-from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Final
 
 from bazario.asyncio import RequestHandler
 
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType
+)
 from meetups.application.common.markers.query import Query
-from meetups.application.models.pagination import Pagination
-from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.models.meetup_filters import MeetupFilters
+from meetups.application.models.pagination import MeetupsCursor, Pagination
+from meetups.application.models.meetup import MeetupsPage
 from meetups.application.ports.meetup_gateway import MeetupGateway
 
+MAX_MEETUPS_PER_PAGE: Final[int] = 100
+
 
 @dataclass(frozen=True)
-class GetMeetups(Query[Iterable[MeetupReadModel]]):
+class GetMeetups(Query[MeetupsPage]):
     pagination: Pagination
+    cursor: str | None = field(default=None)
+    filters: MeetupFilters = field(default_factory=MeetupFilters)
+    include_archived: bool = field(default=False)
 
 
-class GetMeetupsHandler(RequestHandler[GetMeetups, Iterable[MeetupReadModel]]):
+class GetMeetupsHandler(RequestHandler[GetMeetups, MeetupsPage]):
     def __init__(self, meetup_gateway: MeetupGateway) -> None:
         self._meetup_gateway = meetup_gateway
 
-    async def handle(self, request: GetMeetups) -> Iterable[MeetupReadModel]:
-        meetups = await self._meetup_gateway.load_many(
-            pagination=request.pagination
+    async def handle(self, request: GetMeetups) -> MeetupsPage:
+        self._validate_pagination(request.pagination)
+
+        meetups = list(
+            await self._meetup_gateway.load_many(
+                pagination=request.pagination,
+                cursor=self._decode_cursor(request.cursor),
+                filters=request.filters,
+                include_archived=request.include_archived,
+            )
+        )
+
+        if not meetups or len(meetups) < request.pagination.limit:
+            return MeetupsPage(meetups=meetups)
+
+        last_meetup = meetups[-1]
+        next_cursor = MeetupsCursor(
+            posted_at=last_meetup.posted_at,
+            meetup_id=last_meetup.meetup_id,
         )
 
-        return meetups
\ No newline at end of file
+        return MeetupsPage(meetups=meetups, next_cursor=next_cursor.encode())
+
+    def _validate_pagination(self, pagination: Pagination) -> None:
+        if not 1 <= pagination.limit <= MAX_MEETUPS_PER_PAGE:
+            raise ApplicationError(
+                message=(
+                    f"Page limit must be between 1 and {MAX_MEETUPS_PER_PAGE}"
+                ),
+                error_type=ErrorType.VALIDATION_ERROR
+            )
+
+        if pagination.offset < 0:
+            raise ApplicationError(
+                message="Page offset must not be negative",
+                error_type=ErrorType.VALIDATION_ERROR
+            )
+
+    def _decode_cursor(self, cursor: str | None) -> MeetupsCursor | None:
+        if cursor is None:
+            return None
+
+        try:
+            return MeetupsCursor.decode(cursor)
+        except ValueError as error:
+            raise ApplicationError(
+                message="Invalid pagination cursor",
+                error_type=ErrorType.VALIDATION_ERROR
+            ) from error
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Final
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.common.markers.query import Query
+from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.ports.meetup_gateway import MeetupGateway
+from meetups.domain.meetup.meetup_id import MeetupId
+
+MAX_MEETUP_IDS_PER_REQUEST: Final[int] = 100
+
+
+@dataclass(frozen=True)
+class GetMeetupsByIds(Query[list[MeetupReadModel]]):
+    meetup_ids: list[MeetupId]
+
+
+class GetMeetupsByIdsHandler(
+    RequestHandler[GetMeetupsByIds, list[MeetupReadModel]]
+):
+    """Returns the requested meetups in request order.
+
+    Unknown ids are left out of the result instead of failing the whole
+    request.
+    """
+
+    def __init__(self, meetup_gateway: MeetupGateway) -> None:
+        self._meetup_gateway = meetup_gateway
+
+    async def handle(
+        self, request: GetMeetupsByIds
+    ) -> list[MeetupReadModel]:
+        if len(request.meetup_ids) > MAX_MEETUP_IDS_PER_REQUEST:
+            raise ApplicationError(
+                message=(
+                    f"At most {MAX_MEETUP_IDS_PER_REQUEST} meetups can be "
+                    "requested at once"
+                ),
+                error_type=ErrorType.VALIDATION_ERROR,
+            )
+
+        return await self._meetup_gateway.load_by_ids(request.meetup_ids)
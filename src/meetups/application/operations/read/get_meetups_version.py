@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.markers.query import Query
+from meetups.application.ports.change_version_gateway import (
+    ChangeVersionGateway,
+)
+from meetups.domain.meetup.meetup import Meetup
+
+
+@dataclass(frozen=True)
+class GetMeetupsVersion(Query[int]): ...
+
+
+class GetMeetupsVersionHandler(RequestHandler[GetMeetupsVersion, int]):
+    def __init__(self, change_version_gateway: ChangeVersionGateway) -> None:
+        self._change_version_gateway = change_version_gateway
+
+    async def handle(self, request: GetMeetupsVersion) -> int:
+        return await self._change_version_gateway.load_version(Meetup)
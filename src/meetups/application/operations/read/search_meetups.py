@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from collections.abc import Iterable
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType
+)
+from meetups.application.common.markers.query import Query
+from meetups.application.models.pagination import Pagination
+from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.ports.meetup_gateway import MeetupGateway
+
+
+@dataclass(frozen=True)
+class SearchMeetups(Query[Iterable[MeetupReadModel]]):
+    query: str
+    pagination: Pagination = field(default_factory=Pagination)
+
+
+class SearchMeetupsHandler(
+    RequestHandler[SearchMeetups, Iterable[MeetupReadModel]]
+):
+    def __init__(self, meetup_gateway: MeetupGateway) -> None:
+        self._meetup_gateway = meetup_gateway
+
+    async def handle(self, request: SearchMeetups) -> Iterable[MeetupReadModel]:
+        if not request.query.strip():
+            raise ApplicationError(
+                message="Search query must not be empty",
+                error_type=ErrorType.VALIDATION_ERROR
+            )
+
+        meetups = await self._meetup_gateway.search(
+            query=request.query,
+            pagination=request.pagination,
+        )
+
+        return meetups
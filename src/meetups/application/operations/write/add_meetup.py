@@ -11,6 +11,7 @@ from meetups.application.ports.context.identity_provider import IdentityProvider
 from meetups.application.ports.context.user_role import UserRole
 from meetups.application.ports.time_provider import TimeProvider
 from meetups.application.ports.id_generator import IdGenerator
+from meetups.domain.meetup.exceptions import InvalidMeetupError
 from meetups.domain.meetup.factory import MeetupFactory
 from meetups.domain.meetup.meetup_id import MeetupId
 from meetups.domain.meetup.repository import MeetupRepository
@@ -50,13 +51,19 @@ class AddMeetupHandler(RequestHandler[AddMeetup, MeetupId]):
                 error_type=ErrorType.PERMISSION_ERROR
             )
         
-        meetup = self._factory.create(
-            title=request.title,
-            desription=request.description,
-            location=request.location,
-            time=request.time,
-            creator_id=current_user_id,
-        )
+        try:
+            meetup = self._factory.create(
+                title=request.title,
+                description=request.description,
+                location=request.location,
+                time=request.time,
+                creator_id=current_user_id,
+            )
+        except InvalidMeetupError as error:
+            raise ApplicationError(
+                message=error.message,
+                error_type=ErrorType.VALIDATION_ERROR,
+            ) from error
 
         self._repository.add(meetup)
 
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from typing import Final
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.common.markers.command import Command
+from meetups.application.models.batch import BatchItemError, BatchResult
+from meetups.application.operations.write.add_meetup import AddMeetup
+from meetups.application.ports.context.identity_provider import (
+    IdentityProvider,
+)
+from meetups.application.ports.context.user_role import UserRole
+from meetups.domain.meetup.exceptions import InvalidMeetupError
+from meetups.domain.meetup.factory import MeetupFactory
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.repository import MeetupRepository
+
+MAX_MEETUPS_PER_BATCH: Final[int] = 1000
+
+
+@dataclass(frozen=True)
+class AddMeetups(Command[BatchResult[MeetupId]]):
+    meetups: list[AddMeetup]
+
+
+class AddMeetupsHandler(
+    RequestHandler[AddMeetups, BatchResult[MeetupId]]
+):
+    """Adds every valid meetup of the batch in one transaction.
+
+    Invalid items are reported by index and skipped; the rest are flushed
+    as one multi-row insert along with their outbox messages.
+    """
+
+    def __init__(
+        self,
+        repository: MeetupRepository,
+        identity_provider: IdentityProvider,
+        factory: MeetupFactory,
+    ) -> None:
+        self._repository = repository
+        self._identity_provider = identity_provider
+        self._factory = factory
+
+    async def handle(self, request: AddMeetups) -> BatchResult[MeetupId]:
+        if len(request.meetups) > MAX_MEETUPS_PER_BATCH:
+            raise ApplicationError(
+                message=(
+                    f"At most {MAX_MEETUPS_PER_BATCH} meetups can be added "
+                    "at once"
+                ),
+                error_type=ErrorType.VALIDATION_ERROR,
+            )
+
+        current_user_id = await self._identity_provider.current_user_id()
+        current_user_role = await self._identity_provider.current_user_role()
+
+        if current_user_role != UserRole.ADMIN:
+            raise ApplicationError(
+                message="Only admin can add meetups",
+                error_type=ErrorType.PERMISSION_ERROR,
+            )
+
+        result = BatchResult[MeetupId]()
+
+        for index, item in enumerate(request.meetups):
+            try:
+                meetup = self._factory.create(
+                    title=item.title,
+                    description=item.description,
+                    location=item.location,
+                    time=item.time,
+                    creator_id=current_user_id,
+                )
+            except InvalidMeetupError as error:
+                result.errors.append(BatchItemError(index, error.message))
+                continue
+
+            self._repository.add(meetup)
+            result.succeeded.append(meetup.entity_id)
+
+        return result
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Final
+
+from bazario.asyncio import RequestHandler
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.common.markers.command import Command
+from meetups.application.models.batch import BatchItemError, BatchResult
+from meetups.application.operations.write.edit_meetup_status import (
+    EditMeetupStatus,
+)
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.repository import MeetupRepository
+
+MAX_STATUS_CHANGES_PER_BATCH: Final[int] = 1000
+
+
+@dataclass(frozen=True)
+class EditMeetupsStatus(Command[BatchResult[MeetupId]]):
+    changes: list[EditMeetupStatus]
+
+
+class EditMeetupsStatusHandler(
+    RequestHandler[EditMeetupsStatus, BatchResult[MeetupId]]
+):
+    """Applies a batch of status changes in one transaction.
+
+    Meetups are loaded with a single chunked query and flushed as one
+    grouped update; unknown ids are reported by index and skipped.
+    """
+
+    def __init__(
+        self,
+        meetup_repository: MeetupRepository,
+        time_provider: TimeProvider,
+    ) -> None:
+        self._meetup_repository = meetup_repository
+        self._time_provider = time_provider
+
+    async def handle(
+        self, request: EditMeetupsStatus
+    ) -> BatchResult[MeetupId]:
+        if len(request.changes) > MAX_STATUS_CHANGES_PER_BATCH:
+            raise ApplicationError(
+                message=(
+                    f"At most {MAX_STATUS_CHANGES_PER_BATCH} statuses can "
+                    "be changed at once"
+                ),
+                error_type=ErrorType.VALIDATION_ERROR,
+            )
+
+        meetups = await self._meetup_repository.load_many(
+            change.meetup_id for change in request.changes
+        )
+        current_date = self._time_provider.provide_current()
+        result = BatchResult[MeetupId]()
+
+        for index, change in enumerate(request.changes):
+            meetup = meetups.get(change.meetup_id)
+
+            if meetup is None:
+                result.errors.append(
+                    BatchItemError(index, "Meetup not found")
+                )
+                continue
+
+            meetup.edit_meetup_status(
+                status=change.status, current_date=current_date
+            )
+            result.succeeded.append(change.meetup_id)
+
+        return result
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from meetups.domain.shared.entity import Entity
+
+
+class ChangeVersionGateway(ABC):
+    @abstractmethod
+    async def load_version(self, entity_type: type[Entity]) -> int: ...
@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
 
-from meetups.application.models.pagination import Pagination
+from meetups.application.models.meetup_filters import MeetupFilters
+from meetups.application.models.pagination import MeetupsCursor, Pagination
 from meetups.application.models.meetup import MeetupReadModel
+from meetups.domain.meetup.meetup_id import MeetupId
 
 
 class MeetupGateway(ABC):
+    @abstractmethod
+    async def load(self, meetup_id: MeetupId) -> MeetupReadModel | None: ...
+    @abstractmethod
+    async def load_by_ids(
+        self, meetup_ids: Sequence[MeetupId]
+    ) -> list[MeetupReadModel]: ...
     @abstractmethod
     async def load_many(
-        self, pagination: Pagination,
-    ) -> Iterable[MeetupReadModel]: ...
\ No newline at end of file
+        self,
+        pagination: Pagination,
+        cursor: MeetupsCursor | None = None,
+        filters: MeetupFilters | None = None,
+        include_archived: bool = False,
+    ) -> Iterable[MeetupReadModel]: ...
+    @abstractmethod
+    async def search(
+        self, query: str, pagination: Pagination
+    ) -> Iterable[MeetupReadModel]: ...
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[MeetupReadModel]: ...
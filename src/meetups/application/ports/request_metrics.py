@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class RequestMetrics(ABC):
+    @abstractmethod
+    def observe_request(
+        self, request_type: type, duration: float, failed: bool
+    ) -> None: ...
+    @abstractmethod
+    def observe_phase(
+        self, request_type: type, phase: str, duration: float
+    ) -> None: ...
@@ -6,26 +6,88 @@ from uvicorn import Server as UvicornServer
 from faststream.rabbit import RabbitBroker
 
 from meetups.bootstrap.config import DatabaseConfig, RabbitmqConfig
+from meetups.bootstrap.providers import (
+    ApiProvider,
+    CacheProvider,
+    CliProvider,
+    ConfigProvider,
+    DatabaseProvider,
+    DomainProvider,
+    MaintenanceProvider,
+    MediatorProvider,
+    MetricsProvider,
+    OutboxProvider,
+    PersistenceProvider,
+    TracingProvider,
+    WorkerProvider,
+)
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
 
 
 def bootstrap_cli_container(
     alembic_config: AlembicConfig,
     uvicorn_config: UvicornConfig,
     uvicorn_server: UvicornServer,
+    database_config: DatabaseConfig,
 ) -> Container:
-    return make_container()
+    return make_container(
+        CliProvider(),
+        context={
+            AlembicConfig: alembic_config,
+            UvicornConfig: uvicorn_config,
+            UvicornServer: uvicorn_server,
+            DatabaseConfig: database_config,
+        },
+    )
 
 
 def bootstrap_api_container(
     rabbitmq_config: RabbitmqConfig,
     database_config: DatabaseConfig,
+    outbox_signal: InProcessOutboxSignal,
 ) -> AsyncContainer:
-    return make_async_container()
+    return make_async_container(
+        ConfigProvider(),
+        DatabaseProvider(),
+        PersistenceProvider(),
+        CacheProvider(),
+        DomainProvider(),
+        OutboxProvider(),
+        MaintenanceProvider(),
+        MediatorProvider(),
+        MetricsProvider(),
+        TracingProvider(),
+        ApiProvider(),
+        context={
+            RabbitmqConfig: rabbitmq_config,
+            DatabaseConfig: database_config,
+            InProcessOutboxSignal: outbox_signal,
+        },
+    )
 
 
 def bootstrap_worker_container(
     rabbitmq_config: RabbitmqConfig,
     database_config: DatabaseConfig,
     faststream_rabbit_broker: RabbitBroker,
-) -> AsyncContainer: 
-    return make_async_container()
\ No newline at end of file
+) -> AsyncContainer:
+    return make_async_container(
+        ConfigProvider(),
+        DatabaseProvider(),
+        PersistenceProvider(),
+        CacheProvider(),
+        DomainProvider(),
+        OutboxProvider(),
+        MaintenanceProvider(),
+        MediatorProvider(),
+        MetricsProvider(),
+        TracingProvider(),
+        WorkerProvider(),
+        context={
+            RabbitmqConfig: rabbitmq_config,
+            DatabaseConfig: database_config,
+            RabbitBroker: faststream_rabbit_broker,
+        },
+    )
@@ -1,21 +1,67 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    suppress,
+)
 from typing import cast
 
+from dishka import AsyncContainer
 from dishka.integrations.fastapi import (
     setup_dishka as add_container_to_fastapi,
 )
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from faststream.rabbit import RabbitBroker
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.types import HTTPExceptionHandler
 
 from meetups.application.common.application_error import ApplicationError
-from meetups.bootstrap.config import get_database_config, get_rabbitmq_config
+from meetups.bootstrap.config import (
+    DatabaseConfig,
+    OutboxConfig,
+    ProfilingConfig,
+    TracingConfig,
+    get_database_config,
+    get_outbox_config,
+    get_profiling_config,
+    get_rabbitmq_config,
+    get_tracing_config,
+)
 from meetups.bootstrap.container import bootstrap_api_container
+from meetups.bootstrap.entrypoints.relay import (
+    bootstrap_relay,
+    check_long_running_relay,
+)
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.postgres_cache_invalidation import (
+    PostgresCacheInvalidationListener,
+)
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.adapters.postgres_outbox_signal import (
+    PostgresOutboxListener,
+)
 from meetups.presentation.api.exception_handlers import application_error_handler
+from meetups.presentation.api.read_your_writes import (
+    ReadYourWritesMiddleware,
+)
+from meetups.presentation.api.routers.debug import DEBUG_ROUTER
 from meetups.presentation.api.routers.meetups import MEETUPS_ROUTER
 from meetups.presentation.api.routers.healthcheck import HEALTHCHECK_ROUTER
+from meetups.presentation.api.routers.metrics import METRICS_ROUTER
+from meetups.presentation.api.tracing import TracingMiddleware
 
 
-def add_middlewares(application: FastAPI) -> None:
+def add_middlewares(
+    application: FastAPI,
+    database_config: DatabaseConfig,
+    tracing_config: TracingConfig,
+    container: AsyncContainer,
+) -> None:
     application.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -23,11 +69,24 @@ def add_middlewares(application: FastAPI) -> None:
         allow_headers=["*"],
         allow_credentials=True,
     )
+    if database_config.read_uri is not None:
+        application.add_middleware(
+            ReadYourWritesMiddleware,
+            lag_window=database_config.replica_lag_window,
+        )
+    # Added last, so it is outermost and its span covers the others.
+    if tracing_config.exporter != "none":
+        application.add_middleware(TracingMiddleware, container=container)
 
 
-def add_api_routers(application: FastAPI) -> None:
+def add_api_routers(
+    application: FastAPI, profiling_config: ProfilingConfig
+) -> None:
     application.include_router(HEALTHCHECK_ROUTER)
+    application.include_router(METRICS_ROUTER)
     application.include_router(MEETUPS_ROUTER)
+    if profiling_config.enabled:
+        application.include_router(DEBUG_ROUTER)
 
 
 def add_exception_handlers(application: FastAPI) -> None:
@@ -37,15 +96,106 @@ def add_exception_handlers(application: FastAPI) -> None:
     )
 
 
+@asynccontextmanager
+async def run_embedded_relay(
+    container: AsyncContainer,
+    outbox_signal: InProcessOutboxSignal,
+    outbox_config: OutboxConfig,
+) -> AsyncIterator[None]:
+    engine = await container.get(AsyncEngine)
+    broker = await container.get(RabbitBroker)
+
+    # On Postgres commits announce themselves with NOTIFY, which also
+    # covers writes made by other processes.
+    relay_signal = outbox_signal
+    if engine.dialect.name == "postgresql":
+        relay_signal = PostgresOutboxListener(engine)
+        await relay_signal.start()
+
+    await broker.start()
+    relay_task = asyncio.create_task(
+        bootstrap_relay(container, relay_signal, outbox_config).run()
+    )
+    try:
+        yield
+    finally:
+        relay_task.cancel()
+        # Lets the relay finish its rollback before the container closes.
+        with suppress(asyncio.CancelledError):
+            await relay_task
+        if isinstance(relay_signal, PostgresOutboxListener):
+            await relay_signal.stop()
+
+
+@asynccontextmanager
+async def listen_for_cache_invalidations(
+    container: AsyncContainer,
+) -> AsyncIterator[None]:
+    engine = await container.get(AsyncEngine)
+
+    # Elsewhere only this process's own writes evict its cache entries.
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    listener = PostgresCacheInvalidationListener(
+        engine, await container.get(CacheBackend)
+    )
+    await listener.start()
+    try:
+        yield
+    finally:
+        await listener.stop()
+
+
+def make_lifespan(
+    container: AsyncContainer,
+    outbox_signal: InProcessOutboxSignal,
+    outbox_config: OutboxConfig,
+) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    @asynccontextmanager
+    async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+        try:
+            async with AsyncExitStack() as stack:
+                await stack.enter_async_context(
+                    listen_for_cache_invalidations(container)
+                )
+                if outbox_config.embedded_relay:
+                    await stack.enter_async_context(
+                        run_embedded_relay(
+                            container, outbox_signal, outbox_config
+                        )
+                    )
+                yield
+        finally:
+            await container.close()
+
+    return lifespan
+
+
 def bootstrap_application() -> FastAPI:
-    application = FastAPI()
+    outbox_config = get_outbox_config()
+    database_config = get_database_config()
+    outbox_signal = InProcessOutboxSignal()
+    if outbox_config.embedded_relay:
+        check_long_running_relay(database_config)
+
     dishka_container = bootstrap_api_container(
         get_rabbitmq_config(),
-        get_database_config(),
+        database_config,
+        outbox_signal,
     )
 
-    add_middlewares(application)
-    add_api_routers(application)
+    # The embedded relay hears commits from this process instantly; the
+    # cron task still sweeps up anything it misses.
+    application = FastAPI(
+        lifespan=make_lifespan(dishka_container, outbox_signal, outbox_config)
+    )
+
+    add_middlewares(
+        application, database_config, get_tracing_config(), dishka_container
+    )
+    add_api_routers(application, get_profiling_config())
     add_exception_handlers(application)
     add_container_to_fastapi(dishka_container, application)
 
@@ -6,18 +6,33 @@ from taskiq import TaskiqEvents, TaskiqScheduler
 from taskiq.schedule_sources import LabelScheduleSource
 from taskiq_aio_pika import AioPikaBroker
 
-from meetups.bootstrap.config import get_database_config, get_rabbitmq_config
+from meetups.bootstrap.config import (
+    OutboxConfig,
+    get_database_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+)
 from meetups.bootstrap.container import bootstrap_worker_container
+from meetups.bootstrap.entrypoints.relay import check_relay_parallelism
 from meetups.infrastructure.outbox.process_outbox_cron_task import process_outbox
-from meetups.infrastructure.cron_tasks import remove_meetup_cron_task, edit_meetup_status_cron_task
+from meetups.infrastructure.cron_tasks import archive_meetups_cron_task, edit_meetup_status_cron_task
 
 
-def add_tasks_to_taskiq(broker: AioPikaBroker) -> None:
+def add_tasks_to_taskiq(
+    broker: AioPikaBroker, outbox_config: OutboxConfig
+) -> None:
+    # One kick per relay; SKIP LOCKED keeps concurrent relays on disjoint
+    # batches, so they can run on separate workers.
     broker.register_task(
-        process_outbox, "process_outbox", schedule=[{"cron": "*/3 * * * *"}]
+        process_outbox,
+        "process_outbox",
+        schedule=[
+            {"cron": "*/3 * * * *"}
+            for _ in range(outbox_config.relay_parallelism)
+        ],
     )
     broker.register_task(
-        remove_meetup_cron_task, "remove_meetup", schedule=[{"cron": "*/3 * * * *"}]
+        archive_meetups_cron_task, "archive_meetups", schedule=[{"cron": "*/3 * * * *"}]
     )
     broker.register_task(
         edit_meetup_status_cron_task, "edit_meetup_status", schedule=[{"cron": "*/3 * * * *"}]
@@ -47,7 +62,10 @@ def bootstrap_broker() -> AioPikaBroker:
         faststream_rabbitmq_broker,
     )
 
-    add_tasks_to_taskiq(taskiq_broker)
+    outbox_config = get_outbox_config()
+    check_relay_parallelism(outbox_config, database_config)
+
+    add_tasks_to_taskiq(taskiq_broker, outbox_config)
     add_event_handlers(taskiq_broker)
     add_container_to_taskiq(container, taskiq_broker)
 
@@ -2,8 +2,16 @@ from click import Context, group, pass_context
 from dishka.integrations.click import setup_dishka
 from uvicorn import Server as UvicornServer
 
-from meetups.bootstrap.config import get_alembic_config, get_uvicorn_config
+from meetups.bootstrap.config import (
+    get_alembic_config,
+    get_database_config,
+    get_uvicorn_config,
+)
 from meetups.bootstrap.container import bootstrap_cli_container
+from meetups.bootstrap.entrypoints.profiling import start_worker_profiling
+from meetups.bootstrap.entrypoints.relay import start_outbox_relay
+from meetups.bootstrap.entrypoints.scheduler import start_status_scheduler
+from meetups.presentation.cli.exporting import export_meetups
 from meetups.presentation.cli.migrations import (
     downgrade_migration,
     make_migrations,
@@ -20,7 +28,7 @@ def main(context: Context) -> None:
     uvicorn_config = get_uvicorn_config()
     uvicorn_server = UvicornServer(uvicorn_config)
     dishka_container = bootstrap_cli_container(
-        alembic_config, uvicorn_config, uvicorn_server
+        alembic_config, uvicorn_config, uvicorn_server, get_database_config()
     )
     setup_dishka(dishka_container, context, finalize_container=True)
 
@@ -29,4 +37,8 @@ main.command(start_uvicorn)
 main.command(make_migrations)
 main.command(upgrade_migration)
 main.command(downgrade_migration)
-main.command(show_current_migration)
\ No newline at end of file
+main.command(show_current_migration)
+main.command(name="export")(export_meetups)
+main.command(name="relay")(start_outbox_relay)
+main.command(name="scheduler")(start_status_scheduler)
+main.command(name="profile-worker")(start_worker_profiling)
@@ -0,0 +1,64 @@
+import asyncio
+import contextlib
+from typing import TextIO
+
+from click import ClickException, File, option
+from taskiq.api import run_receiver_task
+
+from meetups.bootstrap.config import ProfilingConfig, get_profiling_config
+from meetups.bootstrap.entrypoints.broker import bootstrap_broker
+from meetups.infrastructure.profiling.sampling_profiler import (
+    SamplingProfiler,
+)
+
+
+async def profile_worker(
+    profiling_config: ProfilingConfig, seconds: float, output: TextIO
+) -> None:
+    # Runs one more worker in this process, consuming live tasks from the
+    # same queue as the others, and samples it while it works.
+    taskiq_broker = bootstrap_broker()
+    taskiq_broker.is_worker_process = True
+    sampling_profiler = SamplingProfiler(
+        profiling_config.interval, profiling_config.max_seconds
+    )
+
+    await taskiq_broker.startup()
+    receiver_task = asyncio.create_task(run_receiver_task(taskiq_broker))
+    try:
+        profile = await sampling_profiler.profile(seconds)
+    finally:
+        receiver_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await receiver_task
+        await taskiq_broker.shutdown()
+
+    output.write(profile.to_collapsed())
+
+
+@option(
+    "-s",
+    "--seconds",
+    type=float,
+    default=30.0,
+    show_default=True,
+    help="How long to sample the worker",
+)
+@option(
+    "-o",
+    "--output",
+    type=File("w"),
+    default="-",
+    help="Where to write the collapsed stacks",
+)
+def start_worker_profiling(seconds: float, output: TextIO) -> None:
+    profiling_config = get_profiling_config()
+
+    if not profiling_config.enabled:
+        raise ClickException("Profiling is disabled; set PROFILING_ENABLED")
+    if not 0 < seconds <= profiling_config.max_seconds:
+        raise ClickException(
+            f"--seconds must be in (0, {profiling_config.max_seconds:g}]"
+        )
+
+    asyncio.run(profile_worker(profiling_config, seconds, output))
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Final
+
+from dishka import AsyncContainer
+from faststream.rabbit import RabbitBroker
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from meetups.bootstrap.config import (
+    DatabaseConfig,
+    OutboxConfig,
+    get_database_config,
+    get_outbox_config,
+    get_rabbitmq_config,
+)
+from meetups.bootstrap.container import bootstrap_worker_container
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.adapters.postgres_outbox_signal import (
+    PostgresOutboxListener,
+)
+from meetups.infrastructure.outbox.outbox_processor import OutboxProcessor
+from meetups.infrastructure.outbox.outbox_relay import OutboxRelay
+from meetups.infrastructure.outbox.outbox_signal import OutboxSignal
+
+# Backends whose SELECT ... FOR UPDATE SKIP LOCKED actually skips rows.
+# SQLAlchemy silently drops the clause elsewhere, SQLite included.
+SKIP_LOCKED_BACKENDS: Final[frozenset[str]] = frozenset(
+    {"mysql", "oracle", "postgresql"}
+)
+
+
+def check_relay_parallelism(
+    outbox_config: OutboxConfig, database_config: DatabaseConfig
+) -> None:
+    backend = make_url(database_config.uri).get_backend_name()
+
+    if (
+        outbox_config.relay_parallelism > 1
+        and backend not in SKIP_LOCKED_BACKENDS
+    ):
+        raise ValueError(
+            f"OUTBOX_RELAY_PARALLELISM={outbox_config.relay_parallelism} "
+            f"needs SKIP LOCKED, which {backend} does not support; "
+            "concurrent relays would publish the same messages"
+        )
+
+
+def check_long_running_relay(database_config: DatabaseConfig) -> None:
+    backend = make_url(database_config.uri).get_backend_name()
+
+    # The process_outbox cron task always drains the outbox as well.
+    if backend not in SKIP_LOCKED_BACKENDS:
+        raise ValueError(
+            f"A long-running outbox relay needs SKIP LOCKED, which {backend} "
+            "does not support; it would publish the same messages as the "
+            "process_outbox cron task"
+        )
+
+
+def bootstrap_relay(
+    container: AsyncContainer,
+    outbox_signal: OutboxSignal,
+    outbox_config: OutboxConfig,
+) -> OutboxRelay:
+    @asynccontextmanager
+    async def open_outbox_processor() -> AsyncIterator[OutboxProcessor]:
+        async with container() as request_container:
+            yield await request_container.get(OutboxProcessor)
+
+    return OutboxRelay(
+        open_outbox_processor,
+        outbox_signal,
+        outbox_config.relay_min_poll_delay,
+        outbox_config.relay_max_poll_delay,
+    )
+
+
+async def run_relay() -> None:
+    rabbitmq_config = get_rabbitmq_config()
+    database_config = get_database_config()
+    check_long_running_relay(database_config)
+
+    faststream_rabbitmq_broker = RabbitBroker(rabbitmq_config.uri)
+    container = bootstrap_worker_container(
+        rabbitmq_config,
+        database_config,
+        faststream_rabbitmq_broker,
+    )
+    engine = await container.get(AsyncEngine)
+
+    # Without LISTEN/NOTIFY nothing signals a standalone relay, so it runs
+    # on adaptive polling alone.
+    outbox_signal: InProcessOutboxSignal
+    if engine.dialect.name == "postgresql":
+        outbox_signal = PostgresOutboxListener(engine)
+        await outbox_signal.start()
+    else:
+        outbox_signal = InProcessOutboxSignal()
+
+    await faststream_rabbitmq_broker.start()
+    try:
+        await bootstrap_relay(
+            container, outbox_signal, get_outbox_config()
+        ).run()
+    finally:
+        if isinstance(outbox_signal, PostgresOutboxListener):
+            await outbox_signal.stop()
+        await faststream_rabbitmq_broker.close()
+        await container.close()
+
+
+def start_outbox_relay() -> None:
+    asyncio.run(run_relay())
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from dishka import AsyncContainer
+from faststream.rabbit import RabbitBroker
+
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.bootstrap.config import (
+    StatusTransitionConfig,
+    get_database_config,
+    get_rabbitmq_config,
+    get_status_transition_config,
+)
+from meetups.bootstrap.container import bootstrap_worker_container
+from meetups.infrastructure.meetup_status_scheduler import (
+    MeetupStatusScheduler,
+)
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
+
+
+async def bootstrap_scheduler(
+    container: AsyncContainer,
+    status_transition_config: StatusTransitionConfig,
+) -> MeetupStatusScheduler:
+    @asynccontextmanager
+    async def open_processor() -> AsyncIterator[
+        MeetupStatusTransitionProcessor
+    ]:
+        async with container() as request_container:
+            yield await request_container.get(MeetupStatusTransitionProcessor)
+
+    return MeetupStatusScheduler(
+        open_processor,
+        await container.get(TimeProvider),
+        status_transition_config.scheduler_max_sleep,
+    )
+
+
+async def run_scheduler() -> None:
+    rabbitmq_config = get_rabbitmq_config()
+    container = bootstrap_worker_container(
+        rabbitmq_config,
+        get_database_config(),
+        RabbitBroker(rabbitmq_config.uri),
+    )
+
+    try:
+        scheduler = await bootstrap_scheduler(
+            container, get_status_transition_config()
+        )
+        await scheduler.run()
+    finally:
+        await container.close()
+
+
+def start_status_scheduler() -> None:
+    asyncio.run(run_scheduler())
@@ -0,0 +1,820 @@
+from collections.abc import AsyncIterable, Iterable, Iterator
+from dataclasses import replace
+from datetime import timedelta
+from typing import TYPE_CHECKING, NewType
+
+from alembic.config import Config as AlembicConfig
+from bazario.asyncio import Dispatcher, Publisher, Registry, Sender
+from bazario.asyncio.resolvers.dishka import DishkaResolver
+from dishka import (
+    AnyOf,
+    AsyncContainer,
+    Provider,
+    Scope,
+    from_context,
+    provide,
+    provide_all,
+)
+from fastapi import Request
+from faststream.rabbit import RabbitBroker
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+from uvicorn import Config as UvicornConfig
+from uvicorn import Server as UvicornServer
+
+from meetups.application.common.behaviors.commition_behavior import (
+    CommitionBehavior,
+)
+from meetups.application.common.behaviors.event_id_generation_behavior import (
+    EventIdGenerationBehavior,
+)
+from meetups.application.common.behaviors.event_publishing_behavior import (
+    EventPublishingBehavior,
+)
+from meetups.application.common.behaviors.request_metrics_behavior import (
+    RequestMetricsBehavior,
+)
+from meetups.application.common.markers.command import Command
+from meetups.application.common.markers.query import Query
+from meetups.application.operations.read.export_meetups import (
+    ExportMeetups,
+    ExportMeetupsHandler,
+)
+from meetups.application.operations.read.get_meetup import (
+    GetMeetup,
+    GetMeetupHandler,
+)
+from meetups.application.operations.read.get_meetups import (
+    GetMeetups,
+    GetMeetupsHandler,
+)
+from meetups.application.operations.read.get_meetups_by_ids import (
+    GetMeetupsByIds,
+    GetMeetupsByIdsHandler,
+)
+from meetups.application.operations.read.get_meetups_version import (
+    GetMeetupsVersion,
+    GetMeetupsVersionHandler,
+)
+from meetups.application.operations.read.search_meetups import (
+    SearchMeetups,
+    SearchMeetupsHandler,
+)
+from meetups.application.operations.write.add_meetup import (
+    AddMeetup,
+    AddMeetupHandler,
+)
+from meetups.application.operations.write.add_meetups import (
+    AddMeetups,
+    AddMeetupsHandler,
+)
+from meetups.application.operations.write.edit_meetup_status import (
+    EditMeetupStatus,
+    EditMeetupStatusHandler,
+)
+from meetups.application.operations.write.edit_meetups_status import (
+    EditMeetupsStatus,
+    EditMeetupsStatusHandler,
+)
+from meetups.application.operations.write.remove_meetup import (
+    RemoveMeetup,
+    RemoveMeetupHandler,
+)
+from meetups.application.ports.change_version_gateway import (
+    ChangeVersionGateway,
+)
+from meetups.application.ports.committer import Committer
+from meetups.application.ports.context.identity_provider import (
+    IdentityProvider,
+)
+from meetups.application.ports.event_raiser import DomainEventsRaiser
+from meetups.application.ports.id_generator import IdGenerator
+from meetups.application.ports.meetup_gateway import MeetupGateway
+from meetups.application.ports.request_metrics import RequestMetrics
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.bootstrap.config import (
+    ArchiveConfig,
+    CacheConfig,
+    DatabaseConfig,
+    OutboxConfig,
+    ProfilingConfig,
+    RabbitmqConfig,
+    SqlInstrumentationConfig,
+    StatusTransitionConfig,
+    TracingConfig,
+    get_archive_config,
+    get_cache_config,
+    get_outbox_config,
+    get_profiling_config,
+    get_sql_instrumentation_config,
+    get_status_transition_config,
+    get_tracing_config,
+)
+from meetups.domain.meetup.factory import MeetupFactory
+from meetups.domain.meetup.repository import MeetupRepository
+from meetups.domain.shared.events import DomainEvent, DomainEventAdder
+from meetups.domain.shared.unit_of_work import UnitOfWork
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.cache_invalidation_behavior import (
+    CacheInvalidationBehavior,
+)
+from meetups.infrastructure.cache.cache_invalidation_handler import (
+    MeetupCacheInvalidationHandler,
+)
+from meetups.infrastructure.cache.cache_invalidation_notifier import (
+    CacheInvalidationNotifier,
+    ProcessLocalCacheInvalidationNotifier,
+)
+from meetups.infrastructure.cache.caching_meetup_gateway import (
+    CachingMeetupGateway,
+)
+from meetups.infrastructure.cache.change_version_snapshot import (
+    ChangeVersionSnapshot,
+)
+from meetups.infrastructure.cache.in_memory_cache_backend import (
+    InMemoryCacheBackend,
+)
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+from meetups.infrastructure.cache.postgres_cache_invalidation import (
+    PostgresCacheInvalidationNotifier,
+)
+from meetups.infrastructure.domain_events import DomainEvents
+from meetups.infrastructure.meetup_archive_processor import (
+    MeetupArchiveProcessor,
+)
+from meetups.infrastructure.meetup_factory import MeetupFactoryImpl
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
+from meetups.infrastructure.metrics.prometheus_request_metrics import (
+    PrometheusRequestMetrics,
+)
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.adapters.postgres_outbox_signal import (
+    PostgresOutboxNotifier,
+)
+from meetups.infrastructure.outbox.adapters.rabbitmq_outbox_publisher import (
+    RabbitmqOutboxPublisher,
+)
+from meetups.infrastructure.outbox.deferred_outbox_notifier import (
+    DeferredOutboxNotifier,
+)
+from meetups.infrastructure.outbox.outbox_buffer import OutboxBuffer
+from meetups.infrastructure.outbox.outbox_codec import (
+    MEETUP_EVENT_TYPES,
+    OutboxCodec,
+)
+from meetups.infrastructure.outbox.outbox_flushing_behavior import (
+    OutboxFlushingBehavior,
+)
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_notification_behavior import (
+    OutboxNotificationBehavior,
+)
+from meetups.infrastructure.outbox.outbox_processor import OutboxProcessor
+from meetups.infrastructure.outbox.outbox_publisher import OutboxPublisher
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+from meetups.infrastructure.outbox.outbox_storing_handler import (
+    OutboxStoringHandler,
+)
+from meetups.infrastructure.outbox.outbox_telemetry import OutboxTelemetry
+from meetups.infrastructure.persistence.adapters.sql_change_versions import (
+    SqlChangeVersions,
+)
+from meetups.infrastructure.persistence.adapters.sql_data_mappers_registry import (  # noqa: E501
+    SqlDataMappersRegistry,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_archiver import (
+    SqlMeetupArchiver,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_data_mapper import (
+    SqlMeetupDataMapper,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_gateway import (
+    SqlMeetupGateway,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_repository import (
+    SqlMeetupRepository,
+)
+from meetups.infrastructure.persistence.adapters.sql_meetup_status_transitioner import (  # noqa: E501
+    SqlMeetupStatusTransitioner,
+)
+from meetups.infrastructure.persistence.adapters.sql_outbox_gateway import (
+    SqlOutboxGateway,
+)
+from meetups.infrastructure.persistence.adapters.sql_transaction import (
+    SqlTransaction,
+)
+from meetups.infrastructure.persistence.adapters.unit_of_work import (
+    UnitOfWorkImpl,
+)
+from meetups.infrastructure.persistence.change_version_tracker import (
+    ChangeVersionTracker,
+)
+from meetups.infrastructure.persistence.data_mappers_registry import (
+    DataMappersRegistry,
+)
+from meetups.infrastructure.persistence.meetup_archiver import MeetupArchiver
+from meetups.infrastructure.persistence.meetup_status_transitioner import (
+    MeetupStatusTransitioner,
+)
+from meetups.infrastructure.persistence.read_your_writes_behavior import (
+    ReadYourWritesBehavior,
+)
+from meetups.infrastructure.persistence.read_your_writes_guard import (
+    ReadYourWritesGuard,
+)
+from meetups.infrastructure.persistence.sql_query_instrumentation import (
+    QUERY_STATS_OPTION,
+    QueryStats,
+    SqlQueryInstrumentation,
+)
+from meetups.infrastructure.persistence.transaction import Transaction
+from meetups.infrastructure.profiling.sampling_profiler import (
+    SamplingProfiler,
+)
+from meetups.infrastructure.tracing.adapters.file_span_exporter import (
+    FileSpanExporter,
+)
+from meetups.infrastructure.tracing.adapters.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from meetups.infrastructure.tracing.sql_tracing import SqlStatementTracing
+from meetups.infrastructure.tracing.tracer import Tracer
+from meetups.infrastructure.tracing.tracing_dispatcher import (
+    TracingDispatcher,
+)
+from meetups.infrastructure.utc_time_provider import UtcTimeProvider
+from meetups.infrastructure.uuid7_id_generator import UUID7IdGenerator
+from meetups.presentation.api.header_identity_provider import (
+    HeaderIdentityProvider,
+)
+from meetups.presentation.api.read_your_writes import (
+    bind_guard,
+    load_last_write_at,
+)
+
+if TYPE_CHECKING:
+    from meetups.infrastructure.tracing.span_exporter import SpanExporter
+
+# Replica-side engine and connection, used by the query side only. Both
+# fall back to the primary when no DATABASE_READ_URI is configured.
+ReadEngine = NewType("ReadEngine", AsyncEngine)
+ReadConnection = NewType("ReadConnection", AsyncConnection)
+
+
+def create_engine(database_config: DatabaseConfig) -> AsyncEngine:
+    url = make_url(database_config.uri)
+
+    # In-memory SQLite runs on a single shared connection (StaticPool),
+    # which takes no sizing options.
+    if url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return create_async_engine(url)
+
+    return create_async_engine(
+        url,
+        pool_size=database_config.pool_size,
+        max_overflow=database_config.max_overflow,
+        pool_pre_ping=database_config.pool_pre_ping,
+        pool_recycle=database_config.pool_recycle,
+    )
+
+
+def build_registry() -> Registry:
+    registry = Registry()
+
+    registry.add_request_handler(AddMeetup, AddMeetupHandler)
+    registry.add_request_handler(AddMeetups, AddMeetupsHandler)
+    registry.add_request_handler(EditMeetupStatus, EditMeetupStatusHandler)
+    registry.add_request_handler(EditMeetupsStatus, EditMeetupsStatusHandler)
+    registry.add_request_handler(RemoveMeetup, RemoveMeetupHandler)
+    registry.add_request_handler(GetMeetup, GetMeetupHandler)
+    registry.add_request_handler(GetMeetups, GetMeetupsHandler)
+    registry.add_request_handler(GetMeetupsByIds, GetMeetupsByIdsHandler)
+    registry.add_request_handler(SearchMeetups, SearchMeetupsHandler)
+    registry.add_request_handler(GetMeetupsVersion, GetMeetupsVersionHandler)
+    registry.add_request_handler(ExportMeetups, ExportMeetupsHandler)
+
+    registry.add_notification_handlers(
+        DomainEvent, OutboxStoringHandler, MeetupCacheInvalidationHandler
+    )
+
+    # Later behaviors wrap earlier ones: events are published and their
+    # outbox messages flushed inside the commit, and the post-commit
+    # behaviors run once it has succeeded.
+    registry.add_pipeline_behaviors(DomainEvent, EventIdGenerationBehavior)
+    registry.add_pipeline_behaviors(
+        Command,
+        EventPublishingBehavior,
+        OutboxFlushingBehavior,
+        CommitionBehavior,
+        ReadYourWritesBehavior,
+        OutboxNotificationBehavior,
+        CacheInvalidationBehavior,
+        # Outermost, so it times the whole pipeline including the commit.
+        RequestMetricsBehavior,
+    )
+    registry.add_pipeline_behaviors(Query, RequestMetricsBehavior)
+
+    return registry
+
+
+class ConfigProvider(Provider):
+    scope = Scope.APP
+
+    database_config = from_context(provides=DatabaseConfig)
+    rabbitmq_config = from_context(provides=RabbitmqConfig)
+
+    @provide
+    def cache_config(self) -> CacheConfig:
+        return get_cache_config()
+
+    @provide
+    def outbox_config(self) -> OutboxConfig:
+        return get_outbox_config()
+
+    @provide
+    def status_transition_config(self) -> StatusTransitionConfig:
+        return get_status_transition_config()
+
+    @provide
+    def archive_config(self) -> ArchiveConfig:
+        return get_archive_config()
+
+    @provide
+    def sql_instrumentation_config(self) -> SqlInstrumentationConfig:
+        return get_sql_instrumentation_config()
+
+    @provide
+    def tracing_config(self) -> TracingConfig:
+        return get_tracing_config()
+
+    @provide
+    def profiling_config(self) -> ProfilingConfig:
+        return get_profiling_config()
+
+
+class DatabaseProvider(Provider):
+    @provide(scope=Scope.APP)
+    def query_instrumentation(
+        self, config: SqlInstrumentationConfig
+    ) -> SqlQueryInstrumentation:
+        return SqlQueryInstrumentation(
+            config.slow_query_threshold, config.max_statement_repeats
+        )
+
+    @provide(scope=Scope.APP)
+    async def engine(
+        self,
+        database_config: DatabaseConfig,
+        query_instrumentation: SqlQueryInstrumentation,
+        tracer: Tracer,
+    ) -> AsyncIterable[AsyncEngine]:
+        engine = create_engine(database_config)
+        query_instrumentation.instrument(engine.sync_engine)
+        if tracer.enabled:
+            SqlStatementTracing(tracer).instrument(engine.sync_engine)
+        yield engine
+        await engine.dispose()
+
+    @provide(scope=Scope.REQUEST)
+    def query_stats(
+        self, query_instrumentation: SqlQueryInstrumentation
+    ) -> Iterable[QueryStats]:
+        query_stats = QueryStats()
+        yield query_stats
+        query_instrumentation.report(query_stats)
+
+    @provide(scope=Scope.REQUEST)
+    async def connection(
+        self, engine: AsyncEngine, query_stats: QueryStats
+    ) -> AsyncIterable[AsyncConnection]:
+        # Anything left uncommitted is rolled back when the scope closes.
+        async with engine.connect() as connection:
+            await connection.execution_options(
+                **{QUERY_STATS_OPTION: query_stats}
+            )
+            yield connection
+
+    @provide(scope=Scope.APP)
+    async def read_engine(
+        self,
+        database_config: DatabaseConfig,
+        engine: AsyncEngine,
+        query_instrumentation: SqlQueryInstrumentation,
+        tracer: Tracer,
+    ) -> AsyncIterable[ReadEngine]:
+        if database_config.read_uri is None:
+            yield ReadEngine(engine)
+            return
+
+        read_engine = create_engine(
+            replace(database_config, uri=database_config.read_uri)
+        )
+        query_instrumentation.instrument(read_engine.sync_engine)
+        if tracer.enabled:
+            SqlStatementTracing(tracer).instrument(read_engine.sync_engine)
+        yield ReadEngine(read_engine)
+        await read_engine.dispose()
+
+    @provide(scope=Scope.REQUEST)
+    async def read_connection(
+        self,
+        engine: AsyncEngine,
+        read_engine: ReadEngine,
+        guard: ReadYourWritesGuard,
+        query_stats: QueryStats,
+        container: AsyncContainer,
+    ) -> AsyncIterable[ReadConnection]:
+        # Without a replica, or while it may lag the caller's own write,
+        # reads share the primary connection instead of checking out one.
+        if read_engine is engine or guard.requires_primary():
+            yield ReadConnection(await container.get(AsyncConnection))
+            return
+
+        async with read_engine.connect() as connection:
+            await connection.execution_options(
+                **{QUERY_STATS_OPTION: query_stats}
+            )
+            yield ReadConnection(connection)
+
+    transaction = provide(
+        SqlTransaction, scope=Scope.REQUEST, provides=Transaction
+    )
+
+
+class PersistenceProvider(Provider):
+    scope = Scope.REQUEST
+
+    meetup_data_mapper = provide(SqlMeetupDataMapper)
+    # Holds the connection-bound mappers, so it cannot outlive the request.
+    data_mappers_registry = provide(
+        SqlDataMappersRegistry, provides=DataMappersRegistry
+    )
+    unit_of_work = provide(
+        UnitOfWorkImpl, provides=AnyOf[Committer, UnitOfWork]
+    )
+    change_version_tracker = provide(
+        SqlChangeVersions, provides=ChangeVersionTracker
+    )
+
+    @provide
+    def change_version_gateway(
+        self, read_connection: ReadConnection
+    ) -> ChangeVersionGateway:
+        # Read from the same side as the pages the version tags, and only
+        # once, so the ETag and the cache key of a request agree.
+        return ChangeVersionSnapshot(SqlChangeVersions(read_connection))
+
+    meetup_repository = provide(SqlMeetupRepository, provides=MeetupRepository)
+    outbox_gateway = provide(SqlOutboxGateway, provides=OutboxGateway)
+    status_transitioner = provide(
+        SqlMeetupStatusTransitioner, provides=MeetupStatusTransitioner
+    )
+    meetup_archiver = provide(SqlMeetupArchiver, provides=MeetupArchiver)
+
+
+class CacheProvider(Provider):
+    @provide(scope=Scope.APP)
+    def cache_backend(self, cache_config: CacheConfig) -> CacheBackend:
+        return InMemoryCacheBackend(
+            cache_config.max_entries, cache_config.ttl_seconds
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def meetup_gateway(
+        self,
+        read_connection: ReadConnection,
+        cache_backend: CacheBackend,
+        cache_config: CacheConfig,
+        guard: ReadYourWritesGuard,
+        change_version_gateway: ChangeVersionGateway,
+    ) -> MeetupGateway:
+        meetup_gateway = SqlMeetupGateway(read_connection)
+
+        # The cache may hold pages read from a lagging replica, which the
+        # guard's own reads must not see.
+        if not cache_config.enabled or guard.requires_primary():
+            return meetup_gateway
+
+        return CachingMeetupGateway(
+            meetup_gateway, cache_backend, change_version_gateway
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def cache_invalidation_notifier(
+        self, connection: AsyncConnection
+    ) -> CacheInvalidationNotifier:
+        # NOTIFY reaches the caches of every API process, like the outbox
+        # notifier reaches every relay.
+        if connection.dialect.name == "postgresql":
+            return PostgresCacheInvalidationNotifier(connection)
+
+        return ProcessLocalCacheInvalidationNotifier()
+
+    invalidator = provide(MeetupCacheInvalidator, scope=Scope.REQUEST)
+
+
+class DomainProvider(Provider):
+    time_provider = provide(
+        UtcTimeProvider, scope=Scope.APP, provides=TimeProvider
+    )
+    id_generator = provide(
+        UUID7IdGenerator, scope=Scope.APP, provides=IdGenerator
+    )
+    domain_events = provide(
+        DomainEvents,
+        scope=Scope.REQUEST,
+        provides=AnyOf[DomainEventAdder, DomainEventsRaiser],
+    )
+    meetup_factory = provide(
+        MeetupFactoryImpl, scope=Scope.REQUEST, provides=MeetupFactory
+    )
+
+
+class OutboxProvider(Provider):
+    @provide(scope=Scope.APP)
+    def outbox_codec(self) -> OutboxCodec:
+        return OutboxCodec(MEETUP_EVENT_TYPES)
+
+    outbox_publisher = provide(
+        RabbitmqOutboxPublisher, scope=Scope.APP, provides=OutboxPublisher
+    )
+
+    @provide(scope=Scope.APP)
+    def outbox_telemetry(
+        self, time_provider: TimeProvider, outbox_config: OutboxConfig
+    ) -> OutboxTelemetry:
+        return OutboxTelemetry(time_provider, outbox_config.max_lag_seconds)
+
+    outbox_buffer = provide(OutboxBuffer, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.REQUEST)
+    def deferred_outbox_notifier(
+        self, outbox_signal: InProcessOutboxSignal
+    ) -> DeferredOutboxNotifier:
+        return DeferredOutboxNotifier(outbox_signal)
+
+    @provide(scope=Scope.REQUEST)
+    def outbox_notifier(
+        self,
+        connection: AsyncConnection,
+        deferred_outbox_notifier: DeferredOutboxNotifier,
+    ) -> OutboxNotifier:
+        # NOTIFY reaches relays in every process and is only delivered on
+        # commit; elsewhere the in-process signal is flushed after commit.
+        if connection.dialect.name == "postgresql":
+            return PostgresOutboxNotifier(connection)
+
+        return deferred_outbox_notifier
+
+    @provide(scope=Scope.REQUEST)
+    def outbox_processor(
+        self,
+        transaction: Transaction,
+        outbox_gateway: OutboxGateway,
+        outbox_publisher: OutboxPublisher,
+        outbox_telemetry: OutboxTelemetry,
+        outbox_config: OutboxConfig,
+    ) -> OutboxProcessor:
+        return OutboxProcessor(
+            transaction,
+            outbox_gateway,
+            outbox_publisher,
+            outbox_telemetry,
+            outbox_config.batch_size,
+            outbox_config.max_batches_per_run,
+        )
+
+
+class MaintenanceProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def status_transition_processor(
+        self,
+        transaction: Transaction,
+        status_transitioner: MeetupStatusTransitioner,
+        outbox_gateway: OutboxGateway,
+        outbox_codec: OutboxCodec,
+        outbox_notifier: OutboxNotifier,
+        change_version_tracker: ChangeVersionTracker,
+        cache_invalidator: MeetupCacheInvalidator,
+        id_generator: IdGenerator,
+        time_provider: TimeProvider,
+        status_transition_config: StatusTransitionConfig,
+    ) -> MeetupStatusTransitionProcessor:
+        return MeetupStatusTransitionProcessor(
+            transaction,
+            status_transitioner,
+            outbox_gateway,
+            outbox_codec,
+            outbox_notifier,
+            change_version_tracker,
+            cache_invalidator,
+            id_generator,
+            time_provider,
+            status_transition_config.batch_size,
+        )
+
+    @provide
+    def archive_processor(
+        self,
+        transaction: Transaction,
+        meetup_archiver: MeetupArchiver,
+        outbox_gateway: OutboxGateway,
+        outbox_codec: OutboxCodec,
+        outbox_notifier: OutboxNotifier,
+        change_version_tracker: ChangeVersionTracker,
+        cache_invalidator: MeetupCacheInvalidator,
+        id_generator: IdGenerator,
+        time_provider: TimeProvider,
+        archive_config: ArchiveConfig,
+    ) -> MeetupArchiveProcessor:
+        return MeetupArchiveProcessor(
+            transaction,
+            meetup_archiver,
+            outbox_gateway,
+            outbox_codec,
+            outbox_notifier,
+            change_version_tracker,
+            cache_invalidator,
+            id_generator,
+            time_provider,
+            archive_config.batch_size,
+            archive_config.retention_days,
+        )
+
+
+class MediatorProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide(scope=Scope.APP)
+    def registry(self) -> Registry:
+        return build_registry()
+
+    @provide(provides=AnyOf[Sender, Publisher])
+    def dispatcher(
+        self, container: AsyncContainer, registry: Registry, tracer: Tracer
+    ) -> Dispatcher:
+        # Handlers are resolved from the request container, so they share
+        # its connection, unit of work and collected events.
+        if tracer.enabled:
+            return TracingDispatcher(
+                DishkaResolver(container), registry, tracer
+            )
+
+        return Dispatcher(DishkaResolver(container), registry)
+
+    request_handlers = provide_all(
+        EditMeetupStatusHandler,
+        EditMeetupsStatusHandler,
+        RemoveMeetupHandler,
+        GetMeetupHandler,
+        GetMeetupsHandler,
+        GetMeetupsByIdsHandler,
+        SearchMeetupsHandler,
+        GetMeetupsVersionHandler,
+        ExportMeetupsHandler,
+    )
+    notification_handlers = provide_all(
+        OutboxStoringHandler, MeetupCacheInvalidationHandler
+    )
+    pipeline_behaviors = provide_all(
+        EventIdGenerationBehavior,
+        EventPublishingBehavior,
+        OutboxFlushingBehavior,
+        CommitionBehavior,
+        ReadYourWritesBehavior,
+        OutboxNotificationBehavior,
+        CacheInvalidationBehavior,
+        RequestMetricsBehavior,
+    )
+
+
+class MetricsProvider(Provider):
+    @provide(
+        scope=Scope.APP,
+        provides=AnyOf[RequestMetrics, PrometheusRequestMetrics],
+    )
+    def request_metrics(self) -> PrometheusRequestMetrics:
+        return PrometheusRequestMetrics()
+
+
+class TracingProvider(Provider):
+    @provide(scope=Scope.APP)
+    def tracer(self, tracing_config: TracingConfig) -> Iterable[Tracer]:
+        exporter: SpanExporter | None
+        if tracing_config.exporter == "none":
+            exporter = None
+        elif tracing_config.exporter == "memory":
+            exporter = InMemorySpanExporter()
+        elif tracing_config.exporter == "file":
+            exporter = FileSpanExporter(tracing_config.file_path)
+        else:
+            raise ValueError(
+                f"Unknown tracing exporter: {tracing_config.exporter!r}"
+            )
+
+        yield Tracer(exporter)
+
+        if exporter is not None:
+            exporter.close()
+
+
+class ApiProvider(Provider):
+    request = from_context(provides=Request, scope=Scope.REQUEST)
+    outbox_signal = from_context(
+        provides=InProcessOutboxSignal, scope=Scope.APP
+    )
+    identity_provider = provide(
+        HeaderIdentityProvider,
+        scope=Scope.REQUEST,
+        provides=IdentityProvider,
+    )
+    # Need the caller identity, which only API requests carry.
+    add_meetup_handlers = provide_all(
+        AddMeetupHandler, AddMeetupsHandler, scope=Scope.REQUEST
+    )
+
+    @provide(scope=Scope.REQUEST)
+    def read_your_writes_guard(
+        self,
+        request: Request,
+        time_provider: TimeProvider,
+        database_config: DatabaseConfig,
+    ) -> ReadYourWritesGuard:
+        guard = ReadYourWritesGuard(
+            time_provider,
+            timedelta(seconds=database_config.replica_lag_window),
+            load_last_write_at(request),
+        )
+        bind_guard(request, guard)
+
+        return guard
+
+    @provide(scope=Scope.APP)
+    def sampling_profiler(
+        self, profiling_config: ProfilingConfig
+    ) -> SamplingProfiler:
+        return SamplingProfiler(
+            profiling_config.interval, profiling_config.max_seconds
+        )
+
+    @provide(scope=Scope.APP)
+    async def broker(
+        self, rabbitmq_config: RabbitmqConfig
+    ) -> AsyncIterable[RabbitBroker]:
+        # Only connected by the embedded relay; see the API lifespan.
+        broker = RabbitBroker(rabbitmq_config.uri)
+        yield broker
+        await broker.close()
+
+
+class WorkerProvider(Provider):
+    broker = from_context(provides=RabbitBroker, scope=Scope.APP)
+
+    @provide(scope=Scope.REQUEST)
+    def read_your_writes_guard(
+        self, time_provider: TimeProvider, database_config: DatabaseConfig
+    ) -> ReadYourWritesGuard:
+        return ReadYourWritesGuard(
+            time_provider,
+            timedelta(seconds=database_config.replica_lag_window),
+        )
+
+    @provide(scope=Scope.APP)
+    def outbox_signal(self) -> InProcessOutboxSignal:
+        # Nothing listens inside a worker; it only backs the deferred
+        # notifier where LISTEN/NOTIFY is unavailable.
+        return InProcessOutboxSignal()
+
+
+class CliProvider(Provider):
+    scope = Scope.APP
+
+    alembic_config = from_context(provides=AlembicConfig)
+    uvicorn_config = from_context(provides=UvicornConfig)
+    uvicorn_server = from_context(provides=UvicornServer)
+    database_config = from_context(provides=DatabaseConfig)
+
+    @provide
+    def engine(self, database_config: DatabaseConfig) -> Iterator[AsyncEngine]:
+        # Each command runs its own event loop, so no connection is pooled
+        # past it, and disposal needs no loop once the commands are done.
+        engine = create_async_engine(database_config.uri, poolclass=NullPool)
+        yield engine
+        engine.sync_engine.dispose()
@@ -27,3 +27,7 @@ class MeetupStatusChanged(DomainEvent):
 class MeetupDeleted(DomainEvent):
     meetup_id: MeetupId
 
+
+@dataclass(frozen=True)
+class MeetupArchived(DomainEvent):
+    meetup_id: MeetupId
@@ -0,0 +1,5 @@
+from meetups.domain.shared.exceptions import DomainError
+
+
+class InvalidMeetupError(DomainError):
+    """Raised when a new meetup breaks one of the meetup invariants."""
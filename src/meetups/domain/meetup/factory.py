@@ -1,17 +1,36 @@
 from abc import ABC, abstractmethod
 
-from meetups.domain.meetup.velue_objects import Location, TimeSlot
+from meetups.domain.meetup.exceptions import InvalidMeetupError
 from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.velue_objects import Location, TimeSlot
 from meetups.domain.shared.user_id import UserId
 
 
 class MeetupFactory(ABC):
-    @abstractmethod
     def create(
-        self, 
+        self,
+        title: str,
+        description: str,
+        location: Location,
+        time: TimeSlot,
+        creator_id: UserId
+    ) -> Meetup:
+        # Checked here rather than in Meetup or TimeSlot, which are also
+        # rebuilt from rows stored before these rules existed.
+        if not title.strip():
+            raise InvalidMeetupError("Title must not be blank")
+
+        if time.finish_date < time.start:
+            raise InvalidMeetupError("Meetup cannot finish before it starts")
+
+        return self._create(title, description, location, time, creator_id)
+
+    @abstractmethod
+    def _create(
+        self,
         title: str,
-        desription: str,
+        description: str,
         location: Location,
         time: TimeSlot,
         creator_id: UserId
-    ) -> Meetup: ...
\ No newline at end of file
+    ) -> Meetup: ...
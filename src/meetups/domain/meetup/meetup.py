@@ -38,13 +38,16 @@ class Meetup(Entity[MeetupId]):
     def edit_meetup_status(
         self, status: MeetupStatus, current_date: datetime
     ) -> None:
+        if status == self._status:
+            return
+
         self._status = status
         event = MeetupStatusChanged(
             meetup_id=self._entity_id,
             status=status,
             event_date=current_date
         )
-        self.mark_dirty()
+        self.mark_dirty("status")
         self.add_event(event)
     
     @property
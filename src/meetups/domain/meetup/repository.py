@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from meetups.domain.meetup.meetup_id import MeetupId
 from meetups.domain.meetup.meetup import Meetup
@@ -10,4 +11,8 @@ class MeetupRepository(ABC):
     @abstractmethod
     def delete(self, meetup: Meetup) -> None: ...
     @abstractmethod
-    async def load(self, meetup_id: MeetupId) -> Meetup | None: ...
\ No newline at end of file
+    async def load(self, meetup_id: MeetupId) -> Meetup | None: ...
+    @abstractmethod
+    async def load_many(
+        self, meetup_ids: Iterable[MeetupId]
+    ) -> dict[MeetupId, Meetup]: ...
@@ -16,6 +16,7 @@ class Entity[TEntityID: Hashable]:
         self._entity_id = entity_id
         self._event_adder = event_adder
         self._unit_of_work = unit_of_work
+        self._changed_fields: set[str] = set()
 
     def add_event(self, event: "DomainEvent") -> None:
         self._event_adder.add_event(event)
@@ -23,16 +24,24 @@ class Entity[TEntityID: Hashable]:
     def mark_new(self) -> None:
         self._unit_of_work.register_new(self)
 
-    def mark_dirty(self) -> None:
+    def mark_dirty(self, *fields: str) -> None:
+        self._changed_fields.update(fields)
         self._unit_of_work.register_dirty(self)
 
     def mark_deleted(self) -> None:
         self._unit_of_work.register_deleted(self)
 
+    def clear_changed_fields(self) -> None:
+        self._changed_fields.clear()
+
     @property
     def entity_id(self) -> TEntityID:
         return self._entity_id
 
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        return frozenset(self._changed_fields)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Entity):
             return NotImplemented
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    evictions: int = field(default=0)
+    invalidations: int = field(default=0)
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+    @abstractmethod
+    async def set(self, key: str, value: Any, tags: Iterable[str]) -> None: ...
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None: ...
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats: ...
@@ -0,0 +1,27 @@
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from meetups.application.common.markers.command import Command
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+
+
+class CacheInvalidationBehavior[C: Command, R](PipelineBehavior[C, R]):
+    """Applies deferred cache invalidations once the command has committed.
+
+    Must wrap ``CommitionBehavior``, so it runs after the commit.
+    """
+
+    def __init__(self, invalidator: MeetupCacheInvalidator) -> None:
+        self._invalidator = invalidator
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        try:
+            response = await handle_next(request)
+        except Exception:
+            self._invalidator.discard()
+            raise
+
+        await self._invalidator.flush()
+
+        return response
@@ -0,0 +1,36 @@
+from bazario.asyncio import NotificationHandler
+
+from meetups.domain.meetup.events import (
+    MeetupCreated,
+    MeetupDeleted,
+    MeetupStatusChanged,
+)
+from meetups.domain.shared.events import DomainEvent
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+from meetups.infrastructure.cache.meetup_cache_tags import (
+    OFFSET_PAGE_TAG,
+    SEARCH_TAG,
+    STATUS_FILTER_TAG,
+    TAIL_PAGE_TAG,
+    meetup_tag,
+)
+
+
+class MeetupCacheInvalidationHandler(NotificationHandler[DomainEvent]):
+    def __init__(self, invalidator: MeetupCacheInvalidator) -> None:
+        self._invalidator = invalidator
+
+    async def handle(self, notification: DomainEvent) -> None:
+        match notification:
+            case MeetupCreated():
+                await self._invalidator.defer(TAIL_PAGE_TAG, SEARCH_TAG)
+            case MeetupStatusChanged(meetup_id=meetup_id):
+                await self._invalidator.defer(
+                    meetup_tag(meetup_id), STATUS_FILTER_TAG
+                )
+            case MeetupDeleted(meetup_id=meetup_id):
+                await self._invalidator.defer(
+                    meetup_tag(meetup_id), OFFSET_PAGE_TAG
+                )
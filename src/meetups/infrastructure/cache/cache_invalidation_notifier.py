@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+
+class CacheInvalidationNotifier(ABC):
+    """Tells the caches of other processes which tags a write evicts."""
+
+    @abstractmethod
+    async def notify(self, tags: Iterable[str]) -> None: ...
+
+
+class ProcessLocalCacheInvalidationNotifier(CacheInvalidationNotifier):
+    """Used where the database offers no channel between processes.
+
+    Only the writer's own cache is invalidated, by
+    ``MeetupCacheInvalidator.flush``, so the cache is coherent only while a
+    single process serves and writes meetups.
+    """
+
+    async def notify(self, tags: Iterable[str]) -> None:
+        return None
@@ -0,0 +1,163 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
+
+from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.models.meetup_filters import MeetupFilters
+from meetups.application.models.pagination import MeetupsCursor, Pagination
+from meetups.application.ports.change_version_gateway import (
+    ChangeVersionGateway,
+)
+from meetups.application.ports.meetup_gateway import MeetupGateway
+from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.meetup_cache_tags import (
+    OFFSET_PAGE_TAG,
+    SEARCH_TAG,
+    STATUS_FILTER_TAG,
+    TAIL_PAGE_TAG,
+    meetup_tag,
+)
+
+
+class CachingMeetupGateway(MeetupGateway):
+    """Caches meetup reads, evicted by tag when meetups change.
+
+    Meetups are cached by id alone and evicted through their tag, which
+    reaches other processes by ``CacheInvalidationNotifier``. Lists and
+    search results also carry the meetups change version their ETag is
+    computed from, so a cached body never disagrees with its ETag; entries
+    left behind under an old version age out through the TTL.
+    """
+
+    def __init__(
+        self,
+        meetup_gateway: MeetupGateway,
+        cache_backend: CacheBackend,
+        change_version_gateway: ChangeVersionGateway,
+    ) -> None:
+        self._meetup_gateway = meetup_gateway
+        self._cache_backend = cache_backend
+        self._change_version_gateway = change_version_gateway
+
+    async def load(self, meetup_id: MeetupId) -> MeetupReadModel | None:
+        meetups = await self.load_by_ids([meetup_id])
+        return meetups[0] if meetups else None
+
+    async def load_by_ids(
+        self, meetup_ids: Sequence[MeetupId]
+    ) -> list[MeetupReadModel]:
+        requested_ids = list(dict.fromkeys(meetup_ids))
+        meetups: dict[MeetupId, MeetupReadModel] = {}
+        missing_ids: list[MeetupId] = []
+
+        for meetup_id in requested_ids:
+            cached_meetup = await self._cache_backend.get(
+                self._meetup_key(meetup_id)
+            )
+            if cached_meetup is None:
+                missing_ids.append(meetup_id)
+            else:
+                meetups[meetup_id] = cached_meetup
+
+        # Unknown ids are not cached: no event would ever evict the miss
+        # once a meetup with that id shows up.
+        if missing_ids:
+            for meetup in await self._meetup_gateway.load_by_ids(missing_ids):
+                meetups[meetup.meetup_id] = meetup
+                await self._cache_backend.set(
+                    self._meetup_key(meetup.meetup_id),
+                    meetup,
+                    (meetup_tag(meetup.meetup_id),),
+                )
+
+        return [
+            meetups[meetup_id]
+            for meetup_id in requested_ids
+            if meetup_id in meetups
+        ]
+
+    async def load_many(
+        self,
+        pagination: Pagination,
+        cursor: MeetupsCursor | None = None,
+        filters: MeetupFilters | None = None,
+        include_archived: bool = False,
+    ) -> Iterable[MeetupReadModel]:
+        key = repr(
+            (
+                "load_many",
+                await self._version(),
+                pagination,
+                cursor,
+                filters,
+                include_archived,
+            )
+        )
+        cached_meetups = await self._cache_backend.get(key)
+
+        if cached_meetups is not None:
+            return list(cached_meetups)
+
+        # Cached as a tuple, so no caller can change what later requests
+        # are served; each caller gets a list of its own.
+        meetups = tuple(
+            await self._meetup_gateway.load_many(
+                pagination=pagination,
+                cursor=cursor,
+                filters=filters,
+                include_archived=include_archived,
+            )
+        )
+        tags = self._tags(meetups, pagination)
+        if cursor is None and pagination.offset:
+            tags.add(OFFSET_PAGE_TAG)
+        if filters is not None and filters.status is not None:
+            tags.add(STATUS_FILTER_TAG)
+
+        await self._cache_backend.set(key, meetups, tags)
+
+        return list(meetups)
+
+    async def search(
+        self, query: str, pagination: Pagination
+    ) -> Iterable[MeetupReadModel]:
+        key = repr(("search", await self._version(), query, pagination))
+        cached_meetups = await self._cache_backend.get(key)
+
+        if cached_meetups is not None:
+            return list(cached_meetups)
+
+        meetups = tuple(
+            await self._meetup_gateway.search(
+                query=query,
+                pagination=pagination,
+            )
+        )
+        tags = self._tags(meetups, pagination)
+        tags.add(SEARCH_TAG)
+        if pagination.offset:
+            tags.add(OFFSET_PAGE_TAG)
+
+        await self._cache_backend.set(key, meetups, tags)
+
+        return list(meetups)
+
+    def stream_all(self) -> AsyncIterator[MeetupReadModel]:
+        return self._meetup_gateway.stream_all()
+
+    async def _version(self) -> int:
+        return await self._change_version_gateway.load_version(Meetup)
+
+    def _meetup_key(self, meetup_id: MeetupId) -> str:
+        return repr(("meetup", meetup_id))
+
+    def _tags(
+        self,
+        meetups: tuple[MeetupReadModel, ...],
+        pagination: Pagination,
+    ) -> set[str]:
+        tags = {meetup_tag(meetup.meetup_id) for meetup in meetups}
+        if len(meetups) < pagination.limit:
+            tags.add(TAIL_PAGE_TAG)
+
+        return tags
@@ -0,0 +1,28 @@
+from meetups.application.ports.change_version_gateway import (
+    ChangeVersionGateway,
+)
+from meetups.domain.shared.entity import Entity
+
+
+class ChangeVersionSnapshot(ChangeVersionGateway):
+    """Reads each entity version at most once per request.
+
+    The ETag of a response and the cache key of its body are then taken
+    from the same version, so a cached body is never served under a tag
+    newer than the version it was cached for.
+    """
+
+    def __init__(self, change_version_gateway: ChangeVersionGateway) -> None:
+        self._change_version_gateway = change_version_gateway
+        self._versions: dict[type[Entity], int] = {}
+
+    async def load_version(self, entity_type: type[Entity]) -> int:
+        version = self._versions.get(entity_type)
+
+        if version is None:
+            version = await self._change_version_gateway.load_version(
+                entity_type
+            )
+            self._versions[entity_type] = version
+
+        return version
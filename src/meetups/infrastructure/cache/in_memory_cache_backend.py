@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from meetups.infrastructure.cache.cache_backend import CacheBackend, CacheStats
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: Any
+    tags: frozenset[str]
+    expires_at: float
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local LRU cache with per-entry TTL and tag invalidation.
+
+    Entries are not shared between processes; invalidations reach the
+    other processes' backends through ``CacheInvalidationNotifier``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+
+        return entry.value
+
+    async def set(self, key: str, value: Any, tags: Iterable[str]) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+        entry = _CacheEntry(
+            value=value,
+            tags=frozenset(tags),
+            expires_at=self._clock() + self._ttl_seconds,
+        )
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._stats.evictions += 1
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()):
+                if key in self._entries:
+                    self._remove(key)
+                    self._stats.invalidations += 1
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is None:
+                continue
+
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
@@ -0,0 +1,37 @@
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.cache_invalidation_notifier import (
+    CacheInvalidationNotifier,
+)
+
+
+class MeetupCacheInvalidator:
+    """Collects invalidations raised during a request until it commits.
+
+    Invalidating before the commit would let a concurrent reader put the old
+    rows back into the cache, so tags are only applied by ``flush``. Other
+    processes are notified as tags are deferred, which must happen inside
+    the write's transaction.
+    """
+
+    def __init__(
+        self,
+        cache_backend: CacheBackend,
+        notifier: CacheInvalidationNotifier,
+    ) -> None:
+        self._cache_backend = cache_backend
+        self._notifier = notifier
+        self._pending_tags: set[str] = set()
+
+    async def defer(self, *tags: str) -> None:
+        self._pending_tags.update(tags)
+        await self._notifier.notify(tags)
+
+    async def flush(self) -> None:
+        tags = tuple(self._pending_tags)
+        self._pending_tags.clear()
+
+        if tags:
+            await self._cache_backend.invalidate(tags)
+
+    def discard(self) -> None:
+        self._pending_tags.clear()
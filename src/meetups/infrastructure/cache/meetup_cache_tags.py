@@ -0,0 +1,16 @@
+from typing import Final
+
+from meetups.domain.meetup.meetup_id import MeetupId
+
+# A new meetup sorts after every existing one, so it can only show up on
+# pages that were not full yet, and anywhere in rank-ordered search results.
+TAIL_PAGE_TAG: Final[str] = "meetups:tail"
+SEARCH_TAG: Final[str] = "meetups:search"
+# Removing a meetup shifts every OFFSET page that comes after it.
+OFFSET_PAGE_TAG: Final[str] = "meetups:offset"
+# A status change can move a meetup into any list filtered by status.
+STATUS_FILTER_TAG: Final[str] = "meetups:status-filter"
+
+
+def meetup_tag(meetup_id: MeetupId) -> str:
+    return f"meetup:{meetup_id.hex}"
@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import Iterable, Iterator
+from typing import Any, Final
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.cache_invalidation_notifier import (
+    CacheInvalidationNotifier,
+)
+
+CACHE_INVALIDATION_CHANNEL: Final[str] = "meetup_cache"
+# Postgres refuses NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES: Final[int] = 7999
+
+
+class PostgresCacheInvalidationNotifier(CacheInvalidationNotifier):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def notify(self, tags: Iterable[str]) -> None:
+        # NOTIFY is transactional: listeners evict only once the write is
+        # committed, and a rolled back write evicts nothing.
+        for payload in _payloads(tags):
+            await self._connection.execute(
+                select(func.pg_notify(CACHE_INVALIDATION_CHANNEL, payload))
+            )
+
+
+class PostgresCacheInvalidationListener:
+    """Evicts tags NOTIFYed by any process from this process's cache.
+
+    Notifications sent while the listening connection is down are lost;
+    the entries they would have evicted age out through the TTL.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, cache_backend: CacheBackend
+    ) -> None:
+        self._engine = engine
+        self._cache_backend = cache_backend
+        self._connection: AsyncConnection | None = None
+        self._invalidations: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        self._connection = await self._engine.connect()
+        driver_connection = await self._driver_connection(self._connection)
+        await driver_connection.add_listener(
+            CACHE_INVALIDATION_CHANNEL, self._on_notification
+        )
+
+    async def stop(self) -> None:
+        if self._connection is None:
+            return
+
+        driver_connection = await self._driver_connection(self._connection)
+        await driver_connection.remove_listener(
+            CACHE_INVALIDATION_CHANNEL, self._on_notification
+        )
+        await self._connection.close()
+        self._connection = None
+        await asyncio.gather(*self._invalidations)
+
+    @staticmethod
+    async def _driver_connection(connection: AsyncConnection) -> Any:
+        raw_connection = await connection.get_raw_connection()
+        if raw_connection.driver_connection is None:
+            raise RuntimeError(
+                "Cache invalidation listener connection is closed"
+            )
+        return raw_connection.driver_connection
+
+    def _on_notification(self, *args: Any) -> None:
+        payload: str = args[-1]
+        # Keeps a reference, so the task is not collected before it runs.
+        task = asyncio.create_task(
+            self._cache_backend.invalidate(payload.split())
+        )
+        self._invalidations.add(task)
+        task.add_done_callback(self._invalidations.discard)
+
+
+def _payloads(tags: Iterable[str]) -> Iterator[str]:
+    payload = ""
+
+    for tag in tags:
+        candidate = f"{payload} {tag}" if payload else tag
+        if payload and len(candidate.encode()) > MAX_PAYLOAD_BYTES:
+            yield payload
+            candidate = tag
+        payload = candidate
+
+    if payload:
+        yield payload
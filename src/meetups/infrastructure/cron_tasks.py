@@ -1,75 +1,22 @@
-from datetime import date
-
-from bazario.asyncio import Sender
 from dishka.integrations.taskiq import inject, FromDishka
 
-from meetups.application.operations.write.edit_meetup_status import EditMeetupStatus
-from meetups.application.operations.write.remove_meetup import RemoveMeetup
-from meetups.application.ports.meetup_gateway import MeetupGateway
-from meetups.application.models.pagination import Pagination
-from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.meetup_archive_processor import (
+    MeetupArchiveProcessor,
+)
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
 
 
 @inject
-async def remove_meetup_cron_task(
-    sender: FromDishka[Sender],
-    meetup_gateway: FromDishka[MeetupGateway],
+async def archive_meetups_cron_task(
+    archive_processor: FromDishka[MeetupArchiveProcessor],
 ) -> None:
-    meetups = await meetup_gateway.load_many(
-        pagination=Pagination()
-    )
-
-    for meetup in meetups:
-        if (
-            meetup.time.finish_date - date.today()
-        ):
-            await sender.send(
-                RemoveMeetup(
-                    meetup_id=meetup.meetup_id,
-                )
-            )
+    await archive_processor.process()
 
 
 @inject
 async def edit_meetup_status_cron_task(
-    sender: FromDishka[Sender],
-    meetup_gateway: FromDishka[MeetupGateway],
+    status_transition_processor: FromDishka[MeetupStatusTransitionProcessor],
 ) -> None:
-    meetups = await meetup_gateway.load_many(
-        pagination=Pagination()
-    )
-
-    for meetup in meetups:
-        if (
-            meetup.time.finish_date < date.today() and
-            meetup.time.start > date.today()
-        ):
-            await sender.send(
-                EditMeetupStatus(
-                    meetup_id=meetup.meetup_id,
-                    status=MeetupStatus.STARTED,
-                )
-            )
-
-        if (
-            meetup.time.start < date.today()
-        ):
-            await sender.send(
-                EditMeetupStatus(
-                    meetup_id=meetup.meetup_id,
-                    status=MeetupStatus.COMING,
-                )
-            )
-
-        if (
-            meetup.time.finish_date < date.today()
-        ):
-            await sender.send(
-                EditMeetupStatus(
-                    meetup_id=meetup.meetup_id,
-                    status=MeetupStatus.COMPLETED,
-                )
-            )
-
-
-    
\ No newline at end of file
+    await status_transition_processor.process()
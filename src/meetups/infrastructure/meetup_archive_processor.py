@@ -0,0 +1,121 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from meetups.application.ports.id_generator import IdGenerator
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.domain.meetup.events import MeetupArchived
+from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+from meetups.infrastructure.cache.meetup_cache_tags import (
+    OFFSET_PAGE_TAG,
+    meetup_tag,
+)
+from meetups.infrastructure.outbox.outbox_codec import OutboxCodec
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+from meetups.infrastructure.persistence.change_version_tracker import (
+    ChangeVersionTracker,
+)
+from meetups.infrastructure.persistence.meetup_archiver import MeetupArchiver
+from meetups.infrastructure.persistence.transaction import Transaction
+
+
+class MeetupArchiveProcessor:
+    """Moves finished meetups from the hot table to ``meetups_archive``.
+
+    A meetup is archived once ``retention_days`` have passed since it
+    finished. Every batch is copied, deleted and announced with
+    ``MeetupArchived`` outbox messages in one transaction, so the hot table
+    stays proportional to upcoming and recent meetups.
+    """
+
+    def __init__(
+        self,
+        transaction: Transaction,
+        meetup_archiver: MeetupArchiver,
+        outbox_gateway: OutboxGateway,
+        outbox_codec: OutboxCodec,
+        outbox_notifier: OutboxNotifier,
+        change_version_tracker: ChangeVersionTracker,
+        cache_invalidator: MeetupCacheInvalidator,
+        id_generator: IdGenerator,
+        time_provider: TimeProvider,
+        batch_size: int,
+        retention_days: int,
+    ) -> None:
+        self._transaction = transaction
+        self._meetup_archiver = meetup_archiver
+        self._outbox_gateway = outbox_gateway
+        self._outbox_codec = outbox_codec
+        self._outbox_notifier = outbox_notifier
+        self._change_version_tracker = change_version_tracker
+        self._cache_invalidator = cache_invalidator
+        self._id_generator = id_generator
+        self._time_provider = time_provider
+        self._batch_size = batch_size
+        self._retention_days = retention_days
+
+    async def process(self) -> int:
+        current_date = self._time_provider.provide_current()
+        archived = 0
+
+        while True:
+            batch_size = await self.process_batch(current_date)
+            archived += batch_size
+
+            if batch_size < self._batch_size:
+                break
+
+        return archived
+
+    async def process_batch(self, current_date: datetime) -> int:
+        finished_before = current_date.date() - timedelta(
+            days=self._retention_days
+        )
+
+        try:
+            meetup_ids = await self._meetup_archiver.archive(
+                finished_before, current_date, self._batch_size
+            )
+
+            if meetup_ids:
+                await self._outbox_gateway.insert_many(
+                    self._build_messages(meetup_ids, current_date)
+                )
+                await self._change_version_tracker.bump([Meetup])
+                # Archived rows leave every default listing, and the pages
+                # after them shift.
+                await self._cache_invalidator.defer(
+                    *(meetup_tag(meetup_id) for meetup_id in meetup_ids),
+                    OFFSET_PAGE_TAG,
+                )
+                # Notified inside the transaction, as NOTIFY is delivered
+                # on commit and would be lost after it.
+                await self._outbox_notifier.notify()
+
+            await self._transaction.commit()
+
+        except Exception:
+            self._cache_invalidator.discard()
+            await self._transaction.rollback()
+            raise
+
+        await self._cache_invalidator.flush()
+
+        return len(meetup_ids)
+
+    def _build_messages(
+        self, meetup_ids: Sequence[MeetupId], current_date: datetime
+    ) -> list[OutboxMessage]:
+        messages = []
+
+        for meetup_id in meetup_ids:
+            event = MeetupArchived(meetup_id=meetup_id, event_date=current_date)
+            event.set_event_id(self._id_generator.generate_event_id())
+            messages.append(self._outbox_codec.encode_message(event))
+
+        return messages
@@ -22,7 +22,7 @@ class MeetupFactoryImpl(MeetupFactory):
         self._event_adder = event_adder
         self._unit_of_work = unit_of_work
 
-    def create(
+    def _create(
         self, 
         title: str, 
         description: str, 
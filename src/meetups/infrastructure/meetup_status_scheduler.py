@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, date, datetime, time
+
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MeetupStatusScheduler:
+    """Long-running status scheduler.
+
+    Runs the due transitions and then sleeps until the earliest
+    ``next_transition_at``. The sleep is capped at ``max_sleep``, so meetups
+    created in the meantime with a start date of today are still picked up.
+    """
+
+    _MIN_SLEEP = 1.0
+
+    def __init__(
+        self,
+        processor_factory: Callable[
+            [], AbstractAsyncContextManager[MeetupStatusTransitionProcessor]
+        ],
+        time_provider: TimeProvider,
+        max_sleep: float,
+    ) -> None:
+        self._processor_factory = processor_factory
+        self._time_provider = time_provider
+        self._max_sleep = max_sleep
+
+    async def run(self) -> None:
+        while True:
+            # A timed wake-up rather than polling for a condition: nothing
+            # signals the scheduler when a transition falls due.
+            sleep_seconds = await self.run_once()
+            await asyncio.sleep(sleep_seconds)
+
+    async def run_once(self) -> float:
+        try:
+            async with self._processor_factory() as processor:
+                await processor.process()
+                next_transition_date = (
+                    await processor.load_next_transition_date()
+                )
+        except Exception:
+            logger.exception("Meetup status scheduler iteration failed")
+            return self._max_sleep
+
+        return self._seconds_until(next_transition_date)
+
+    def _seconds_until(self, next_transition_date: date | None) -> float:
+        if next_transition_date is None:
+            return self._max_sleep
+
+        due_at = datetime.combine(next_transition_date, time(), UTC)
+        current_date = self._time_provider.provide_current()
+        seconds = (due_at - current_date).total_seconds()
+
+        # Rows still due right after a run are locked by a concurrent run.
+        return min(max(seconds, self._MIN_SLEEP), self._max_sleep)
@@ -0,0 +1,136 @@
+from collections.abc import Sequence
+from datetime import date, datetime
+
+from meetups.application.ports.id_generator import IdGenerator
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.domain.meetup.events import MeetupStatusChanged
+from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.cache.meetup_cache_invalidator import (
+    MeetupCacheInvalidator,
+)
+from meetups.infrastructure.cache.meetup_cache_tags import (
+    OFFSET_PAGE_TAG,
+    STATUS_FILTER_TAG,
+    meetup_tag,
+)
+from meetups.infrastructure.outbox.outbox_codec import OutboxCodec
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+from meetups.infrastructure.persistence.change_version_tracker import (
+    ChangeVersionTracker,
+)
+from meetups.infrastructure.persistence.meetup_status_transitioner import (
+    MeetupStatusTransitioner,
+)
+from meetups.infrastructure.persistence.transaction import Transaction
+
+
+class MeetupStatusTransitionProcessor:
+    """Moves due meetups to their next status with set-based updates.
+
+    Every batch is one UPDATE plus a bulk insert of the matching
+    ``MeetupStatusChanged`` outbox messages, committed together, so memory
+    stays bounded by ``batch_size`` however many meetups are due.
+    """
+
+    # Completing first keeps a meetup that is already over from passing
+    # through STARTED on its way to COMPLETED.
+    _TRANSITIONS = (MeetupStatus.COMPLETED, MeetupStatus.STARTED)
+
+    def __init__(
+        self,
+        transaction: Transaction,
+        status_transitioner: MeetupStatusTransitioner,
+        outbox_gateway: OutboxGateway,
+        outbox_codec: OutboxCodec,
+        outbox_notifier: OutboxNotifier,
+        change_version_tracker: ChangeVersionTracker,
+        cache_invalidator: MeetupCacheInvalidator,
+        id_generator: IdGenerator,
+        time_provider: TimeProvider,
+        batch_size: int,
+    ) -> None:
+        self._transaction = transaction
+        self._status_transitioner = status_transitioner
+        self._outbox_gateway = outbox_gateway
+        self._outbox_codec = outbox_codec
+        self._outbox_notifier = outbox_notifier
+        self._change_version_tracker = change_version_tracker
+        self._cache_invalidator = cache_invalidator
+        self._id_generator = id_generator
+        self._time_provider = time_provider
+        self._batch_size = batch_size
+
+    async def process(self) -> int:
+        current_date = self._time_provider.provide_current()
+        transitioned = 0
+
+        for status in self._TRANSITIONS:
+            while True:
+                batch_size = await self.process_batch(status, current_date)
+                transitioned += batch_size
+
+                if batch_size < self._batch_size:
+                    break
+
+        return transitioned
+
+    async def load_next_transition_date(self) -> date | None:
+        return await self._status_transitioner.load_next_transition_date()
+
+    async def process_batch(
+        self, status: MeetupStatus, current_date: datetime
+    ) -> int:
+        try:
+            meetup_ids = await self._status_transitioner.transition(
+                status, current_date.date(), self._batch_size
+            )
+
+            if meetup_ids:
+                await self._outbox_gateway.insert_many(
+                    self._build_messages(meetup_ids, status, current_date)
+                )
+                await self._change_version_tracker.bump([Meetup])
+                # The UPDATE bypasses the command pipeline, so nothing else
+                # evicts the cached rows and status-filtered pages.
+                await self._cache_invalidator.defer(
+                    *(meetup_tag(meetup_id) for meetup_id in meetup_ids),
+                    STATUS_FILTER_TAG,
+                    OFFSET_PAGE_TAG,
+                )
+                # Must precede the commit: a transactional notifier would
+                # otherwise open a new transaction that is never committed.
+                await self._outbox_notifier.notify()
+
+            await self._transaction.commit()
+
+        except Exception:
+            self._cache_invalidator.discard()
+            await self._transaction.rollback()
+            raise
+
+        await self._cache_invalidator.flush()
+
+        return len(meetup_ids)
+
+    def _build_messages(
+        self,
+        meetup_ids: Sequence[MeetupId],
+        status: MeetupStatus,
+        current_date: datetime,
+    ) -> list[OutboxMessage]:
+        messages = []
+
+        for meetup_id in meetup_ids:
+            event = MeetupStatusChanged(
+                meetup_id=meetup_id,
+                status=status,
+                event_date=current_date,
+            )
+            event.set_event_id(self._id_generator.generate_event_id())
+            messages.append(self._outbox_codec.encode_message(event))
+
+        return messages
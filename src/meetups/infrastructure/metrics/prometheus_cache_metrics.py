@@ -0,0 +1,38 @@
+from meetups.infrastructure.cache.cache_backend import CacheStats
+from meetups.infrastructure.metrics.prometheus_text import (
+    render_header,
+    render_sample,
+)
+
+
+def render_cache_stats(stats: CacheStats) -> str:
+    lines = [
+        *render_header(
+            "meetups_cache_hits_total",
+            "Meetup cache lookups served from this process's cache.",
+            "counter",
+        ),
+        render_sample("meetups_cache_hits_total", stats.hits),
+        *render_header(
+            "meetups_cache_misses_total",
+            "Meetup cache lookups that fell through to the database.",
+            "counter",
+        ),
+        render_sample("meetups_cache_misses_total", stats.misses),
+        *render_header(
+            "meetups_cache_evictions_total",
+            "Meetup cache entries dropped to stay under the size limit.",
+            "counter",
+        ),
+        render_sample("meetups_cache_evictions_total", stats.evictions),
+        *render_header(
+            "meetups_cache_invalidations_total",
+            "Meetup cache entries dropped by tag after a write.",
+            "counter",
+        ),
+        render_sample(
+            "meetups_cache_invalidations_total", stats.invalidations
+        ),
+    ]
+
+    return "\n".join(lines) + "\n"
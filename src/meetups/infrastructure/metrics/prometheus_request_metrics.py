@@ -0,0 +1,99 @@
+from collections.abc import Sequence
+
+from meetups.application.ports.request_metrics import RequestMetrics
+from meetups.infrastructure.metrics.prometheus_text import (
+    DEFAULT_LATENCY_BUCKETS,
+    Histogram,
+    render_header,
+    render_histogram,
+    render_sample,
+)
+
+
+class PrometheusRequestMetrics(RequestMetrics):
+    """Process-local request metrics rendered in Prometheus text format.
+
+    Recording is a bisect and a few integer increments with no locking;
+    cumulative bucket counts are only computed when scraped.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._requests: dict[type, Histogram] = {}
+        self._errors: dict[type, int] = {}
+        self._phases: dict[tuple[type, str], Histogram] = {}
+
+    def observe_request(
+        self, request_type: type, duration: float, failed: bool
+    ) -> None:
+        histogram = self._requests.get(request_type)
+        if histogram is None:
+            histogram = self._requests[request_type] = Histogram(
+                self._buckets
+            )
+            self._errors[request_type] = 0
+
+        histogram.observe(duration)
+        if failed:
+            self._errors[request_type] += 1
+
+    def observe_phase(
+        self, request_type: type, phase: str, duration: float
+    ) -> None:
+        key = (request_type, phase)
+        histogram = self._phases.get(key)
+        if histogram is None:
+            histogram = self._phases[key] = Histogram(self._buckets)
+
+        histogram.observe(duration)
+
+    def render(self) -> str:
+        lines = render_header(
+            "meetups_request_duration_seconds",
+            "Time spent handling mediator requests.",
+            "histogram",
+        )
+        for request_type, histogram in self._requests.items():
+            lines.extend(
+                render_histogram(
+                    "meetups_request_duration_seconds",
+                    histogram,
+                    {"request": request_type.__name__},
+                )
+            )
+
+        lines.extend(
+            render_header(
+                "meetups_request_errors_total",
+                "Mediator requests that raised an exception.",
+                "counter",
+            )
+        )
+        for request_type, errors in self._errors.items():
+            lines.append(
+                render_sample(
+                    "meetups_request_errors_total",
+                    errors,
+                    {"request": request_type.__name__},
+                )
+            )
+
+        lines.extend(
+            render_header(
+                "meetups_request_phase_duration_seconds",
+                "Time spent in the commit and publish phases of commands.",
+                "histogram",
+            )
+        )
+        for (request_type, phase), histogram in self._phases.items():
+            lines.extend(
+                render_histogram(
+                    "meetups_request_phase_duration_seconds",
+                    histogram,
+                    {"request": request_type.__name__, "phase": phase},
+                )
+            )
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,75 @@
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from functools import cache
+from typing import Final
+
+DEFAULT_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogram:
+    __slots__ = ("bucket_counts", "buckets", "count", "total")
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # One extra slot counts observations above the last bound (+Inf).
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+def render_header(name: str, help_text: str, metric_type: str) -> list[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def render_sample(
+    name: str, value: float, labels: dict[str, str] | None = None
+) -> str:
+    if not labels:
+        return f"{name} {value!r}"
+
+    return f"{name}{{{_label_pairs(labels)}}} {value!r}"
+
+
+def render_histogram(
+    name: str, histogram: Histogram, labels: dict[str, str] | None = None
+) -> Iterator[str]:
+    # Buckets are stored per slot and only accumulated here, at scrape time.
+    pairs = _label_pairs(labels) + "," if labels else ""
+    cumulative_count = 0
+
+    for bound, bucket_count in zip(
+        _bounds(histogram.buckets), histogram.bucket_counts, strict=True
+    ):
+        cumulative_count += bucket_count
+        yield f'{name}_bucket{{{pairs}le="{bound}"}} {cumulative_count}'
+
+    suffix = f"{{{pairs[:-1]}}}" if labels else ""
+    yield f"{name}_sum{suffix} {histogram.total!r}"
+    yield f"{name}_count{suffix} {histogram.count}"
+
+
+@cache
+def _bounds(buckets: tuple[float, ...]) -> tuple[str, ...]:
+    return (*map(repr, buckets), "+Inf")
+
+
+def _label_pairs(labels: dict[str, str]) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
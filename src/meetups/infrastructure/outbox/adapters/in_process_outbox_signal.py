@@ -0,0 +1,24 @@
+import asyncio
+
+from meetups.infrastructure.outbox.outbox_signal import (
+    OutboxNotifier,
+    OutboxSignal,
+)
+
+
+class InProcessOutboxSignal(OutboxNotifier, OutboxSignal):
+    """Wakes a relay running in the same process as the writers.
+
+    Writers should reach it through ``DeferredOutboxNotifier``, so the relay
+    is only woken once their messages are committed.
+    """
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    async def notify(self) -> None:
+        self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+        self._event.clear()
@@ -0,0 +1,60 @@
+from typing import Any, Final
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from meetups.infrastructure.outbox.adapters.in_process_outbox_signal import (
+    InProcessOutboxSignal,
+)
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+
+OUTBOX_CHANNEL: Final[str] = "outbox"
+
+
+class PostgresOutboxNotifier(OutboxNotifier):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def notify(self) -> None:
+        # NOTIFY is transactional: listeners hear it only once the outbox
+        # rows are committed, and repeats within a transaction collapse.
+        await self._connection.execute(
+            select(func.pg_notify(OUTBOX_CHANNEL, ""))
+        )
+
+
+class PostgresOutboxListener(InProcessOutboxSignal):
+    """Wakes the relay on NOTIFY from any process writing to the outbox."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        InProcessOutboxSignal.__init__(self)
+        self._engine = engine
+        self._connection: AsyncConnection | None = None
+
+    async def start(self) -> None:
+        self._connection = await self._engine.connect()
+        driver_connection = await self._driver_connection(self._connection)
+        await driver_connection.add_listener(
+            OUTBOX_CHANNEL, self._on_notification
+        )
+
+    async def stop(self) -> None:
+        if self._connection is None:
+            return
+
+        driver_connection = await self._driver_connection(self._connection)
+        await driver_connection.remove_listener(
+            OUTBOX_CHANNEL, self._on_notification
+        )
+        await self._connection.close()
+        self._connection = None
+
+    @staticmethod
+    async def _driver_connection(connection: AsyncConnection) -> Any:
+        raw_connection = await connection.get_raw_connection()
+        if raw_connection.driver_connection is None:
+            raise RuntimeError("Outbox listener connection is closed")
+        return raw_connection.driver_connection
+
+    def _on_notification(self, *args: Any) -> None:
+        self._event.set()
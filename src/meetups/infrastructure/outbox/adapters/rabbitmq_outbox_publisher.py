@@ -2,11 +2,13 @@ from enum import StrEnum
 from typing import Final
 
 from aio_pika import DeliveryMode, Message
+from aio_pika.abc import HeadersType
 from faststream.rabbit import RabbitBroker
 
 from meetups.infrastructure.outbox.outbox_message import OutboxMessage
 from meetups.infrastructure.outbox.outbox_publisher import OutboxPublisher
-from meetups.infrastructure.outbox.outbox_serialization import to_json
+from meetups.infrastructure.tracing.span import SpanContext
+from meetups.infrastructure.tracing.tracer import Tracer
 
 
 class QueueName(StrEnum):
@@ -19,23 +21,57 @@ class ExchangeName(StrEnum):
 
 class RabbitmqOutboxPublisher(OutboxPublisher):
     _CONTENT_TYPE: Final[str] = "application/json"
+    _EVENT_TYPE_HEADER: Final[str] = "x-event-type"
+    _MESSAGE_ID_HEADER: Final[str] = "x-message-id"
+    _TRACEPARENT_HEADER: Final[str] = "traceparent"
 
-    def __init__(self, broker: RabbitBroker) -> None:
+    def __init__(self, broker: RabbitBroker, tracer: Tracer) -> None:
         self._broker = broker
+        self._tracer = tracer
 
     async def publish(self, message: OutboxMessage) -> None:
-        rabbit_message = self._build_rabbitmq_message(message)
-        await self._broker.publish(
-            rabbit_message,
-            queue=QueueName.MEETUPS,
-            exchange=ExchangeName.MEETUPS,
-            routing_key=message.event_type,
-        )
+        # The publish joins the trace of the request that stored the
+        # message rather than whatever relay run picked it up.
+        with self._tracer.span(
+            f"outbox.publish {message.event_type}",
+            {
+                "messaging.system": "rabbitmq",
+                "messaging.message_id": message.message_id.hex,
+            },
+            parent=SpanContext.from_traceparent(message.trace_context),
+        ) as span:
+            trace_context = (
+                message.trace_context
+                if span is None
+                else span.context.to_traceparent()
+            )
+            rabbit_message = self._build_rabbitmq_message(
+                message, trace_context
+            )
+            await self._broker.publish(
+                rabbit_message,
+                queue=QueueName.MEETUPS,
+                exchange=ExchangeName.MEETUPS,
+                routing_key=message.event_type,
+            )
+
+    def _build_rabbitmq_message(
+        self, message: OutboxMessage, trace_context: str | None
+    ) -> Message:
+        # The stored event is already encoded, so it goes out as the body
+        # as is; everything else about it travels in properties and headers.
+        headers: HeadersType = {
+            self._EVENT_TYPE_HEADER: message.event_type,
+            self._MESSAGE_ID_HEADER: message.message_id.hex,
+        }
+        if trace_context is not None:
+            headers[self._TRACEPARENT_HEADER] = trace_context
 
-    def _build_rabbitmq_message(self, message: OutboxMessage) -> Message:
         return Message(
-            body=to_json(message).encode(),
+            body=message.data,
             content_type=self._CONTENT_TYPE,
             message_id=message.message_id.hex,
+            type=message.event_type,
+            headers=headers,
             delivery_mode=DeliveryMode.PERSISTENT,
         )
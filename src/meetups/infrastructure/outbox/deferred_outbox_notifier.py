@@ -0,0 +1,24 @@
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+
+
+class DeferredOutboxNotifier(OutboxNotifier):
+    """Holds back outbox notifications until the request commits.
+
+    A relay woken before the commit would find the outbox empty and go back
+    to sleep, so the wrapped notifier is only called by ``flush``.
+    """
+
+    def __init__(self, outbox_notifier: OutboxNotifier) -> None:
+        self._outbox_notifier = outbox_notifier
+        self._pending = False
+
+    async def notify(self) -> None:
+        self._pending = True
+
+    async def flush(self) -> None:
+        if self._pending:
+            self._pending = False
+            await self._outbox_notifier.notify()
+
+    def discard(self) -> None:
+        self._pending = False
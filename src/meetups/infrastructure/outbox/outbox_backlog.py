@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class OutboxBacklog:
+    size: int
+    oldest_message_id: UUID | None
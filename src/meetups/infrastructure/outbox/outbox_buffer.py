@@ -0,0 +1,31 @@
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+from meetups.infrastructure.tracing.tracer import Tracer
+
+
+class OutboxBuffer:
+    """Collects a command's outbox messages for a single multi-row insert.
+
+    Events are stored one at a time as they are published, so without the
+    buffer a command raising N events would cost N round trips.
+    """
+
+    def __init__(self, outbox_gateway: OutboxGateway, tracer: Tracer) -> None:
+        self._outbox_gateway = outbox_gateway
+        self._tracer = tracer
+        self._messages: list[OutboxMessage] = []
+
+    def add(self, message: OutboxMessage) -> None:
+        self._messages.append(message)
+
+    async def flush(self) -> None:
+        messages = self._messages
+        self._messages = []
+
+        with self._tracer.span(
+            "outbox.insert", {"outbox.messages": len(messages)}
+        ):
+            await self._outbox_gateway.insert_many(messages)
+
+    def discard(self) -> None:
+        self._messages.clear()
@@ -0,0 +1,179 @@
+import dataclasses
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import partial
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Final,
+    NewType,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from uuid import UUID
+
+from meetups.domain.meetup.events import (
+    MeetupArchived,
+    MeetupCreated,
+    MeetupDeleted,
+    MeetupStatusChanged,
+)
+from meetups.domain.shared.events import DomainEvent
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+
+type FieldConverter = Callable[[Any], Any]
+
+MEETUP_EVENT_TYPES: Final[tuple[type[DomainEvent], ...]] = (
+    MeetupCreated,
+    MeetupStatusChanged,
+    MeetupDeleted,
+    MeetupArchived,
+)
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """The JSON library behind ``OutboxCodec``.
+
+    Anything with ``dumps``/``loads`` over plain dicts, lists and strings
+    fits, e.g. ``JsonBackend(orjson.dumps, orjson.loads)``.
+    """
+
+    dumps: Callable[[Any], str | bytes]
+    loads: Callable[[str | bytes], Any]
+
+
+STDLIB_JSON_BACKEND: Final = JsonBackend(
+    dumps=partial(json.dumps, separators=(",", ":")),
+    loads=json.loads,
+)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _optional(converter: FieldConverter) -> FieldConverter:
+    def convert(value: Any) -> Any:
+        return None if value is None else converter(value)
+
+    return convert
+
+
+class _DataclassSchema:
+    """Per-field converters for one dataclass, resolved once from its hints.
+
+    ``init=False`` fields, like ``DomainEvent.event_id``, are restored after
+    construction.
+    """
+
+    def __init__(self, cls: type[Any]) -> None:
+        self._cls = cls
+        hints = get_type_hints(cls)
+        self._fields = tuple(
+            (field.name, field.init, *_field_converters(hints[field.name]))
+            for field in dataclasses.fields(cls)
+        )
+
+    def encode(self, obj: Any) -> dict[str, Any]:
+        return {
+            name: encode(getattr(obj, name))
+            for name, _, encode, _ in self._fields
+        }
+
+    def decode(self, data: dict[str, Any]) -> Any:
+        obj = self._cls(
+            **{
+                name: decode(data[name])
+                for name, init, _, decode in self._fields
+                if init
+            }
+        )
+
+        for name, init, _, decode in self._fields:
+            if not init:
+                object.__setattr__(obj, name, decode(data[name]))
+
+        return obj
+
+
+def _field_converters(
+    field_type: Any,
+) -> tuple[FieldConverter, FieldConverter]:
+    while isinstance(field_type, NewType):
+        field_type = field_type.__supertype__
+
+    if get_origin(field_type) in (Union, UnionType):
+        args = tuple(arg for arg in get_args(field_type) if arg is not NoneType)
+        if len(args) != 1:
+            raise TypeError(f"Unsupported outbox field type: {field_type!r}")
+
+        encode, decode = _field_converters(args[0])
+        return _optional(encode), _optional(decode)
+
+    if field_type is UUID:
+        return str, UUID
+    if field_type is datetime:
+        return datetime.isoformat, datetime.fromisoformat
+    if field_type is date:
+        return date.isoformat, date.fromisoformat
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return (lambda member: member.value), field_type
+    if isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
+        schema = _DataclassSchema(field_type)
+        return schema.encode, schema.decode
+    if field_type in (str, int, float, bool):
+        return _identity, _identity
+
+    raise TypeError(f"Unsupported outbox field type: {field_type!r}")
+
+
+class OutboxCodec:
+    """Encodes domain events for the outbox and decodes them back.
+
+    Each event type gets a schema built from its dataclass fields, so values
+    are converted by declared type in one pass instead of being guessed from
+    their string form.
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[type[DomainEvent]],
+        json_backend: JsonBackend = STDLIB_JSON_BACKEND,
+    ) -> None:
+        self._json_backend = json_backend
+        self._schemas = {
+            event_type.__name__: _DataclassSchema(event_type)
+            for event_type in event_types
+        }
+
+    def encode(self, event: DomainEvent) -> bytes:
+        schema = self._schema(event.event_type)
+        data = self._json_backend.dumps(schema.encode(event))
+        return data.encode() if isinstance(data, str) else data
+
+    def encode_message(self, event: DomainEvent) -> OutboxMessage:
+        if event.event_id is None:
+            raise ValueError("Event identifier is not set")
+
+        return OutboxMessage(
+            data=self.encode(event),
+            message_id=event.event_id,
+            event_type=event.event_type,
+        )
+
+    def decode(self, event_type: str, data: str | bytes) -> DomainEvent:
+        schema = self._schema(event_type)
+        event: DomainEvent = schema.decode(self._json_backend.loads(data))
+        return event
+
+    def _schema(self, event_type: str) -> _DataclassSchema:
+        try:
+            return self._schemas[event_type]
+        except KeyError:
+            raise ValueError(f"Unknown event type: {event_type}") from None
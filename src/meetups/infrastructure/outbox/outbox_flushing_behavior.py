@@ -0,0 +1,27 @@
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from meetups.application.common.markers.command import Command
+from meetups.infrastructure.outbox.outbox_buffer import OutboxBuffer
+
+
+class OutboxFlushingBehavior[C: Command, R](PipelineBehavior[C, R]):
+    """Writes the buffered outbox messages in the command's transaction.
+
+    Must wrap ``EventPublishingBehavior`` and be wrapped by
+    ``CommitionBehavior``, so every event is buffered before the flush and
+    the flush lands before the commit.
+    """
+
+    def __init__(self, outbox_buffer: OutboxBuffer) -> None:
+        self._outbox_buffer = outbox_buffer
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        try:
+            response = await handle_next(request)
+        except Exception:
+            self._outbox_buffer.discard()
+            raise
+
+        await self._outbox_buffer.flush()
+
+        return response
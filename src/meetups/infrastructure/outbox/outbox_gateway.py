@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+from meetups.infrastructure.outbox.outbox_backlog import OutboxBacklog
 from meetups.infrastructure.outbox.outbox_message import OutboxMessage
 
 
@@ -7,6 +9,14 @@ class OutboxGateway(ABC):
     @abstractmethod
     async def select(self) -> list[OutboxMessage]: ...
     @abstractmethod
+    async def claim(self, limit: int) -> list[OutboxMessage]: ...
+    @abstractmethod
     async def insert(self, message: OutboxMessage) -> None: ...
     @abstractmethod
+    async def insert_many(self, messages: Sequence[OutboxMessage]) -> None: ...
+    @abstractmethod
     async def delete(self, message: OutboxMessage) -> None: ...
+    @abstractmethod
+    async def delete_many(self, messages: Sequence[OutboxMessage]) -> None: ...
+    @abstractmethod
+    async def backlog(self) -> OutboxBacklog: ...
@@ -4,6 +4,8 @@ from uuid import UUID
 
 @dataclass(frozen=True, kw_only=True)
 class OutboxMessage:
-    data: str | bytes
+    data: bytes
     event_type: str
     message_id: UUID
+    # W3C traceparent of the span that stored the message, if traced.
+    trace_context: str | None = None
@@ -0,0 +1,27 @@
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from meetups.application.common.markers.command import Command
+from meetups.infrastructure.outbox.deferred_outbox_notifier import (
+    DeferredOutboxNotifier,
+)
+
+
+class OutboxNotificationBehavior[C: Command, R](PipelineBehavior[C, R]):
+    """Wakes the outbox relay once the command has committed.
+
+    Must wrap ``CommitionBehavior``, so it runs after the commit.
+    """
+
+    def __init__(self, outbox_notifier: DeferredOutboxNotifier) -> None:
+        self._outbox_notifier = outbox_notifier
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        try:
+            response = await handle_next(request)
+        except Exception:
+            self._outbox_notifier.discard()
+            raise
+
+        await self._outbox_notifier.flush()
+
+        return response
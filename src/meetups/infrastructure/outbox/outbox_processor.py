@@ -1,24 +1,65 @@
+from time import perf_counter
+
 from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
 from meetups.infrastructure.outbox.outbox_publisher import OutboxPublisher
+from meetups.infrastructure.outbox.outbox_telemetry import OutboxTelemetry
 from meetups.infrastructure.persistence.transaction import Transaction
 
 
 class OutboxProcessor:
+    """Relays the outbox in bounded, individually committed batches.
+
+    Every batch is claimed, published, deleted and committed before the next
+    one is claimed, so a crash only republishes the batch in flight.
+    """
+
     def __init__(
         self,
         transaction: Transaction,
         outbox_gateway: OutboxGateway,
         outbox_publisher: OutboxPublisher,
+        outbox_telemetry: OutboxTelemetry,
+        batch_size: int,
+        max_batches_per_run: int,
     ) -> None:
         self._transaction = transaction
         self._outbox_gateway = outbox_gateway
         self._outbox_publisher = outbox_publisher
+        self._outbox_telemetry = outbox_telemetry
+        self._batch_size = batch_size
+        self._max_batches_per_run = max_batches_per_run
+
+    async def process(self) -> int:
+        published = 0
+
+        for _ in range(self._max_batches_per_run):
+            batch_size = await self.process_batch()
+            published += batch_size
+
+            if batch_size < self._batch_size:
+                break
+
+        return published
+
+    async def process_batch(self) -> int:
+        try:
+            messages = await self._outbox_gateway.claim(self._batch_size)
+
+            for message in messages:
+                started_at = perf_counter()
+                await self._outbox_publisher.publish(message)
+                self._outbox_telemetry.record_publish(
+                    message, perf_counter() - started_at
+                )
+
+            await self._outbox_gateway.delete_many(messages)
+            await self._transaction.commit()
 
-    async def process(self) -> None:
-        messages = await self._outbox_gateway.select()
+        except Exception:
+            self._outbox_telemetry.record_failure()
+            await self._transaction.rollback()
+            raise
 
-        for message in messages:
-            await self._outbox_publisher.publish(message)
-            await self._outbox_gateway.delete(message)
+        self._outbox_telemetry.record_batch(len(messages))
 
-        await self._transaction.commit()
+        return len(messages)
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from meetups.infrastructure.outbox.outbox_processor import OutboxProcessor
+from meetups.infrastructure.outbox.outbox_signal import OutboxSignal
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Long-running outbox dispatcher.
+
+    Drains the outbox whenever the signal fires. While the outbox stays
+    empty, it falls back to polling and doubles the poll delay up to
+    ``max_poll_delay``.
+    """
+
+    def __init__(
+        self,
+        processor_factory: Callable[
+            [], AbstractAsyncContextManager[OutboxProcessor]
+        ],
+        signal: OutboxSignal,
+        min_poll_delay: float,
+        max_poll_delay: float,
+    ) -> None:
+        self._processor_factory = processor_factory
+        self._signal = signal
+        self._min_poll_delay = min_poll_delay
+        self._max_poll_delay = max_poll_delay
+
+    async def run(self) -> None:
+        poll_delay = self._min_poll_delay
+
+        while True:
+            if await self.run_once():
+                poll_delay = self._min_poll_delay
+                continue
+
+            try:
+                async with asyncio.timeout(poll_delay):
+                    await self._signal.wait()
+            except TimeoutError:
+                poll_delay = min(poll_delay * 2, self._max_poll_delay)
+            else:
+                poll_delay = self._min_poll_delay
+
+    async def run_once(self) -> int:
+        try:
+            async with self._processor_factory() as outbox_processor:
+                return await outbox_processor.process()
+        except Exception:
+            logger.exception("Outbox relay iteration failed")
+            return 0
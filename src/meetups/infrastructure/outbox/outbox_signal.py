@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class OutboxNotifier(ABC):
+    @abstractmethod
+    async def notify(self) -> None: ...
+
+
+class OutboxSignal(ABC):
+    @abstractmethod
+    async def wait(self) -> None: ...
@@ -1,21 +1,37 @@
-from uuid import UUID
+from dataclasses import replace
 
 from bazario.asyncio import NotificationHandler
 
 from meetups.domain.shared.events import DomainEvent
-from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
-from meetups.infrastructure.outbox.outbox_message import OutboxMessage
-from meetups.infrastructure.outbox.outbox_serialization import to_json
+from meetups.infrastructure.outbox.outbox_codec import OutboxCodec
+from meetups.infrastructure.outbox.outbox_buffer import OutboxBuffer
+from meetups.infrastructure.outbox.outbox_signal import OutboxNotifier
+from meetups.infrastructure.tracing.tracer import Tracer
 
 
 class OutboxStoringHandler(NotificationHandler[DomainEvent]):
-    def __init__(self, outbox_gateway: OutboxGateway) -> None:
-        self._outbox_gateway = outbox_gateway
+    def __init__(
+        self,
+        outbox_buffer: OutboxBuffer,
+        outbox_notifier: OutboxNotifier,
+        outbox_codec: OutboxCodec,
+        tracer: Tracer,
+    ) -> None:
+        self._outbox_buffer = outbox_buffer
+        self._outbox_codec = outbox_codec
+        self._outbox_notifier = outbox_notifier
+        self._tracer = tracer
 
     async def handle(self, notification: DomainEvent) -> None:
-        message = OutboxMessage(
-            data=to_json(notification),
-            message_id=UUID(str(notification.event_id)),
-            event_type=notification.event_type,
-        )
-        await self._outbox_gateway.insert(message)
+        message = self._outbox_codec.encode_message(notification)
+
+        # Stored with the message, so the relay can continue this trace
+        # when it publishes, possibly from another process.
+        trace_context = self._tracer.current_context()
+        if trace_context is not None:
+            message = replace(
+                message, trace_context=trace_context.to_traceparent()
+            )
+
+        self._outbox_buffer.add(message)
+        await self._outbox_notifier.notify()
@@ -0,0 +1,173 @@
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Final
+from uuid import UUID
+
+from uuid_extensions import uuid_to_datetime  # type: ignore
+
+from meetups.application.ports.time_provider import TimeProvider
+from meetups.infrastructure.metrics.prometheus_text import (
+    Histogram,
+    render_header,
+    render_histogram,
+    render_sample,
+)
+from meetups.infrastructure.outbox.outbox_backlog import OutboxBacklog
+from meetups.infrastructure.outbox.outbox_message import OutboxMessage
+
+PUBLISH_RATE_WINDOW_SECONDS: Final[float] = 60.0
+DELIVERY_LAG_BUCKETS: Final[tuple[float, ...]] = (
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0,
+)
+
+
+@dataclass(frozen=True)
+class OutboxHealth:
+    backlog: int
+    oldest_message_age: float | None
+    published: int
+    publish_failures: int
+    publish_rate: float
+    lagging: bool
+
+
+class OutboxTelemetry:
+    """Relay throughput and lag for the outbox.
+
+    Publish counters, latencies and failures are recorded by the
+    OutboxProcessor running in this process. Backlog figures are read from
+    the outbox table when asked for, so they stay accurate while no relay
+    runs at all. Message age comes from the uuid7 timestamp in message_id.
+    """
+
+    def __init__(
+        self,
+        time_provider: TimeProvider,
+        max_lag: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._time_provider = time_provider
+        self._max_lag = max_lag
+        self._clock = clock
+        self._published = 0
+        self._publish_failures = 0
+        self._publish_duration = Histogram()
+        self._delivery_lag = Histogram(DELIVERY_LAG_BUCKETS)
+        self._recent_batches: deque[tuple[float, int]] = deque()
+
+    def record_publish(self, message: OutboxMessage, duration: float) -> None:
+        self._publish_duration.observe(duration)
+
+        message_age = self.message_age(message.message_id)
+        if message_age is not None:
+            self._delivery_lag.observe(message_age)
+
+    def record_batch(self, published: int) -> None:
+        if not published:
+            return
+
+        self._published += published
+
+        now = self._clock()
+        self._recent_batches.append((now, published))
+        self._forget_before(now - PUBLISH_RATE_WINDOW_SECONDS)
+
+    def record_failure(self) -> None:
+        self._publish_failures += 1
+
+    def message_age(self, message_id: UUID) -> float | None:
+        if message_id.version != 7:
+            return None
+
+        created_at: datetime = uuid_to_datetime(message_id)
+        age = self._time_provider.provide_current() - created_at
+
+        return max(age.total_seconds(), 0.0)
+
+    def health(self, backlog: OutboxBacklog) -> OutboxHealth:
+        oldest_message_age = (
+            None
+            if backlog.oldest_message_id is None
+            else self.message_age(backlog.oldest_message_id)
+        )
+
+        return OutboxHealth(
+            backlog=backlog.size,
+            oldest_message_age=oldest_message_age,
+            published=self._published,
+            publish_failures=self._publish_failures,
+            publish_rate=self._publish_rate(),
+            lagging=(
+                oldest_message_age is not None
+                and oldest_message_age > self._max_lag
+            ),
+        )
+
+    def render(self, backlog: OutboxBacklog) -> str:
+        health = self.health(backlog)
+        lines = [
+            *render_header(
+                "meetups_outbox_backlog_messages",
+                "Messages waiting in the outbox table.",
+                "gauge",
+            ),
+            render_sample("meetups_outbox_backlog_messages", health.backlog),
+            *render_header(
+                "meetups_outbox_oldest_message_age_seconds",
+                "Age of the oldest unpublished message, 0 when empty.",
+                "gauge",
+            ),
+            render_sample(
+                "meetups_outbox_oldest_message_age_seconds",
+                health.oldest_message_age or 0.0,
+            ),
+            *render_header(
+                "meetups_outbox_published_total",
+                "Messages published and deleted by this process.",
+                "counter",
+            ),
+            render_sample("meetups_outbox_published_total", health.published),
+            *render_header(
+                "meetups_outbox_publish_failures_total",
+                "Outbox batches rolled back after a failure.",
+                "counter",
+            ),
+            render_sample(
+                "meetups_outbox_publish_failures_total",
+                health.publish_failures,
+            ),
+            *render_header(
+                "meetups_outbox_publish_duration_seconds",
+                "Time spent publishing one message to the broker.",
+                "histogram",
+            ),
+            *render_histogram(
+                "meetups_outbox_publish_duration_seconds",
+                self._publish_duration,
+            ),
+            *render_header(
+                "meetups_outbox_delivery_lag_seconds",
+                "Time from storing a message to publishing it.",
+                "histogram",
+            ),
+            *render_histogram(
+                "meetups_outbox_delivery_lag_seconds", self._delivery_lag
+            ),
+        ]
+
+        return "\n".join(lines) + "\n"
+
+    def _publish_rate(self) -> float:
+        self._forget_before(self._clock() - PUBLISH_RATE_WINDOW_SECONDS)
+
+        return (
+            sum(published for _, published in self._recent_batches)
+            / PUBLISH_RATE_WINDOW_SECONDS
+        )
+
+    def _forget_before(self, moment: float) -> None:
+        while self._recent_batches and self._recent_batches[0][0] < moment:
+            self._recent_batches.popleft()
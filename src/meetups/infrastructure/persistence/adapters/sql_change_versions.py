@@ -0,0 +1,43 @@
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from meetups.application.ports.change_version_gateway import (
+    ChangeVersionGateway,
+)
+from meetups.domain.shared.entity import Entity
+from meetups.infrastructure.persistence.change_version_tracker import (
+    ChangeVersionTracker,
+)
+from meetups.infrastructure.persistence.sql_tables import CHANGE_VERSIONS_TABLE
+
+
+class SqlChangeVersions(ChangeVersionGateway, ChangeVersionTracker):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def load_version(self, entity_type: type[Entity]) -> int:
+        statement = select(CHANGE_VERSIONS_TABLE.c.version).where(
+            CHANGE_VERSIONS_TABLE.c.name == entity_type.__name__
+        )
+        version = await self._connection.scalar(statement)
+
+        return version or 0
+
+    async def bump(self, entity_types: Iterable[type[Entity]]) -> None:
+        # A stable order keeps concurrent commits from deadlocking on rows.
+        for entity_type in sorted(entity_types, key=lambda t: t.__name__):
+            statement = (
+                CHANGE_VERSIONS_TABLE.update()
+                .where(CHANGE_VERSIONS_TABLE.c.name == entity_type.__name__)
+                .values(version=CHANGE_VERSIONS_TABLE.c.version + 1)
+            )
+            cursor_result = await self._connection.execute(statement)
+
+            if cursor_result.rowcount == 0:
+                await self._connection.execute(
+                    CHANGE_VERSIONS_TABLE.insert().values(
+                        name=entity_type.__name__, version=1
+                    )
+                )
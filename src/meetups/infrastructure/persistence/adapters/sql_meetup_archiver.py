@@ -0,0 +1,62 @@
+from datetime import date, datetime
+
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.infrastructure.persistence.adapters.sql_meetup_search_index import (  # noqa: E501
+    SqlMeetupSearchIndex,
+)
+from meetups.infrastructure.persistence.meetup_archiver import MeetupArchiver
+from meetups.infrastructure.persistence.sql_tables import (
+    MEETUPS_ARCHIVE_TABLE,
+    MEETUPS_ARCHIVED_COLUMNS,
+    MEETUPS_TABLE,
+)
+
+
+class SqlMeetupArchiver(MeetupArchiver):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+        self._search_index = SqlMeetupSearchIndex(connection)
+
+    async def archive(
+        self, finished_before: date, archived_at: datetime, limit: int
+    ) -> list[MeetupId]:
+        # The batch is picked and locked first, so the copy and the delete
+        # below are guaranteed to act on the same rows.
+        due_meetup_ids = (
+            select(MEETUPS_TABLE.c.meetup_id)
+            .where(MEETUPS_TABLE.c.finish_date < finished_before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        cursor_result = await self._connection.execute(due_meetup_ids)
+        meetup_ids = [
+            MeetupId(meetup_id) for meetup_id in cursor_result.scalars()
+        ]
+
+        if not meetup_ids:
+            return meetup_ids
+
+        archived_rows = select(
+            *(MEETUPS_TABLE.c[name] for name in MEETUPS_ARCHIVED_COLUMNS),
+            literal(archived_at, MEETUPS_ARCHIVE_TABLE.c.archived_at.type),
+        ).where(MEETUPS_TABLE.c.meetup_id.in_(meetup_ids))
+        await self._connection.execute(
+            MEETUPS_ARCHIVE_TABLE.insert().from_select(
+                [
+                    *MEETUPS_ARCHIVED_COLUMNS,
+                    MEETUPS_ARCHIVE_TABLE.c.archived_at.name,
+                ],
+                archived_rows,
+            )
+        )
+        await self._connection.execute(
+            MEETUPS_TABLE.delete().where(
+                MEETUPS_TABLE.c.meetup_id.in_(meetup_ids)
+            )
+        )
+        await self._search_index.unindex(meetup_ids)
+
+        return meetup_ids
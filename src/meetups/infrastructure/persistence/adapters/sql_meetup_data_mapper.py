@@ -1,42 +1,145 @@
+from collections.abc import Iterator, Sequence
+from datetime import date, timedelta
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.persistence.adapters.sql_meetup_search_index import (
+    SqlMeetupSearchIndex,
+)
 from meetups.infrastructure.persistence.data_mapper import DataMapper
 from meetups.infrastructure.persistence.sql_tables import MEETUPS_TABLE
 
 
 class SqlMeetupDataMapper(DataMapper[Meetup]):
+    # Keeps IN lists well under the bind parameter limits of every dialect.
+    _MAX_IDS_PER_STATEMENT = 500
+    _UPDATABLE_FIELDS = frozenset({"status"})
+    _SEARCHABLE_FIELDS = frozenset({"title", "description"})
+
     def __init__(self, connection: AsyncConnection) -> None:
         self._connection = connection
+        self._search_index = SqlMeetupSearchIndex(connection)
 
     async def insert(self, entity: Meetup) -> None:
-        statement = MEETUPS_TABLE.insert().values(
-            meetup_id=entity.entity_id,
-            user_id=entity.creator_id,
-            title=entity.title,
-            description=entity.description,
-            address=entity.location.address,
-            city=entity.location.city,
-            country=entity.location.country,
-            start_date=entity.time.start,
-            finish_date=entity.time.finish_date,
-            status=entity.status.value,
-            posted_at=entity.posted_at,
-        )
-        await self._connection.execute(statement)
+        await self.insert_many((entity,))
 
     async def update(self, entity: Meetup) -> None:
-        statement = (
-            MEETUPS_TABLE.update()
-            .where(MEETUPS_TABLE.c.meetup_id == entity.entity_id)
-            .values(
-                status=entity.status.value,
+        await self.update_many((entity,))
+
+    async def delete(self, entity: Meetup) -> None:
+        await self.delete_many((entity,))
+
+    async def insert_many(self, entities: Sequence[Meetup]) -> None:
+        if not entities:
+            return
+
+        # A list of parameter sets lets the dialect use insertmanyvalues or
+        # executemany instead of one round trip per row.
+        await self._connection.execute(
+            MEETUPS_TABLE.insert(),
+            [
+                {
+                    "meetup_id": entity.entity_id,
+                    "user_id": entity.creator_id,
+                    "title": entity.title,
+                    "description": entity.description,
+                    "address": entity.location.address,
+                    "city": entity.location.city,
+                    "country": entity.location.country,
+                    "start_date": entity.time.start,
+                    "finish_date": entity.time.finish_date,
+                    "status": entity.status.value,
+                    "posted_at": entity.posted_at,
+                    "next_transition_at": self._next_transition_at(entity),
+                }
+                for entity in entities
+            ],
+        )
+        await self._search_index.index(entities)
+
+    async def update_many(self, entities: Sequence[Meetup]) -> None:
+        entities_by_fields: dict[tuple[str, ...], list[Meetup]] = {}
+        for entity in entities:
+            # No recorded fields means the caller did not say what changed.
+            changed = entity.changed_fields & self._UPDATABLE_FIELDS
+            key = tuple(sorted(changed or self._UPDATABLE_FIELDS))
+            entities_by_fields.setdefault(key, []).append(entity)
+
+        for fields, group in entities_by_fields.items():
+            statement = (
+                MEETUPS_TABLE.update()
+                .where(MEETUPS_TABLE.c.meetup_id == bindparam("b_meetup_id"))
+                .values(
+                    {
+                        column: bindparam(f"b_{column}")
+                        for column in self._columns(fields)
+                    }
+                )
             )
+            await self._connection.execute(
+                statement,
+                [self._update_parameters(entity, fields) for entity in group],
+            )
+
+        reindexed = [
+            entity
+            for entity in entities
+            if entity.changed_fields & self._SEARCHABLE_FIELDS
+        ]
+        await self._search_index.unindex(
+            [entity.entity_id for entity in reindexed]
         )
-        await self._connection.execute(statement)
+        await self._search_index.index(reindexed)
 
-    async def delete(self, entity: Meetup) -> None:
-        statement = MEETUPS_TABLE.delete().where(
-            MEETUPS_TABLE.c.meetup_id == entity.entity_id
+    async def delete_many(self, entities: Sequence[Meetup]) -> None:
+        for chunk in self._chunks(entities):
+            statement = MEETUPS_TABLE.delete().where(
+                MEETUPS_TABLE.c.meetup_id.in_(
+                    [entity.entity_id for entity in chunk]
+                )
+            )
+            await self._connection.execute(statement)
+
+        await self._search_index.unindex(
+            [entity.entity_id for entity in entities]
         )
-        await self._connection.execute(statement)
\ No newline at end of file
+
+    def _columns(self, fields: tuple[str, ...]) -> tuple[str, ...]:
+        # next_transition_at is derived from the status and must follow it.
+        if "status" in fields:
+            return (*fields, "next_transition_at")
+        return fields
+
+    def _update_parameters(
+        self, entity: Meetup, fields: tuple[str, ...]
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {
+            "status": entity.status.value,
+            "next_transition_at": self._next_transition_at(entity),
+        }
+        parameters = {
+            f"b_{column}": values[column] for column in self._columns(fields)
+        }
+        parameters["b_meetup_id"] = entity.entity_id
+
+        return parameters
+
+    @staticmethod
+    def _next_transition_at(entity: Meetup) -> date | None:
+        match entity.status:
+            case MeetupStatus.COMING:
+                return entity.time.start
+            case MeetupStatus.STARTED:
+                return entity.time.finish_date + timedelta(days=1)
+            case MeetupStatus.COMPLETED:
+                return None
+
+    def _chunks(
+        self, entities: Sequence[Meetup]
+    ) -> Iterator[tuple[Meetup, ...]]:
+        return batched(entities, self._MAX_IDS_PER_STATEMENT)
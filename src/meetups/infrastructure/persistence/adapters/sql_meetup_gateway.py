@@ -1,40 +1,245 @@
-from sqlalchemy import select, Row
+from itertools import batched
+
+from sqlalchemy import (
+    CompoundSelect,
+    FromClause,
+    Row,
+    Select,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncConnection
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
 
 from meetups.domain.meetup.meetup_id import MeetupId
 from meetups.domain.meetup.velue_objects import TimeSlot, Location
 from meetups.application.models.meetup import MeetupReadModel
-from meetups.application.models.pagination import Pagination
+from meetups.application.models.meetup_filters import MeetupFilters
+from meetups.application.models.pagination import MeetupsCursor, Pagination
 from meetups.application.ports.meetup_gateway import MeetupGateway
-from meetups.infrastructure.persistence.sql_tables import MEETUPS_TABLE
+from meetups.infrastructure.persistence.sql_tables import (
+    MEETUPS_ARCHIVE_TABLE,
+    MEETUPS_ARCHIVED_COLUMNS,
+    MEETUPS_SEARCH_TABLE,
+    MEETUPS_SEARCH_VECTOR,
+    MEETUPS_TABLE,
+)
 
 
 class SqlMeetupGateway(MeetupGateway):
+    _STREAM_BATCH_SIZE = 1000
+    _MAX_IDS_PER_STATEMENT = 500
+
     def __init__(self, connection: AsyncConnection) -> None:
         self._connection = connection
         self._identity_map: dict[MeetupId, MeetupReadModel] = {}
 
+    async def load(self, meetup_id: MeetupId) -> MeetupReadModel | None:
+        meetups = await self.load_by_ids([meetup_id])
+        return meetups[0] if meetups else None
+
+    async def load_by_ids(
+        self, meetup_ids: Sequence[MeetupId]
+    ) -> list[MeetupReadModel]:
+        requested_ids = list(dict.fromkeys(meetup_ids))
+        missing_ids = [
+            meetup_id
+            for meetup_id in requested_ids
+            if meetup_id not in self._identity_map
+        ]
+
+        for chunk in batched(missing_ids, self._MAX_IDS_PER_STATEMENT):
+            await self._fetch(self._select_by_ids(chunk))
+
+        return [
+            self._identity_map[meetup_id]
+            for meetup_id in requested_ids
+            if meetup_id in self._identity_map
+        ]
+
     async def load_many(
-        self, pagination: Pagination
+        self,
+        pagination: Pagination,
+        cursor: MeetupsCursor | None = None,
+        filters: MeetupFilters | None = None,
+        include_archived: bool = False,
     ) -> Iterable[MeetupReadModel]:
+        meetups = self._history() if include_archived else MEETUPS_TABLE
+
+        statement = self._select_meetups(meetups)
+        if filters is not None:
+            statement = self._filter(statement, filters, meetups)
+
+        statement = self._paginate(statement, pagination, cursor, meetups)
+
+        return await self._fetch(statement)
+
+    async def search(
+        self, query: str, pagination: Pagination
+    ) -> Iterable[MeetupReadModel]:
+        if self._connection.dialect.name == 'sqlite':
+            statement = self._search_fts5(query)
+        else:
+            statement = self._search_tsvector(query)
+
+        statement = statement.limit(pagination.limit).offset(
+            pagination.offset
+        )
+
+        return await self._fetch(statement)
+
+    async def stream_all(self) -> AsyncIterator[MeetupReadModel]:
+        # Rows are fetched lazily in batches from a server-side cursor and
+        # deliberately kept out of the identity map.
         statement = (
+            self._select_meetups(MEETUPS_TABLE)
+            .order_by(MEETUPS_TABLE.c.posted_at, MEETUPS_TABLE.c.meetup_id)
+            .execution_options(yield_per=self._STREAM_BATCH_SIZE)
+        )
+        stream_result = await self._connection.stream(statement)
+
+        try:
+            async for cursor_row in stream_result:
+                yield self._load(cursor_row)
+        finally:
+            await stream_result.close()
+
+    def _search_fts5(self, query: str) -> Select:
+        # Quote every term so user input is never parsed as FTS5 syntax.
+        terms = ' '.join(
+            '"{}"'.format(term.replace('"', '""')) for term in query.split()
+        )
+        matches = (
+            select(
+                MEETUPS_SEARCH_TABLE.c.meetup_id,
+                MEETUPS_SEARCH_TABLE.c.rank,
+            )
+            .where(
+                MEETUPS_SEARCH_TABLE.c.meetups_search.match(
+                    f'{{title description}}: ({terms})'
+                )
+            )
+            .subquery()
+        )
+        return (
+            self._select_meetups(MEETUPS_TABLE)
+            .join(matches, matches.c.meetup_id == MEETUPS_TABLE.c.meetup_id)
+            .order_by(matches.c.rank, MEETUPS_TABLE.c.meetup_id)
+        )
+
+    def _search_tsvector(self, query: str) -> Select:
+        ts_query = func.websearch_to_tsquery(
+            literal_column("'english'::regconfig"), query
+        )
+        return (
+            self._select_meetups(MEETUPS_TABLE)
+            .where(MEETUPS_SEARCH_VECTOR.op('@@')(ts_query))
+            .order_by(
+                func.ts_rank(MEETUPS_SEARCH_VECTOR, ts_query).desc(),
+                MEETUPS_TABLE.c.meetup_id,
+            )
+        )
+
+    def _history(self) -> FromClause:
+        # Both tiers carry the same columns and (posted_at, meetup_id)
+        # indexes, so filters and the keyset order push down into each
+        # branch of the UNION ALL.
+        return (
             select(
-                MEETUPS_TABLE.c.meetup_id.label('meetup_id'),
-                MEETUPS_TABLE.c.user_id.label('creator_id'),
-                MEETUPS_TABLE.c.title.label('status'),
-                MEETUPS_TABLE.c.description.label('description'),
-                MEETUPS_TABLE.c.address.label('address'),
-                MEETUPS_TABLE.c.city.label('city'),
-                MEETUPS_TABLE.c.country.label('country'),
-                MEETUPS_TABLE.c.start_date.label('start_date'),
-                MEETUPS_TABLE.c.finish_date.label('finish_date'),
-                MEETUPS_TABLE.c.status.label('status'),
-                MEETUPS_TABLE.c.posted_at.label('posted_at'),
+                *(MEETUPS_TABLE.c[name] for name in MEETUPS_ARCHIVED_COLUMNS)
             )
-            .limit(pagination.limit)
-            .offset(pagination.offset)
+            .union_all(
+                select(
+                    *(
+                        MEETUPS_ARCHIVE_TABLE.c[name]
+                        for name in MEETUPS_ARCHIVED_COLUMNS
+                    )
+                )
+            )
+            .subquery('meetups_history')
+        )
+
+    def _select_by_ids(self, meetup_ids: Sequence[MeetupId]) -> CompoundSelect:
+        # The id predicate is repeated in each branch rather than applied
+        # to _history(), so both tiers are probed by primary key.
+        return self._select_meetups(MEETUPS_TABLE).where(
+            MEETUPS_TABLE.c.meetup_id.in_(meetup_ids)
+        ).union_all(
+            self._select_meetups(MEETUPS_ARCHIVE_TABLE).where(
+                MEETUPS_ARCHIVE_TABLE.c.meetup_id.in_(meetup_ids)
+            )
+        )
+
+    def _select_meetups(self, meetups: FromClause) -> Select:
+        return select(
+            meetups.c.meetup_id.label('meetup_id'),
+            meetups.c.user_id.label('creator_id'),
+            meetups.c.title.label('title'),
+            meetups.c.description.label('description'),
+            meetups.c.address.label('address'),
+            meetups.c.city.label('city'),
+            meetups.c.country.label('country'),
+            meetups.c.start_date.label('start_date'),
+            meetups.c.finish_date.label('finish_date'),
+            meetups.c.status.label('status'),
+            meetups.c.posted_at.label('posted_at'),
         )
+
+    def _filter(
+        self, statement: Select, filters: MeetupFilters, meetups: FromClause
+    ) -> Select:
+        # Every equality filter leads a (column, posted_at, meetup_id) index,
+        # so filtered pages are still served in keyset order.
+        if filters.city is not None:
+            statement = statement.where(meetups.c.city == filters.city)
+        if filters.country is not None:
+            statement = statement.where(meetups.c.country == filters.country)
+        if filters.status is not None:
+            statement = statement.where(meetups.c.status == filters.status)
+        if filters.creator_id is not None:
+            statement = statement.where(
+                meetups.c.user_id == filters.creator_id
+            )
+        if filters.start_from is not None:
+            statement = statement.where(
+                meetups.c.start_date >= filters.start_from
+            )
+        if filters.finish_to is not None:
+            statement = statement.where(
+                meetups.c.finish_date <= filters.finish_to
+            )
+
+        return statement
+
+    def _paginate(
+        self,
+        statement: Select,
+        pagination: Pagination,
+        cursor: MeetupsCursor | None,
+        meetups: FromClause,
+    ) -> Select:
+        # uuid7 identifiers are time-ordered, so (posted_at, meetup_id) is a
+        # stable total order served by ix_meetups_posted_at_meetup_id.
+        sort_key = tuple_(meetups.c.posted_at, meetups.c.meetup_id)
+        statement = statement.order_by(
+            meetups.c.posted_at, meetups.c.meetup_id
+        ).limit(pagination.limit)
+
+        if cursor is None:
+            return statement.offset(pagination.offset)
+
+        cursor_key = tuple_(
+            literal(cursor.posted_at, MEETUPS_TABLE.c.posted_at.type),
+            literal(cursor.meetup_id, MEETUPS_TABLE.c.meetup_id.type),
+        )
+        return statement.where(sort_key > cursor_key)
+
+    async def _fetch(
+        self, statement: Select | CompoundSelect
+    ) -> list[MeetupReadModel]:
         cursor_result = await self._connection.execute(statement)
 
         meetups: list[MeetupReadModel] = []
@@ -43,10 +248,10 @@ class SqlMeetupGateway(MeetupGateway):
             self._identity_map[meetup.meetup_id] = meetup
 
         return meetups
-    
+
     def _load(self, cursor_row: Row) -> MeetupReadModel:
         meetup = MeetupReadModel(
-            meetup_id=MeetupId(cursor_row.entity_id),
+            meetup_id=MeetupId(cursor_row.meetup_id),
             creator_id=cursor_row.creator_id,
             title=cursor_row.title,
             description=cursor_row.description,
@@ -63,4 +268,4 @@ class SqlMeetupGateway(MeetupGateway):
             posted_at=cursor_row.posted_at,
         )
 
-        return meetup
\ No newline at end of file
+        return meetup
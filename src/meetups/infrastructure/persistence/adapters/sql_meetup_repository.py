@@ -1,8 +1,10 @@
-from sqlalchemy import Row, select
+from collections.abc import Iterable
+from itertools import batched
+
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from meetups.domain.meetup.velue_objects import Location, TimeSlot
-from meetups.domain.meetup.meetup_id import MeetupId
 from meetups.domain.meetup.meetup import Meetup
 from meetups.domain.meetup.meetup_id import MeetupId
 from meetups.domain.meetup.repository import MeetupRepository
@@ -12,6 +14,9 @@ from meetups.infrastructure.persistence.sql_tables import MEETUPS_TABLE
 
 
 class SqlMeetupRepository(MeetupRepository):
+    # Keeps IN lists well under the bind parameter limits of every dialect.
+    _MAX_IDS_PER_STATEMENT = 500
+
     def __init__(
         self, 
         connection: AsyncConnection,
@@ -35,10 +40,46 @@ class SqlMeetupRepository(MeetupRepository):
         if meetup_id in self._identity_map:
             return self._identity_map[meetup_id]
         
-        statement = select(
+        statement = self._select_meetups().where(
+            MEETUPS_TABLE.c.meetup_id == meetup_id
+        )
+        cursor_result = await self._connection.execute(statement)
+        cursor_row = cursor_result.first()
+
+        if  cursor_row is None:
+            return None
+        
+        return self._load(cursor_row)
+
+    async def load_many(
+        self, meetup_ids: Iterable[MeetupId]
+    ) -> dict[MeetupId, Meetup]:
+        meetups: dict[MeetupId, Meetup] = {}
+        missing_ids: list[MeetupId] = []
+
+        for meetup_id in dict.fromkeys(meetup_ids):
+            if meetup_id in self._identity_map:
+                meetups[meetup_id] = self._identity_map[meetup_id]
+            else:
+                missing_ids.append(meetup_id)
+
+        for chunk in batched(missing_ids, self._MAX_IDS_PER_STATEMENT):
+            statement = self._select_meetups().where(
+                MEETUPS_TABLE.c.meetup_id.in_(chunk)
+            )
+            cursor_result = await self._connection.execute(statement)
+
+            for cursor_row in cursor_result:
+                meetup = self._load(cursor_row)
+                meetups[meetup.entity_id] = meetup
+
+        return meetups
+
+    def _select_meetups(self) -> Select:
+        return select(
             MEETUPS_TABLE.c.meetup_id.label('entity_id'),
             MEETUPS_TABLE.c.user_id.label('creator_id'),
-            MEETUPS_TABLE.c.title.label('status'),
+            MEETUPS_TABLE.c.title.label('title'),
             MEETUPS_TABLE.c.description.label('description'),
             MEETUPS_TABLE.c.address.label('address'),
             MEETUPS_TABLE.c.city.label('city'),
@@ -47,14 +88,7 @@ class SqlMeetupRepository(MeetupRepository):
             MEETUPS_TABLE.c.finish_date.label('finish_date'),
             MEETUPS_TABLE.c.status.label('status'),
             MEETUPS_TABLE.c.posted_at.label('posted_at'),
-        ).where(MEETUPS_TABLE.c.meetup_id == meetup_id)
-        cursor_result = await self._connection.execute(statement)
-        cursor_row = cursor_result.first()
-
-        if  cursor_row is None:
-            return None
-        
-        return self._load(cursor_row)
+        )
         
     def _load(self, cursor_row: Row) -> Meetup:
         meetup = Meetup(
@@ -76,4 +110,8 @@ class SqlMeetupRepository(MeetupRepository):
             status=cursor_row.status,
             posted_at=cursor_row.posted_at,
         )
-        return meetup
\ No newline at end of file
+        # Later loads in the request must return this same instance, or
+        # changes made through one copy would be lost by another.
+        self._identity_map[meetup.entity_id] = meetup
+
+        return meetup
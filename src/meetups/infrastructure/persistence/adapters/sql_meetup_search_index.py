@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from itertools import batched
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from meetups.domain.meetup.meetup import Meetup
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.infrastructure.persistence.sql_tables import MEETUPS_SEARCH_TABLE
+
+
+class SqlMeetupSearchIndex:
+    """Keeps the SQLite FTS5 table in step with the meetups table.
+
+    Postgres maintains its GIN expression index on its own, so both methods
+    do nothing there.
+    """
+
+    # Keeps MATCH expressions well under the FTS5 query length limits.
+    _MAX_IDS_PER_STATEMENT = 500
+
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def index(self, meetups: Sequence[Meetup]) -> None:
+        if not self._enabled or not meetups:
+            return
+
+        await self._connection.execute(
+            MEETUPS_SEARCH_TABLE.insert(),
+            [
+                {
+                    "meetup_id": meetup.entity_id,
+                    "title": meetup.title,
+                    "description": meetup.description,
+                }
+                for meetup in meetups
+            ],
+        )
+
+    async def unindex(self, meetup_ids: Sequence[MeetupId]) -> None:
+        if not self._enabled:
+            return
+
+        for chunk in batched(meetup_ids, self._MAX_IDS_PER_STATEMENT):
+            matched_ids = " OR ".join(
+                f'"{meetup_id.hex}"' for meetup_id in chunk
+            )
+            statement = MEETUPS_SEARCH_TABLE.delete().where(
+                MEETUPS_SEARCH_TABLE.c.meetups_search.match(
+                    f"meetup_id: ({matched_ids})"
+                )
+            )
+            await self._connection.execute(statement)
+
+    @property
+    def _enabled(self) -> bool:
+        return self._connection.dialect.name == "sqlite"
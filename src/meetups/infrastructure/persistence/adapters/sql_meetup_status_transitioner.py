@@ -0,0 +1,76 @@
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, func, null, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.persistence.meetup_status_transitioner import (
+    MeetupStatusTransitioner,
+)
+from meetups.infrastructure.persistence.sql_functions import DayAfter
+from meetups.infrastructure.persistence.sql_tables import MEETUPS_TABLE
+
+# Both conditions are a range on the indexed next_transition_at plus a
+# filter on the due rows only. COMPLETED meetups have no next transition.
+# A STARTED meetup is due the day after it finishes, so a due row that has
+# not finished yet is a COMING one. That invariant stands in for a status
+# check, which would tempt the planner onto the status index.
+_DUE_CONDITIONS: dict[
+    MeetupStatus, Callable[[date], ColumnElement[bool]]
+] = {
+    MeetupStatus.COMPLETED: lambda today: and_(
+        MEETUPS_TABLE.c.next_transition_at <= today,
+        MEETUPS_TABLE.c.finish_date < today,
+    ),
+    MeetupStatus.STARTED: lambda today: and_(
+        MEETUPS_TABLE.c.next_transition_at <= today,
+        MEETUPS_TABLE.c.finish_date >= today,
+    ),
+}
+
+# Mirrors SqlMeetupDataMapper._next_transition_at for the new status.
+_NEXT_TRANSITION_AT: dict[MeetupStatus, ColumnElement[Any]] = {
+    MeetupStatus.COMPLETED: null(),
+    MeetupStatus.STARTED: DayAfter(MEETUPS_TABLE.c.finish_date),
+}
+
+
+class SqlMeetupStatusTransitioner(MeetupStatusTransitioner):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def transition(
+        self, status: MeetupStatus, today: date, limit: int
+    ) -> list[MeetupId]:
+        # Updated rows stop matching the condition, so every call picks up
+        # the next batch without an offset or cursor. SKIP LOCKED keeps a
+        # concurrent run from moving, and announcing, the same rows twice.
+        due_meetup_ids = (
+            select(MEETUPS_TABLE.c.meetup_id)
+            .where(_DUE_CONDITIONS[status](today))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            MEETUPS_TABLE.update()
+            .where(MEETUPS_TABLE.c.meetup_id.in_(due_meetup_ids))
+            .values(
+                status=status,
+                next_transition_at=_NEXT_TRANSITION_AT[status],
+            )
+            .returning(MEETUPS_TABLE.c.meetup_id)
+        )
+        cursor_result = await self._connection.execute(statement)
+
+        return [MeetupId(meetup_id) for meetup_id in cursor_result.scalars()]
+
+    async def load_next_transition_date(self) -> date | None:
+        statement = select(func.min(MEETUPS_TABLE.c.next_transition_at))
+        next_transition_date: date | None = await self._connection.scalar(
+            statement
+        )
+
+        return next_transition_date
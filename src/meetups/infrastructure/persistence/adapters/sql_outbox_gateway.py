@@ -1,20 +1,35 @@
-from sqlalchemy import CursorResult, select
+from collections.abc import Sequence
+from itertools import batched
+
+from sqlalchemy import CursorResult, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from meetups.infrastructure.outbox.outbox_backlog import OutboxBacklog
 from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
 from meetups.infrastructure.outbox.outbox_message import OutboxMessage
 from meetups.infrastructure.persistence.sql_tables import OUTBOX_TABLE
 
 
 class SqlOutboxGateway(OutboxGateway):
+    # Keeps IN lists well under the bind parameter limits of every dialect.
+    _MAX_IDS_PER_STATEMENT = 500
+
     def __init__(self, connection: AsyncConnection) -> None:
         self._connection = connection
 
     async def select(self) -> list[OutboxMessage]:
-        statement = select(
-            OUTBOX_TABLE.c.data.label("data"),
-            OUTBOX_TABLE.c.message_id.label("message_id"),
-            OUTBOX_TABLE.c.event_type.label("event_type"),
+        cursor_result = await self._connection.execute(self._select_messages())
+        return self._load(cursor_result)
+
+    async def claim(self, limit: int) -> list[OutboxMessage]:
+        # uuid7 message ids follow insertion order. SKIP LOCKED lets parallel
+        # relays claim disjoint batches; dialects without row locks (SQLite)
+        # render no locking clause at all.
+        statement = (
+            self._select_messages()
+            .order_by(OUTBOX_TABLE.c.message_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
         cursor_result = await self._connection.execute(statement)
         return self._load(cursor_result)
@@ -24,21 +39,74 @@ class SqlOutboxGateway(OutboxGateway):
             data=message.data,
             message_id=message.message_id,
             event_type=message.event_type,
+            trace_context=message.trace_context,
         )
         await self._connection.execute(statement)
 
+    async def insert_many(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        await self._connection.execute(
+            OUTBOX_TABLE.insert(),
+            [
+                {
+                    "data": message.data,
+                    "message_id": message.message_id,
+                    "event_type": message.event_type,
+                    "trace_context": message.trace_context,
+                }
+                for message in messages
+            ],
+        )
+
     async def delete(self, message: OutboxMessage) -> None:
         statement = OUTBOX_TABLE.delete().where(
             OUTBOX_TABLE.c.message_id == message.message_id
         )
         await self._connection.execute(statement)
 
+    async def delete_many(self, messages: Sequence[OutboxMessage]) -> None:
+        for chunk in batched(messages, self._MAX_IDS_PER_STATEMENT):
+            statement = OUTBOX_TABLE.delete().where(
+                OUTBOX_TABLE.c.message_id.in_(
+                    [message.message_id for message in chunk]
+                )
+            )
+            await self._connection.execute(statement)
+
+    async def backlog(self) -> OutboxBacklog:
+        # The oldest message is read through the primary key index rather
+        # than with min(), which PostgreSQL does not define for uuid.
+        oldest_message_id = (
+            select(OUTBOX_TABLE.c.message_id)
+            .order_by(OUTBOX_TABLE.c.message_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        statement = select(
+            select(func.count()).select_from(OUTBOX_TABLE).scalar_subquery(),
+            oldest_message_id,
+        )
+        size, oldest_id = (await self._connection.execute(statement)).one()
+
+        return OutboxBacklog(size=size, oldest_message_id=oldest_id)
+
+    def _select_messages(self) -> Select:
+        return select(
+            OUTBOX_TABLE.c.data.label("data"),
+            OUTBOX_TABLE.c.message_id.label("message_id"),
+            OUTBOX_TABLE.c.event_type.label("event_type"),
+            OUTBOX_TABLE.c.trace_context.label("trace_context"),
+        )
+
     def _load(self, cursor_result: CursorResult) -> list[OutboxMessage]:
         return [
             OutboxMessage(
                 data=cursor_row.data,
                 message_id=cursor_row.message_id,
                 event_type=cursor_row.event_type,
+                trace_context=cursor_row.trace_context,
             )
             for cursor_row in cursor_result
-        ]
\ No newline at end of file
+        ]
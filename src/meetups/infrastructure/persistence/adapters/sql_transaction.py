@@ -0,0 +1,14 @@
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from meetups.infrastructure.persistence.transaction import Transaction
+
+
+class SqlTransaction(Transaction):
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def commit(self) -> None:
+        await self._connection.commit()
+
+    async def rollback(self) -> None:
+        await self._connection.rollback()
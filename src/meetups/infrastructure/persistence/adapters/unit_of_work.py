@@ -1,10 +1,16 @@
+from collections.abc import Iterable
+
 from meetups.application.ports.committer import Committer
 from meetups.domain.shared.entity import Entity
 from meetups.domain.shared.unit_of_work import UnitOfWork
+from meetups.infrastructure.persistence.change_version_tracker import (
+    ChangeVersionTracker,
+)
 from meetups.infrastructure.persistence.data_mappers_registry import (
     DataMappersRegistry,
 )
 from meetups.infrastructure.persistence.transaction import Transaction
+from meetups.infrastructure.tracing.tracer import Tracer
 
 
 class UnitOfWorkImpl(Committer, UnitOfWork):
@@ -12,29 +18,52 @@ class UnitOfWorkImpl(Committer, UnitOfWork):
         self,
         transaction: Transaction,
         data_mappers_registry: DataMappersRegistry,
+        change_version_tracker: ChangeVersionTracker,
+        tracer: Tracer,
     ) -> None:
         self._transaction = transaction
         self._data_mappers_registry = data_mappers_registry
+        self._change_version_tracker = change_version_tracker
+        self._tracer = tracer
 
-        self._new_entities: list[Entity] = []
-        self._dirty_entities: list[Entity] = []
-        self._deleted_entities: list[Entity] = []
+        # Dicts act as insertion-ordered sets, so an entity registered more
+        # than once is still flushed a single time.
+        self._new_entities: dict[Entity, None] = {}
+        self._dirty_entities: dict[Entity, None] = {}
+        self._deleted_entities: dict[Entity, None] = {}
 
     def register_new(self, entity: Entity) -> None:
-        self._new_entities.append(entity)
+        self._new_entities[entity] = None
 
     def register_dirty(self, entity: Entity) -> None:
-        self._dirty_entities.append(entity)
+        if entity in self._new_entities or entity in self._deleted_entities:
+            return
+
+        self._dirty_entities[entity] = None
 
     def register_deleted(self, entity: Entity) -> None:
-        self._deleted_entities.append(entity)
+        self._dirty_entities.pop(entity, None)
+        self._deleted_entities[entity] = None
 
     async def commit(self) -> None:
+        with self._tracer.span(
+            "unit_of_work.commit",
+            {
+                "unit_of_work.new": len(self._new_entities),
+                "unit_of_work.dirty": len(self._dirty_entities),
+                "unit_of_work.deleted": len(self._deleted_entities),
+            },
+        ):
+            await self._commit()
+
+    async def _commit(self) -> None:
         try:
             await self._persist_new()
             await self._persist_dirty()
             await self._persist_deleted()
+            await self._bump_change_versions()
             await self._transaction.commit()
+            self._clear_changed_fields()
 
         except Exception:
             await self._transaction.rollback()
@@ -48,26 +77,51 @@ class UnitOfWorkImpl(Committer, UnitOfWork):
         self._dirty_entities.clear()
         self._deleted_entities.clear()
 
-    async def _persist_new(self) -> None:
-        for entity in self._new_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
+    def _clear_changed_fields(self) -> None:
+        for entity in (*self._new_entities, *self._dirty_entities):
+            entity.clear_changed_fields()
+
+    async def _bump_change_versions(self) -> None:
+        changed_types = {
+            type(entity)
+            for entity in (
+                *self._new_entities,
+                *self._dirty_entities,
+                *self._deleted_entities,
             )
+        }
+
+        if changed_types:
+            await self._change_version_tracker.bump(changed_types)
+
+    async def _persist_new(self) -> None:
+        for entity_type, entities in self._group_by_type(self._new_entities):
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
 
-            await data_mapper.insert(entity)
+            await data_mapper.insert_many(entities)
 
     async def _persist_dirty(self) -> None:
-        for entity in self._dirty_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
-            )
+        for entity_type, entities in self._group_by_type(
+            self._dirty_entities,
+        ):
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
 
-            await data_mapper.update(entity)
+            await data_mapper.update_many(entities)
 
     async def _persist_deleted(self) -> None:
-        for entity in self._deleted_entities:
-            data_mapper = self._data_mappers_registry.get_mapper(
-                type(entity),
-            )
+        for entity_type, entities in self._group_by_type(
+            self._deleted_entities,
+        ):
+            data_mapper = self._data_mappers_registry.get_mapper(entity_type)
+
+            await data_mapper.delete_many(entities)
+
+    def _group_by_type(
+        self, entities: Iterable[Entity]
+    ) -> Iterable[tuple[type[Entity], list[Entity]]]:
+        entities_by_type: dict[type[Entity], list[Entity]] = {}
+
+        for entity in entities:
+            entities_by_type.setdefault(type(entity), []).append(entity)
 
-            await data_mapper.delete(entity)
+        return entities_by_type.items()
@@ -29,6 +29,15 @@ target_metadata = METADATA
 # ... etc.
 
 
+def include_name(
+    name: str | None, type_: str, parent_names: dict[str, str | None]
+) -> bool:
+    # The FTS5 search table and its shadow tables are managed by hand.
+    if type_ == "table" and name is not None:
+        return not name.startswith("meetups_search")
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -45,6 +54,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -54,7 +64,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
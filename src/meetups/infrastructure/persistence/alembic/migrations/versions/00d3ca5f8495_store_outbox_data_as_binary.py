@@ -0,0 +1,48 @@
+"""store outbox data as binary
+
+Revision ID: 00d3ca5f8495
+Revises: 8d6a4c0626ca
+Create Date: 2026-10-18 18:29:59.800065
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00d3ca5f8495'
+down_revision: Union[str, None] = '8d6a4c0626ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            'ALTER TABLE outbox ALTER COLUMN data TYPE bytea '
+            "USING convert_to(data, 'UTF8')"
+        )
+        return
+
+    with op.batch_alter_table('outbox') as batch_op:
+        batch_op.alter_column(
+            'data', existing_type=sa.Text(), type_=sa.LargeBinary()
+        )
+    op.execute('UPDATE outbox SET data = CAST(data AS BLOB)')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            'ALTER TABLE outbox ALTER COLUMN data TYPE text '
+            "USING convert_from(data, 'UTF8')"
+        )
+        return
+
+    with op.batch_alter_table('outbox') as batch_op:
+        batch_op.alter_column(
+            'data', existing_type=sa.LargeBinary(), type_=sa.Text()
+        )
+    op.execute('UPDATE outbox SET data = CAST(data AS TEXT)')
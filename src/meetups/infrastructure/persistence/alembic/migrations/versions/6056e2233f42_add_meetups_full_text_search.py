@@ -0,0 +1,49 @@
+"""add meetups full text search
+
+Revision ID: 6056e2233f42
+Revises: cd2e92a8739a
+Create Date: 2026-10-18 18:14:07.143380
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6056e2233f42'
+down_revision: Union[str, None] = 'cd2e92a8739a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'sqlite':
+        op.execute(
+            'CREATE VIRTUAL TABLE meetups_search '
+            'USING fts5(meetup_id, title, description)'
+        )
+        op.execute(
+            "INSERT INTO meetups_search(meetups_search, rank) "
+            "VALUES ('rank', 'bm25(0.0, 10.0, 1.0)')"
+        )
+        op.execute(
+            'INSERT INTO meetups_search(meetup_id, title, description) '
+            'SELECT meetup_id, title, description FROM meetups'
+        )
+    elif dialect_name == 'postgresql':
+        op.execute(
+            'CREATE INDEX ix_meetups_search_vector ON meetups USING gin '
+            "(to_tsvector('english'::regconfig, title || ' ' || description))"
+        )
+
+
+def downgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'sqlite':
+        op.execute('DROP TABLE meetups_search')
+    elif dialect_name == 'postgresql':
+        op.drop_index('ix_meetups_search_vector', table_name='meetups')
@@ -0,0 +1,59 @@
+"""add meetups next transition at
+
+Revision ID: 7997767acad7
+Revises: 00d3ca5f8495
+Create Date: 2026-10-18 18:35:04.871786
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7997767acad7'
+down_revision: Union[str, None] = '00d3ca5f8495'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'meetups', sa.Column('next_transition_at', sa.Date(), nullable=True)
+    )
+    op.create_index(
+        'ix_meetups_next_transition_at',
+        'meetups',
+        ['next_transition_at'],
+        unique=False,
+    )
+
+    meetups = sa.table(
+        'meetups',
+        sa.column('status', sa.String()),
+        sa.column('start_date', sa.Date()),
+        sa.column('finish_date', sa.Date()),
+        sa.column('next_transition_at', sa.Date()),
+    )
+
+    if op.get_bind().dialect.name == 'sqlite':
+        day_after_finish = sa.func.date(meetups.c.finish_date, '+1 day')
+    else:
+        day_after_finish = meetups.c.finish_date + 1
+
+    op.execute(
+        meetups.update()
+        .where(meetups.c.status == 'COMING')
+        .values(next_transition_at=meetups.c.start_date)
+    )
+    op.execute(
+        meetups.update()
+        .where(meetups.c.status == 'STARTED')
+        .values(next_transition_at=day_after_finish)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meetups_next_transition_at', table_name='meetups')
+    op.drop_column('meetups', 'next_transition_at')
@@ -0,0 +1,28 @@
+"""add outbox trace context
+
+Revision ID: b0f1105d22cc
+Revises: edc8271103cb
+Create Date: 2026-10-18 19:07:34.407912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b0f1105d22cc'
+down_revision: Union[str, None] = 'edc8271103cb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'outbox', sa.Column('trace_context', sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('outbox', 'trace_context')
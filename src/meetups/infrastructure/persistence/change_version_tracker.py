@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from meetups.domain.shared.entity import Entity
+
+
+class ChangeVersionTracker(ABC):
+    @abstractmethod
+    async def bump(self, entity_types: Iterable[type[Entity]]) -> None: ...
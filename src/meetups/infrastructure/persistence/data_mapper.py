@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from meetups.domain.shared.entity import Entity
 
@@ -10,3 +11,9 @@ class DataMapper[T: Entity](ABC):
     async def update(self, entity: T) -> None: ...
     @abstractmethod
     async def delete(self, entity: T) -> None: ...
+    @abstractmethod
+    async def insert_many(self, entities: Sequence[T]) -> None: ...
+    @abstractmethod
+    async def update_many(self, entities: Sequence[T]) -> None: ...
+    @abstractmethod
+    async def delete_many(self, entities: Sequence[T]) -> None: ...
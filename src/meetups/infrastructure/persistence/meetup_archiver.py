@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+from meetups.domain.meetup.meetup_id import MeetupId
+
+
+class MeetupArchiver(ABC):
+    @abstractmethod
+    async def archive(
+        self, finished_before: date, archived_at: datetime, limit: int
+    ) -> list[MeetupId]: ...
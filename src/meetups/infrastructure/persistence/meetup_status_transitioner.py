@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+
+
+class MeetupStatusTransitioner(ABC):
+    @abstractmethod
+    async def transition(
+        self, status: MeetupStatus, today: date, limit: int
+    ) -> list[MeetupId]: ...
+    @abstractmethod
+    async def load_next_transition_date(self) -> date | None: ...
@@ -0,0 +1,22 @@
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from meetups.application.common.markers.command import Command
+from meetups.infrastructure.persistence.read_your_writes_guard import (
+    ReadYourWritesGuard,
+)
+
+
+class ReadYourWritesBehavior[C: Command, R](PipelineBehavior[C, R]):
+    """Records a write once the command has committed.
+
+    Must wrap ``CommitionBehavior``, so a failed commit records nothing.
+    """
+
+    def __init__(self, guard: ReadYourWritesGuard) -> None:
+        self._guard = guard
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        response = await handle_next(request)
+        self._guard.record_write()
+
+        return response
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from meetups.application.ports.time_provider import TimeProvider
+
+
+class ReadYourWritesGuard:
+    """Keeps a caller's reads on the primary while replicas may still lag.
+
+    A caller that committed less than ``lag_window`` ago, in this request or
+    an earlier one, could otherwise read a replica that has not replayed
+    its own write yet.
+    """
+
+    def __init__(
+        self,
+        time_provider: TimeProvider,
+        lag_window: timedelta,
+        last_write_at: datetime | None = None,
+    ) -> None:
+        self._time_provider = time_provider
+        self._lag_window = lag_window
+        self._last_write_at = last_write_at
+        self._wrote = False
+
+    @property
+    def last_write_at(self) -> datetime | None:
+        return self._last_write_at
+
+    @property
+    def wrote(self) -> bool:
+        return self._wrote
+
+    def record_write(self) -> None:
+        self._last_write_at = self._time_provider.provide_current()
+        self._wrote = True
+
+    def requires_primary(self) -> bool:
+        if self._last_write_at is None:
+            return False
+
+        elapsed = self._time_provider.provide_current() - self._last_write_at
+        return elapsed < self._lag_window
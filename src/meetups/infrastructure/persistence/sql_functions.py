@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Date
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class DayAfter(FunctionElement[date]):
+    """The date one day after a date expression, in the dialect's syntax."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(DayAfter)
+def _compile_day_after(
+    element: DayAfter, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    expression = compiler.process(element.clauses, **kwargs)
+    return f"({expression} + INTERVAL '1' DAY)"
+
+
+@compiles(DayAfter, "postgresql")
+def _compile_day_after_postgresql(
+    element: DayAfter, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    expression = compiler.process(element.clauses, **kwargs)
+    return f"({expression} + 1)"
+
+
+@compiles(DayAfter, "sqlite")
+def _compile_day_after_sqlite(
+    element: DayAfter, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    expression = compiler.process(element.clauses, **kwargs)
+    return f"date({expression}, '+1 day')"
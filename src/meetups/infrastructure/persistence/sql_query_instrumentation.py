@@ -0,0 +1,177 @@
+import heapq
+import logging
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from itertools import count
+from time import perf_counter
+from typing import Any, Final
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import (
+    Connection,
+    ExceptionContext,
+    ExecutionContext,
+)
+
+logger = logging.getLogger(__name__)
+
+# Connections opened for a request or task carry their QueryStats under
+# this execution option; statements on other connections are only checked
+# against the slow-query threshold.
+QUERY_STATS_OPTION: Final[str] = "meetups_query_stats"
+_STARTED_AT_KEY: Final[str] = "meetups_statement_started_at"
+
+
+class RepeatedStatementError(AssertionError):
+    """Raised in development when one scope repeats a statement too often."""
+
+
+@dataclass(frozen=True)
+class StatementTiming:
+    statement: str
+    parameters: str
+    duration: float
+
+
+class QueryStats:
+    """Statements run by one API request or worker task."""
+
+    def __init__(self, max_slowest: int = 3) -> None:
+        self.statement_count = 0
+        self.total_duration = 0.0
+        self.shape_counts: Counter[str] = Counter()
+        self._max_slowest = max_slowest
+        self._slowest: list[tuple[float, int, StatementTiming]] = []
+        self._sequence = count()
+
+    @property
+    def slowest(self) -> list[StatementTiming]:
+        return [timing for _, _, timing in sorted(self._slowest, reverse=True)]
+
+    def record(self, timing: StatementTiming) -> None:
+        self.statement_count += 1
+        self.total_duration += timing.duration
+
+        entry = (timing.duration, next(self._sequence), timing)
+        if len(self._slowest) < self._max_slowest:
+            heapq.heappush(self._slowest, entry)
+        elif timing.duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+
+def redact_parameters(parameters: Any) -> str:
+    # Only the shape of the bound values is logged, never the values.
+    if isinstance(parameters, Mapping):
+        return repr({name: "?" for name in parameters})
+    if isinstance(parameters, Sequence) and not isinstance(
+        parameters, str | bytes
+    ):
+        if parameters and isinstance(parameters[0], Mapping | list | tuple):
+            return f"{len(parameters)} x {redact_parameters(parameters[0])}"
+        return repr(tuple("?" for _ in parameters))
+    return "?"
+
+
+class SqlQueryInstrumentation:
+    """Times statements through engine events.
+
+    Each statement is added to the QueryStats of the connection it ran
+    on, logged when it exceeds the slow-query threshold and, with
+    max_statement_repeats set, rejected once its shape has run that many
+    times in the same scope. Repeated shapes are usually per-row loads in
+    a loop that should be one batched query.
+    """
+
+    def __init__(
+        self,
+        slow_query_threshold: float,
+        max_statement_repeats: int | None = None,
+    ) -> None:
+        self._slow_query_threshold = slow_query_threshold
+        self._max_statement_repeats = max_statement_repeats
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def report(self, stats: QueryStats) -> None:
+        if not stats.statement_count:
+            return
+
+        logger.debug(
+            "%d statements in %.1f ms; slowest: %s",
+            stats.statement_count,
+            stats.total_duration * 1000,
+            "; ".join(
+                f"{timing.duration * 1000:.1f} ms {timing.statement!r} "
+                f"{timing.parameters}"
+                for timing in stats.slowest
+            ),
+        )
+
+    def _before_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started_at = connection.info.setdefault(_STARTED_AT_KEY, [])
+        started_at.append(perf_counter())
+        stats = self._stats(connection)
+
+        if stats is not None and self._max_statement_repeats is not None:
+            stats.shape_counts[statement] += 1
+            repeats = stats.shape_counts[statement]
+            if repeats > self._max_statement_repeats:
+                raise RepeatedStatementError(
+                    f"Statement ran {repeats} times in one scope, more than "
+                    f"the {self._max_statement_repeats} allowed: "
+                    f"{statement!r}"
+                )
+
+    def _after_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        duration = perf_counter() - connection.info[_STARTED_AT_KEY].pop()
+        stats = self._stats(connection)
+        is_slow = duration >= self._slow_query_threshold
+
+        if stats is None and not is_slow:
+            return
+
+        timing = StatementTiming(
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            duration=duration,
+        )
+        if stats is not None:
+            stats.record(timing)
+        if is_slow:
+            logger.warning(
+                "Slow statement took %.1f ms: %r %s",
+                duration * 1000,
+                timing.statement,
+                timing.parameters,
+            )
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(_STARTED_AT_KEY):
+            connection.info[_STARTED_AT_KEY].pop()
+
+    def _stats(self, connection: Connection) -> QueryStats | None:
+        stats: QueryStats | None = connection.get_execution_options().get(
+            QUERY_STATS_OPTION
+        )
+        return stats
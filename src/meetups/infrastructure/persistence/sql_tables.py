@@ -1,4 +1,22 @@
-from sqlalchemy import UUID, Column, DateTime, Enum, MetaData, Table, Text, Date
+from sqlalchemy import (
+    DDL,
+    UUID,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Index,
+    LargeBinary,
+    MetaData,
+    Table,
+    Text,
+    column,
+    event,
+    func,
+    literal_column,
+    table,
+)
 
 from meetups.domain.meetup.meetup_status import MeetupStatus
 
@@ -9,7 +27,35 @@ MEETUPS_TABLE = Table(
     METADATA,
     Column('meetup_id', UUID(as_uuid=True), primary_key=True),
     Column('user_id', UUID(as_uuid=True), nullable=False),
-    Column('tile', Text, nullable=False),
+    Column('title', Text, nullable=False),
+    Column('description', Text, nullable=False),
+    Column('address', Text, nullable=False),
+    Column('city', Text, nullable=False),
+    Column('country', Text, nullable=False),
+    Column('start_date', Date, nullable=False),
+    Column('finish_date', Date, nullable=False),
+    Column('status', Enum(MeetupStatus), nullable=False),
+    Column('posted_at', DateTime, nullable=False),
+    # The date the meetup's status next changes, NULL once it is COMPLETED.
+    Column('next_transition_at', Date, nullable=True),
+    Index('ix_meetups_posted_at_meetup_id', 'posted_at', 'meetup_id'),
+    Index('ix_meetups_city_posted_at', 'city', 'posted_at', 'meetup_id'),
+    Index('ix_meetups_country_posted_at', 'country', 'posted_at', 'meetup_id'),
+    Index('ix_meetups_status_posted_at', 'status', 'posted_at', 'meetup_id'),
+    Index('ix_meetups_user_id_posted_at', 'user_id', 'posted_at', 'meetup_id'),
+    Index('ix_meetups_start_date_finish_date', 'start_date', 'finish_date'),
+    Index('ix_meetups_next_transition_at', 'next_transition_at'),
+    Index('ix_meetups_finish_date', 'finish_date'),
+)
+
+# Cold tier for finished meetups, moved over by the archiver so the hot
+# table only holds meetups that can still change.
+MEETUPS_ARCHIVE_TABLE = Table(
+    'meetups_archive',
+    METADATA,
+    Column('meetup_id', UUID(as_uuid=True), primary_key=True),
+    Column('user_id', UUID(as_uuid=True), nullable=False),
+    Column('title', Text, nullable=False),
     Column('description', Text, nullable=False),
     Column('address', Text, nullable=False),
     Column('city', Text, nullable=False),
@@ -18,12 +64,114 @@ MEETUPS_TABLE = Table(
     Column('finish_date', Date, nullable=False),
     Column('status', Enum(MeetupStatus), nullable=False),
     Column('posted_at', DateTime, nullable=False),
+    Column('archived_at', DateTime, nullable=False),
+    Index(
+        'ix_meetups_archive_posted_at_meetup_id', 'posted_at', 'meetup_id'
+    ),
+    Index(
+        'ix_meetups_archive_user_id_posted_at',
+        'user_id',
+        'posted_at',
+        'meetup_id',
+    ),
+    # Same filter indexes as the hot table, so filtered listings that
+    # include the archive stay index scans on both branches.
+    Index(
+        'ix_meetups_archive_city_posted_at', 'city', 'posted_at', 'meetup_id'
+    ),
+    Index(
+        'ix_meetups_archive_country_posted_at',
+        'country',
+        'posted_at',
+        'meetup_id',
+    ),
+    Index(
+        'ix_meetups_archive_status_posted_at',
+        'status',
+        'posted_at',
+        'meetup_id',
+    ),
+    Index(
+        'ix_meetups_archive_start_date_finish_date',
+        'start_date',
+        'finish_date',
+    ),
+)
+
+# Columns copied as is between the tiers.
+MEETUPS_ARCHIVED_COLUMNS = tuple(
+    column.name
+    for column in MEETUPS_ARCHIVE_TABLE.c
+    if column.name in MEETUPS_TABLE.c
 )
 
 OUTBOX_TABLE = Table(
     "outbox",
     METADATA,
     Column("message_id", UUID, primary_key=True),
-    Column("data", Text, nullable=False),
+    Column("data", LargeBinary, nullable=False),
     Column("event_type", Text, nullable=False, default=False),
-)
\ No newline at end of file
+    Column("trace_context", Text, nullable=True),
+)
+
+CHANGE_VERSIONS_TABLE = Table(
+    "change_versions",
+    METADATA,
+    Column("name", Text, primary_key=True),
+    Column("version", BigInteger, nullable=False, default=0),
+)
+
+# Postgres: GIN index over the same expression the search query uses, so
+# the planner can match it. The regconfig is inlined to keep it immutable.
+MEETUPS_SEARCH_VECTOR = func.to_tsvector(
+    literal_column("'english'::regconfig"),
+    MEETUPS_TABLE.c.title + ' ' + MEETUPS_TABLE.c.description,
+)
+
+Index(
+    'ix_meetups_search_vector',
+    MEETUPS_SEARCH_VECTOR,
+    postgresql_using='gin',
+).ddl_if(dialect='postgresql')
+
+# SQLite: standalone FTS5 table kept in sync by SqlMeetupDataMapper. It is
+# not part of METADATA because virtual tables cannot be reflected. The
+# meetup_id column is indexed too, so sync deletes are MATCH lookups rather
+# than scans; text queries are scoped to title and description.
+MEETUPS_SEARCH_TABLE = table(
+    'meetups_search',
+    column('meetup_id', UUID(as_uuid=True)),
+    column('title', Text),
+    column('description', Text),
+    column('meetups_search', Text),
+    column('rank'),
+)
+
+CREATE_MEETUPS_SEARCH_TABLE = DDL(  # type: ignore
+    'CREATE VIRTUAL TABLE IF NOT EXISTS meetups_search '
+    'USING fts5(meetup_id, title, description)'
+)
+# bm25 weights per column: ignore meetup_id, favour title over description.
+CONFIGURE_MEETUPS_SEARCH_RANK = DDL(  # type: ignore
+    "INSERT INTO meetups_search(meetups_search, rank) "
+    "VALUES ('rank', 'bm25(0.0, 10.0, 1.0)')"
+)
+DROP_MEETUPS_SEARCH_TABLE = DDL(  # type: ignore
+    'DROP TABLE IF EXISTS meetups_search'
+)
+
+event.listen(
+    METADATA,
+    'after_create',
+    CREATE_MEETUPS_SEARCH_TABLE.execute_if(dialect='sqlite'),
+)
+event.listen(
+    METADATA,
+    'after_create',
+    CONFIGURE_MEETUPS_SEARCH_RANK.execute_if(dialect='sqlite'),
+)
+event.listen(
+    METADATA,
+    'before_drop',
+    DROP_MEETUPS_SEARCH_TABLE.execute_if(dialect='sqlite'),
+)
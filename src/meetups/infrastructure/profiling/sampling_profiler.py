@@ -0,0 +1,146 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from functools import cache
+from types import CodeType, FrameType
+from typing import Final
+
+# Leaf frames of threads parked in the event loop's selector, on a lock
+# or in an idle executor worker. They would otherwise dominate every
+# profile while saying nothing about where CPU goes.
+_IDLE_FRAMES: Final[frozenset[tuple[str, str]]] = frozenset(
+    {
+        ("selectors", "EpollSelector.select"),
+        ("selectors", "KqueueSelector.select"),
+        ("selectors", "PollSelector.select"),
+        ("selectors", "SelectSelector.select"),
+        ("threading", "Condition.wait"),
+        ("threading", "Event.wait"),
+        ("concurrent.futures.thread", "_worker"),
+    }
+)
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one runs."""
+
+
+@dataclass(frozen=True)
+class Profile:
+    samples: Counter[str]
+    seconds: float
+    interval: float
+
+    def to_collapsed(self) -> str:
+        # The collapsed stack format read by flamegraph.pl, speedscope and
+        # most other flame graph tools: root;...;leaf count.
+        return "".join(
+            f"{stack} {count}\n"
+            for stack, count in self.samples.most_common()
+        )
+
+
+@cache
+def _module_name(filename: str) -> str:
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + "/"):
+            module = filename[len(path) + 1:].removesuffix(".py")
+            return module.removesuffix("/__init__").replace("/", ".")
+    return filename
+
+
+@cache
+def _frame_label(code: CodeType) -> tuple[str, str]:
+    return _module_name(code.co_filename), code.co_qualname
+
+
+class SamplingProfiler:
+    """Samples the Python stacks of every thread in this process.
+
+    A background thread reads sys._current_frames() every ``interval``
+    seconds and counts each distinct stack, so the profiled code is never
+    traced; its only cost is the sampler briefly holding the GIL. One
+    profile runs at a time, and none for longer than ``max_seconds``.
+
+    The sampler needs the GIL to look, so code that holds it for less than
+    the interpreter's switch interval is under-sampled in favour of the
+    next blocking call. The profile shows where sustained CPU time goes.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_seconds: float,
+        include_idle: bool = False,
+    ) -> None:
+        self._interval = interval
+        self._max_seconds = max_seconds
+        self._include_idle = include_idle
+        self._running = threading.Lock()
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max_seconds
+
+    async def profile(self, seconds: float) -> Profile:
+        if not 0 < seconds <= self._max_seconds:
+            raise ValueError(
+                f"Profile length must be in (0, {self._max_seconds}] seconds"
+            )
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+
+        samples: Counter[str] = Counter()
+        stopped = threading.Event()
+        sampler = threading.Thread(
+            target=self._run,
+            args=(samples, stopped),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        sampler.start()
+
+        # The event loop keeps serving traffic while the sampler watches.
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stopped.set()
+            await asyncio.to_thread(sampler.join)
+            self._running.release()
+
+        return Profile(samples, seconds, self._interval)
+
+    def _run(self, samples: Counter[str], stopped: threading.Event) -> None:
+        sampler_id = threading.get_ident()
+
+        while not stopped.wait(self._interval):
+            thread_names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+            # The only stdlib way to read other threads' stacks.
+            current_frames = sys._current_frames()  # noqa: SLF001
+            for thread_id, frame in current_frames.items():
+                if thread_id == sampler_id:
+                    continue
+
+                stack = self._collapse(frame)
+                if stack is not None:
+                    thread_name = thread_names.get(thread_id, str(thread_id))
+                    samples[f"{thread_name};{stack}"] += 1
+
+    def _collapse(self, frame: FrameType) -> str | None:
+        labels = []
+        current: FrameType | None = frame
+
+        while current is not None:
+            labels.append(_frame_label(current.f_code))
+            current = current.f_back
+
+        if not self._include_idle and labels[0] in _IDLE_FRAMES:
+            return None
+
+        return ";".join(
+            f"{module}:{function}" for module, function in reversed(labels)
+        )
@@ -0,0 +1,88 @@
+import json
+import logging
+import queue
+import threading
+from contextlib import suppress
+
+from meetups.infrastructure.tracing.span import Span
+from meetups.infrastructure.tracing.span_exporter import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans to a file, one JSON object per line.
+
+    Spans are handed to a writer thread, so the event loop never encodes
+    them or waits on the disk. The writer takes whatever has queued up
+    since its last write and writes it at once. Spans exported while
+    ``max_queued`` are already waiting are dropped, and so are spans the
+    disk refuses; neither ever blocks ``export`` or ``close``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_queued: int = 10_000,
+        close_timeout: float = 5.0,
+    ) -> None:
+        # Opened here, so a bad path fails at startup instead of killing
+        # the writer thread.
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+        self._spans: queue.Queue[Span | None] = queue.Queue(max_queued)
+        self._close_timeout = close_timeout
+        self._dropped = 0
+        self._writer = threading.Thread(
+            target=self._write,
+            name="file-span-exporter",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._spans.put_nowait(span)
+        except queue.Full:
+            self._dropped += 1
+
+    def close(self) -> None:
+        # Everything exported before the sentinel is written first.
+        with suppress(queue.Full):
+            self._spans.put(None, timeout=self._close_timeout)
+        self._writer.join(self._close_timeout)
+
+        if self._writer.is_alive():
+            logger.error(
+                "File span writer did not finish within %s seconds",
+                self._close_timeout,
+            )
+        if self._dropped:
+            logger.warning(
+                "Dropped %d spans the file writer could not keep up with",
+                self._dropped,
+            )
+
+    def _write(self) -> None:
+        closed = False
+
+        while not closed:
+            spans = [self._spans.get()]
+            while not self._spans.empty():
+                spans.append(self._spans.get_nowait())
+
+            closed = None in spans
+            try:
+                self._file.writelines(
+                    json.dumps(span.to_dict(), default=str) + "\n"
+                    for span in spans
+                    if span is not None
+                )
+                self._file.flush()
+            except OSError:
+                # Keeps draining, so a full disk loses spans instead of
+                # the writer and everything waiting on it.
+                logger.exception("Could not write spans to the file")
+
+        # Closing retries whatever a failed flush left in the buffer.
+        with suppress(OSError):
+            self._file.close()
@@ -0,0 +1,24 @@
+from collections import deque
+
+from meetups.infrastructure.tracing.span import Span
+from meetups.infrastructure.tracing.span_exporter import SpanExporter
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the most recent finished spans, for tests and local debugging."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def close(self) -> None:
+        self.clear()
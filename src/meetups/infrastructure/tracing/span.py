@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+_TRACEPARENT_VERSION = "00"
+_SAMPLED_FLAGS = "01"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+
+    @classmethod
+    def from_traceparent(cls, traceparent: str | None) -> Self | None:
+        # W3C Trace Context: version-trace_id-parent_id-flags.
+        if not traceparent:
+            return None
+
+        parts = traceparent.strip().lower().split("-")
+        if len(parts) != 4:
+            return None
+
+        _, trace_id, span_id, _ = parts
+        if len(trace_id) != 32 or len(span_id) != 16:
+            return None
+
+        try:
+            if not int(trace_id, 16) or not int(span_id, 16):
+                return None
+        except ValueError:
+            return None
+
+        return cls(trace_id=trace_id, span_id=span_id)
+
+    def to_traceparent(self) -> str:
+        return (
+            f"{_TRACEPARENT_VERSION}-{self.trace_id}-{self.span_id}-"
+            f"{_SAMPLED_FLAGS}"
+        )
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: str | None
+    started_at: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    finished_at: int | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_span_id": self.parent_span_id,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from meetups.infrastructure.tracing.span import Span
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None: ...
+    @abstractmethod
+    def close(self) -> None: ...
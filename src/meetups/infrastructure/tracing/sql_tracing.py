@@ -0,0 +1,64 @@
+from typing import Any, Final
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+
+from meetups.infrastructure.tracing.span import Span
+from meetups.infrastructure.tracing.tracer import Tracer
+
+_SPANS_KEY: Final[str] = "meetups_statement_spans"
+
+
+class SqlStatementTracing:
+    """Opens a span around every statement executed on an engine."""
+
+    def __init__(self, tracer: Tracer) -> None:
+        self._tracer = tracer
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        # Only the parameterized statement is recorded, never the values.
+        span = self._tracer.start_span(
+            f"sql {statement.split(None, 1)[0].upper()}",
+            {
+                "db.system": connection.dialect.name,
+                "db.statement": statement,
+                "db.executemany": executemany,
+            },
+        )
+        spans: list[Span | None] = connection.info.setdefault(_SPANS_KEY, [])
+        spans.append(span)
+
+    def _after_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        span = connection.info[_SPANS_KEY].pop()
+        if span is not None:
+            self._tracer.end_span(span)
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        connection = exception_context.connection
+        if connection is None or not connection.info.get(_SPANS_KEY):
+            return
+
+        span = connection.info[_SPANS_KEY].pop()
+        if span is not None:
+            self._tracer.end_span(span, exception_context.original_exception)
@@ -0,0 +1,98 @@
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import getrandbits
+from time import time_ns
+from typing import Any
+
+from meetups.infrastructure.tracing.span import Span, SpanContext
+from meetups.infrastructure.tracing.span_exporter import SpanExporter
+
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar(
+    "current_span", default=None
+)
+
+
+class Tracer:
+    """Creates spans and tracks the current one per asyncio task.
+
+    Without an exporter tracing is off: no spans are created and no trace
+    context is propagated.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self._exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    @property
+    def exporter(self) -> SpanExporter | None:
+        return self._exporter
+
+    def current_context(self) -> SpanContext | None:
+        span = _CURRENT_SPAN.get()
+        return None if span is None else span.context
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Mapping[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Iterator[Span | None]:
+        span = self.start_span(name, attributes, parent)
+        if span is None:
+            yield None
+            return
+
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            self.end_span(span, error)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _CURRENT_SPAN.reset(token)
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Span | None:
+        # Spans started here do not become current, which suits leaf spans
+        # opened and closed from separate callbacks.
+        if self._exporter is None:
+            return None
+
+        if parent is None:
+            parent = self.current_context()
+
+        return Span(
+            name=name,
+            context=SpanContext(
+                trace_id=(
+                    f"{getrandbits(128):032x}"
+                    if parent is None
+                    else parent.trace_id
+                ),
+                span_id=f"{getrandbits(64):016x}",
+            ),
+            parent_span_id=None if parent is None else parent.span_id,
+            started_at=time_ns(),
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(
+        self, span: Span, error: BaseException | None = None
+    ) -> None:
+        span.finished_at = time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+        if self._exporter is not None:
+            self._exporter.export(span)
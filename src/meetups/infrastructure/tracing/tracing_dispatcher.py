@@ -0,0 +1,74 @@
+from typing import Any, TypeVar, cast
+
+from bazario import Notification, Request
+from bazario.asyncio import (
+    Dispatcher,
+    NotificationHandler,
+    PipelineBehavior,
+    Registry,
+    RequestHandler,
+    Resolver,
+)
+from bazario.asyncio.abc.sender import TRes
+
+from meetups.infrastructure.tracing.tracer import Tracer
+
+T = TypeVar("T")
+
+
+class _TracedHandle:
+    def __init__(self, wrapped: Any, tracer: Tracer) -> None:
+        self._wrapped = wrapped
+        self._tracer = tracer
+        self._name = type(wrapped).__name__
+
+    async def handle(self, request: Any, *args: Any) -> Any:
+        with self._tracer.span(
+            self._name, {"mediator.request": type(request).__name__}
+        ):
+            return await self._wrapped.handle(request, *args)
+
+
+class TracingResolver(Resolver):
+    """Gives every resolved handler and pipeline behavior its own span."""
+
+    def __init__(self, resolver: Resolver, tracer: Tracer) -> None:
+        self._resolver = resolver
+        self._tracer = tracer
+
+    async def resolve(self, dependency_type: type[T]) -> T:
+        dependency = await self._resolver.resolve(dependency_type)
+
+        if isinstance(
+            dependency,
+            RequestHandler | NotificationHandler | PipelineBehavior,
+        ):
+            # The chain only ever calls handle(), so a proxy is enough.
+            return cast(T, _TracedHandle(dependency, self._tracer))
+
+        return dependency
+
+
+class TracingDispatcher(Dispatcher):
+    def __init__(
+        self, resolver: Resolver, registry: Registry, tracer: Tracer
+    ) -> None:
+        super().__init__(TracingResolver(resolver, tracer), registry)
+        self._tracer = tracer
+
+    async def send(self, request: Request[TRes]) -> TRes:
+        request_name = type(request).__name__
+
+        with self._tracer.span(
+            f"send {request_name}", {"mediator.request": request_name}
+        ):
+            return await super().send(request)
+
+    async def publish(self, notification: Notification) -> None:
+        notification_name = type(notification).__name__
+
+        with self._tracer.span(
+            f"publish {notification_name}",
+            {"mediator.notification": notification_name},
+        ):
+            await super().publish(notification)
@@ -4,6 +4,7 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.status import (
     HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_403_FORBIDDEN
@@ -19,7 +20,8 @@ STATUS_MAP = {
     ErrorType.NOT_FOUND: HTTP_404_NOT_FOUND,
     ErrorType.VALIDATION_ERROR: HTTP_422_UNPROCESSABLE_ENTITY,
     ErrorType.APPLICATION_ERROR: HTTP_500_INTERNAL_SERVER_ERROR,
-    ErrorType.PERMISSION_ERROR: HTTP_403_FORBIDDEN
+    ErrorType.PERMISSION_ERROR: HTTP_403_FORBIDDEN,
+    ErrorType.CONFLICT: HTTP_409_CONFLICT,
 }
 
 
@@ -0,0 +1,58 @@
+from typing import Final
+from uuid import UUID
+
+from fastapi import Request
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.ports.context.identity_provider import (
+    IdentityProvider,
+)
+from meetups.application.ports.context.user_role import UserRole
+from meetups.domain.shared.user_id import UserId
+
+
+class HeaderIdentityProvider(IdentityProvider):
+    """Reads the caller identity the auth gateway puts into request headers.
+
+    The service sits behind a gateway that authenticates every request, so
+    the headers are trusted as is. That only holds while the gateway is the
+    sole way in and replaces any ``X-User-*`` header a client sends; the
+    API must never be reachable directly.
+    """
+
+    USER_ID_HEADER: Final[str] = "X-User-Id"
+    USER_ROLE_HEADER: Final[str] = "X-User-Role"
+
+    def __init__(self, request: Request) -> None:
+        self._request = request
+
+    async def current_user_id(self) -> UserId:
+        user_id = self._request.headers.get(self.USER_ID_HEADER)
+
+        if user_id is None:
+            raise ApplicationError(
+                "Request is not authenticated", ErrorType.PERMISSION_ERROR
+            )
+
+        try:
+            return UserId(UUID(user_id))
+        except ValueError as error:
+            raise ApplicationError(
+                "Malformed user id", ErrorType.PERMISSION_ERROR
+            ) from error
+
+    async def current_user_role(self) -> UserRole:
+        await self.current_user_id()
+        user_role = self._request.headers.get(
+            self.USER_ROLE_HEADER, UserRole.USER
+        )
+
+        try:
+            return UserRole(user_role)
+        except ValueError as error:
+            raise ApplicationError(
+                "Unknown user role", ErrorType.PERMISSION_ERROR
+            ) from error
@@ -0,0 +1,68 @@
+from datetime import datetime
+from math import ceil
+from typing import Final
+
+from fastapi import Request, Response
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.types import ASGIApp
+
+from meetups.infrastructure.persistence.read_your_writes_guard import (
+    ReadYourWritesGuard,
+)
+
+LAST_WRITE_AT_COOKIE: Final[str] = "last_write_at"
+_GUARD_STATE_KEY: Final[str] = "read_your_writes_guard"
+
+
+def load_last_write_at(request: Request) -> datetime | None:
+    cookie = request.cookies.get(LAST_WRITE_AT_COOKIE)
+
+    if cookie is None:
+        return None
+
+    try:
+        last_write_at = datetime.fromisoformat(cookie)
+    except ValueError:
+        return None
+
+    # Naive times cannot be compared with the UTC clock.
+    if last_write_at.tzinfo is None:
+        return None
+
+    return last_write_at
+
+
+def bind_guard(request: Request, guard: ReadYourWritesGuard) -> None:
+    setattr(request.state, _GUARD_STATE_KEY, guard)
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Hands the caller its last write time, so its next reads stay on the
+    primary until replicas have had ``lag_window`` seconds to catch up.
+    """
+
+    def __init__(self, app: ASGIApp, lag_window: float) -> None:
+        super().__init__(app)
+        self._lag_window = lag_window
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response = await call_next(request)
+        guard: ReadYourWritesGuard | None = getattr(
+            request.state, _GUARD_STATE_KEY, None
+        )
+
+        if guard is not None and guard.wrote and guard.last_write_at:
+            response.set_cookie(
+                LAST_WRITE_AT_COOKIE,
+                guard.last_write_at.isoformat(),
+                max_age=ceil(self._lag_window),
+                httponly=True,
+                samesite="lax",
+            )
+
+        return response
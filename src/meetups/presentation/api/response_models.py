@@ -20,3 +20,8 @@ class ErrorData[T]:
 @dataclass(frozen=True)
 class ErrorResponse[T](Response):
     error: ErrorData[T] = field(default_factory=ErrorData)
+
+
+@dataclass(frozen=True)
+class PageResponse[T](SuccessResponse[T]):
+    next_cursor: str | None = field(default=None)
@@ -0,0 +1,81 @@
+from datetime import UTC, datetime
+from typing import Annotated, Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Query, Response
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_403_FORBIDDEN,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.ports.context.identity_provider import (
+    IdentityProvider,
+)
+from meetups.application.ports.context.user_role import UserRole
+from meetups.infrastructure.profiling.sampling_profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+)
+from meetups.presentation.api.response_models import ErrorResponse
+
+COLLAPSED_STACKS_CONTENT_TYPE: Final[str] = "text/plain; charset=utf-8"
+
+DEBUG_ROUTER = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@DEBUG_ROUTER.get(
+    "/profile",
+    response_class=Response,
+    responses={
+        HTTP_200_OK: {"content": {COLLAPSED_STACKS_CONTENT_TYPE: {}}},
+        HTTP_403_FORBIDDEN: {"model": ErrorResponse[ApplicationError]},
+        HTTP_409_CONFLICT: {"model": ErrorResponse[ApplicationError]},
+        HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse[ApplicationError]
+        },
+    },
+    status_code=HTTP_200_OK,
+)
+@inject
+async def profile(
+    seconds: Annotated[float, Query(gt=0)],
+    *,
+    identity_provider: FromDishka[IdentityProvider],
+    sampling_profiler: FromDishka[SamplingProfiler],
+) -> Response:
+    # Samples this worker process only, while it keeps serving traffic.
+    if await identity_provider.current_user_role() != UserRole.ADMIN:
+        raise ApplicationError(
+            message="Only admin can profile the service",
+            error_type=ErrorType.PERMISSION_ERROR,
+        )
+
+    if seconds > sampling_profiler.max_seconds:
+        raise ApplicationError(
+            message=(
+                f"Profile can run for at most "
+                f"{sampling_profiler.max_seconds:g} seconds"
+            ),
+            error_type=ErrorType.VALIDATION_ERROR,
+        )
+
+    try:
+        result = await sampling_profiler.profile(seconds)
+    except ProfilerBusyError as error:
+        raise ApplicationError(
+            message=str(error), error_type=ErrorType.CONFLICT
+        ) from error
+
+    filename = f"profile-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.folded"
+    return Response(
+        result.to_collapsed(),
+        media_type=COLLAPSED_STACKS_CONTENT_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
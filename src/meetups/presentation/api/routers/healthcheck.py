@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 
-from fastapi import APIRouter
-from starlette.status import HTTP_200_OK
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Response
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
 
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_telemetry import (
+    OutboxHealth,
+    OutboxTelemetry,
+)
 from meetups.presentation.api.response_models import SuccessResponse
 
 HEALTHCHECK_ROUTER = APIRouter(tags=["Healthcheck"])
@@ -20,3 +27,29 @@ class Healthcheck:
 )
 def healthcheck() -> SuccessResponse[Healthcheck]:
     return SuccessResponse(status=HTTP_200_OK, result=Healthcheck("OK"))
+
+
+@HEALTHCHECK_ROUTER.get(
+    "/healthcheck/outbox",
+    responses={
+        HTTP_200_OK: {"model": SuccessResponse[OutboxHealth]},
+        HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": SuccessResponse[OutboxHealth]
+        },
+    },
+    status_code=HTTP_200_OK,
+)
+@inject
+async def outbox_healthcheck(
+    response: Response,
+    *,
+    outbox_gateway: FromDishka[OutboxGateway],
+    outbox_telemetry: FromDishka[OutboxTelemetry],
+) -> SuccessResponse[OutboxHealth]:
+    # Not ready once the oldest unpublished message is older than
+    # OUTBOX_MAX_LAG_SECONDS, well before consumers see stale data.
+    health = outbox_telemetry.health(await outbox_gateway.backlog())
+    status = HTTP_503_SERVICE_UNAVAILABLE if health.lagging else HTTP_200_OK
+
+    response.status_code = status
+    return SuccessResponse(status=status, result=health)
@@ -1,24 +1,50 @@
+from dataclasses import asdict
 from typing import Annotated
-from collections.abc import Iterable
+from uuid import UUID
 
 from bazario.asyncio import Sender
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.status import (
     HTTP_200_OK, 
     HTTP_201_CREATED, 
+    HTTP_304_NOT_MODIFIED,
     HTTP_404_NOT_FOUND, 
-    HTTP_403_FORBIDDEN
+    HTTP_403_FORBIDDEN,
+    HTTP_422_UNPROCESSABLE_ENTITY
 )
 
 from meetups.domain.meetup.meetup_id import MeetupId
-from meetups.application.common.application_error import ApplicationError
+from meetups.application.common.application_error import (
+    ApplicationError,
+    ErrorType,
+)
+from meetups.application.models.batch import BatchResult
 from meetups.application.models.meetup import MeetupReadModel
+from meetups.application.models.meetup_filters import MeetupFilters
 from meetups.application.models.pagination import Pagination
+from meetups.application.operations.read.export_meetups import ExportMeetups
+from meetups.application.operations.read.get_meetup import GetMeetup
 from meetups.application.operations.read.get_meetups import GetMeetups
+from meetups.application.operations.read.get_meetups_by_ids import (
+    GetMeetupsByIds,
+)
+from meetups.application.operations.read.get_meetups_version import (
+    GetMeetupsVersion,
+)
+from meetups.application.operations.read.search_meetups import SearchMeetups
 from meetups.application.operations.write.add_meetup import AddMeetup
-from meetups.presentation.api.response_models import ErrorResponse, SuccessResponse
+from meetups.application.operations.write.add_meetups import AddMeetups
+from meetups.presentation.api.etags import etag_matches, make_weak_etag
+from meetups.presentation.ndjson import NDJSON_MEDIA_TYPE, encode_ndjson
+from meetups.presentation.api.response_models import (
+    ErrorData,
+    ErrorResponse,
+    PageResponse,
+    SuccessResponse,
+)
 
 MEETUPS_ROUTER = APIRouter(prefix='/meetups', tags=['meetups'])
 
@@ -38,24 +64,189 @@ async def create_meetup(
     return SuccessResponse(result=meetup_id, status=HTTP_201_CREATED)
 
 
+@MEETUPS_ROUTER.post(
+    path='/bulk',
+    response_model=SuccessResponse[BatchResult[MeetupId]],
+    responses={
+        HTTP_201_CREATED: {'model': SuccessResponse[BatchResult[MeetupId]]},
+        HTTP_403_FORBIDDEN: {'model': ErrorResponse[ApplicationError]},
+        HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorResponse[BatchResult[MeetupId]]
+        },
+    },
+    status_code=HTTP_201_CREATED
+)
+@inject
+async def create_meetups(
+    request: AddMeetups,
+    *,
+    sender: FromDishka[Sender]
+) -> SuccessResponse[BatchResult[MeetupId]] | Response:
+    result = await sender.send(request=request)
+
+    # Nothing was created, so the per-item errors are all there is to say.
+    if result.errors and not result.succeeded:
+        error_response = ErrorResponse(
+            HTTP_422_UNPROCESSABLE_ENTITY,
+            ErrorData("No meetup was added", result),
+        )
+        return JSONResponse(
+            asdict(error_response), HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    return SuccessResponse(result=result, status=HTTP_201_CREATED)
+
+
 @MEETUPS_ROUTER.get(
     path='/all',
+    response_model=PageResponse[list[MeetupReadModel]],
     responses={
-        HTTP_200_OK: {'model': SuccessResponse[Iterable[MeetupReadModel]]},
+        HTTP_200_OK: {'model': PageResponse[list[MeetupReadModel]]},
+        HTTP_304_NOT_MODIFIED: {'description': 'Not Modified'},
         HTTP_403_FORBIDDEN: {'model': ErrorResponse[ApplicationError]}
     },
     status_code=HTTP_200_OK
 )
 @inject
 async def get_meetups(
+    pagination: Annotated[
+        Pagination,
+        Depends()
+    ],
+    filters: Annotated[
+        MeetupFilters,
+        Depends()
+    ],
+    response: Response,
+    cursor: Annotated[str | None, Query()] = None,
+    include_archived: Annotated[bool, Query()] = False,
+    if_none_match: Annotated[str | None, Header()] = None,
+    *,
+    sender: FromDishka[Sender]
+) -> PageResponse[list[MeetupReadModel]] | Response:
+    # The version is read before the page, so a concurrent write can only
+    # make the tag older than the body, never newer.
+    version = await sender.send(request=GetMeetupsVersion())
+    etag = make_weak_etag(version)
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag},
+        )
+
+    page = await sender.send(
+        request=GetMeetups(
+            pagination=pagination,
+            cursor=cursor,
+            filters=filters,
+            include_archived=include_archived,
+        )
+    )
+    response.headers['ETag'] = etag
+    return PageResponse(
+        result=list(page.meetups),
+        next_cursor=page.next_cursor,
+        status=HTTP_200_OK,
+    )
+
+
+@MEETUPS_ROUTER.get(
+    path='/search',
+    responses={
+        HTTP_200_OK: {'model': SuccessResponse[list[MeetupReadModel]]},
+        HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorResponse[ApplicationError]
+        }
+    },
+    status_code=HTTP_200_OK
+)
+@inject
+async def search_meetups(
+    q: Annotated[str, Query(min_length=1)],
     pagination: Annotated[
         Pagination,
         Depends()
     ],
     *,
     sender: FromDishka[Sender]
-) -> SuccessResponse[Iterable[MeetupReadModel]]:
+) -> SuccessResponse[list[MeetupReadModel]]:
     meetups = await sender.send(
-        request=GetMeetups(pagination=pagination)
+        request=SearchMeetups(query=q, pagination=pagination)
+    )
+    return SuccessResponse(result=list(meetups), status=HTTP_200_OK)
+
+
+@MEETUPS_ROUTER.get(
+    path='/export',
+    response_class=StreamingResponse,
+    responses={
+        HTTP_200_OK: {'content': {NDJSON_MEDIA_TYPE: {}}},
+    },
+    status_code=HTTP_200_OK
+)
+@inject
+async def export_meetups(
+    *,
+    sender: FromDishka[Sender]
+) -> StreamingResponse:
+    meetups = await sender.send(request=ExportMeetups())
+    return StreamingResponse(
+        encode_ndjson(meetups),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+def parse_meetup_ids(
+    ids: Annotated[str, Query(min_length=1)]
+) -> list[MeetupId]:
+    try:
+        return [MeetupId(UUID(meetup_id)) for meetup_id in ids.split(',')]
+    except ValueError as error:
+        raise ApplicationError(
+            message="Invalid meetup id",
+            error_type=ErrorType.VALIDATION_ERROR,
+        ) from error
+
+
+# Declared after the fixed paths above so '/{meetup_id}' cannot shadow them.
+@MEETUPS_ROUTER.get(
+    path='',
+    responses={
+        HTTP_200_OK: {'model': SuccessResponse[list[MeetupReadModel]]},
+        HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorResponse[ApplicationError]
+        }
+    },
+    status_code=HTTP_200_OK
+)
+@inject
+async def get_meetups_by_ids(
+    meetup_ids: Annotated[list[MeetupId], Depends(parse_meetup_ids)],
+    *,
+    sender: FromDishka[Sender]
+) -> SuccessResponse[list[MeetupReadModel]]:
+    meetups = await sender.send(
+        request=GetMeetupsByIds(meetup_ids=meetup_ids)
+    )
+    return SuccessResponse(result=meetups, status=HTTP_200_OK)
+
+
+@MEETUPS_ROUTER.get(
+    path='/{meetup_id}',
+    responses={
+        HTTP_200_OK: {'model': SuccessResponse[MeetupReadModel]},
+        HTTP_404_NOT_FOUND: {'model': ErrorResponse[ApplicationError]}
+    },
+    status_code=HTTP_200_OK
+)
+@inject
+async def get_meetup(
+    meetup_id: UUID,
+    *,
+    sender: FromDishka[Sender]
+) -> SuccessResponse[MeetupReadModel]:
+    meetup = await sender.send(
+        request=GetMeetup(meetup_id=MeetupId(meetup_id))
     )
-    return SuccessResponse(result=meetups, status=HTTP_200_OK)
\ No newline at end of file
+    return SuccessResponse(result=meetup, status=HTTP_200_OK)
@@ -0,0 +1,46 @@
+from typing import Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Response
+from starlette.status import HTTP_200_OK
+
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.metrics.prometheus_cache_metrics import (
+    render_cache_stats,
+)
+from meetups.infrastructure.metrics.prometheus_request_metrics import (
+    PrometheusRequestMetrics,
+)
+from meetups.infrastructure.outbox.outbox_gateway import OutboxGateway
+from meetups.infrastructure.outbox.outbox_telemetry import OutboxTelemetry
+
+PROMETHEUS_CONTENT_TYPE: Final[str] = (
+    "text/plain; version=0.0.4; charset=utf-8"
+)
+
+METRICS_ROUTER = APIRouter(tags=["Metrics"])
+
+
+@METRICS_ROUTER.get(
+    "/metrics",
+    response_class=Response,
+    responses={HTTP_200_OK: {"content": {PROMETHEUS_CONTENT_TYPE: {}}}},
+    status_code=HTTP_200_OK,
+)
+@inject
+async def metrics(
+    *,
+    request_metrics: FromDishka[PrometheusRequestMetrics],
+    outbox_gateway: FromDishka[OutboxGateway],
+    outbox_telemetry: FromDishka[OutboxTelemetry],
+    cache_backend: FromDishka[CacheBackend],
+) -> Response:
+    backlog = await outbox_gateway.backlog()
+
+    return Response(
+        request_metrics.render()
+        + render_cache_stats(cache_backend.stats)
+        + outbox_telemetry.render(backlog),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -0,0 +1,62 @@
+from typing import Final
+
+from dishka import AsyncContainer
+from fastapi import Request, Response
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp
+
+from meetups.infrastructure.tracing.span import SpanContext
+from meetups.infrastructure.tracing.tracer import Tracer
+
+TRACEPARENT_HEADER: Final[str] = "traceparent"
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """Opens the root span of every request.
+
+    An incoming ``traceparent`` header is continued, and the request's own
+    trace context is returned in the same header so callers can look the
+    trace up.
+    """
+
+    def __init__(self, app: ASGIApp, container: AsyncContainer) -> None:
+        super().__init__(app)
+        self._container = container
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        tracer = await self._container.get(Tracer)
+
+        with tracer.span(
+            f"{request.method} {request.url.path}",
+            {
+                "http.method": request.method,
+                "http.target": request.url.path,
+            },
+            parent=SpanContext.from_traceparent(
+                request.headers.get(TRACEPARENT_HEADER)
+            ),
+        ) as span:
+            response = await call_next(request)
+            if span is None:
+                return response
+
+            # The route is only known once routing has run; naming the span
+            # after its template keeps ids out of span names.
+            route: BaseRoute | None = request.scope.get("route")
+            route_path = getattr(route, "path", None)
+            if route_path is not None:
+                span.name = f"{request.method} {route_path}"
+                span.attributes["http.route"] = route_path
+
+            span.attributes["http.status_code"] = response.status_code
+            response.headers[TRACEPARENT_HEADER] = (
+                span.context.to_traceparent()
+            )
+
+            return response
@@ -0,0 +1,35 @@
+import asyncio
+
+from click import Path, argument
+from dishka import FromDishka
+from dishka.integrations.click import inject
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from meetups.infrastructure.persistence.adapters.sql_meetup_gateway import (
+    SqlMeetupGateway,
+)
+from meetups.presentation.ndjson import encode_ndjson
+
+
+@argument("path", type=Path(dir_okay=False, writable=True))
+@inject
+def export_meetups(
+    path: str,
+    *,
+    engine: FromDishka[AsyncEngine],
+) -> None:
+    asyncio.run(_export_meetups(engine, path))
+
+
+async def _export_meetups(engine: AsyncEngine, path: str) -> None:
+    async with engine.connect() as connection:
+        meetup_gateway = SqlMeetupGateway(connection)
+
+        # Writes go through a worker thread, so a slow disk never blocks
+        # the loop that pulls the next rows from the cursor.
+        file = await asyncio.to_thread(open, path, "wb")
+        try:
+            async for chunk in encode_ndjson(meetup_gateway.stream_all()):
+                await asyncio.to_thread(file.write, chunk)
+        finally:
+            await asyncio.to_thread(file.close)
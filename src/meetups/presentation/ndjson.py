@@ -0,0 +1,31 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+from pydantic import TypeAdapter
+
+from meetups.application.models.meetup import MeetupReadModel
+
+MEETUP_ADAPTER: TypeAdapter[MeetupReadModel] = TypeAdapter(
+    MeetupReadModel
+)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+
+async def encode_ndjson(
+    meetups: AsyncIterable[MeetupReadModel],
+    chunk_size: int = NDJSON_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    # Lines are grouped into chunks so each write carries a useful payload,
+    # while at most one chunk is held in memory at a time.
+    chunk = bytearray()
+
+    async for meetup in meetups:
+        chunk += MEETUP_ADAPTER.dump_json(meetup)
+        chunk += b"\n"
+
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+
+    if chunk:
+        yield bytes(chunk)
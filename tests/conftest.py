@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+from dishka import AsyncContainer
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from uuid_extensions import uuid7  # type: ignore
+
+from meetups.bootstrap.entrypoints.api import bootstrap_application
+from meetups.domain.meetup.meetup_id import MeetupId
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.persistence.sql_tables import (
+    MEETUPS_TABLE,
+    METADATA,
+)
+
+ADMIN_HEADERS = {"X-User-Id": str(uuid7()), "X-User-Role": "admin"}
+
+
+async def _create_schema(database_uri: str) -> None:
+    engine = create_async_engine(database_uri)
+    async with engine.begin() as connection:
+        await connection.run_sync(METADATA.create_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+def client(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[TestClient]:
+    database_uri = f"sqlite+aiosqlite:///{tmp_path / 'meetups.db'}"
+    monkeypatch.setenv("DATABASE_URI", database_uri)
+    asyncio.run(_create_schema(database_uri))
+
+    with TestClient(bootstrap_application()) as test_client:
+        yield test_client
+
+
+def app_container(client: TestClient) -> AsyncContainer:
+    state = client.app.state  # type: ignore[attr-defined]
+    container: AsyncContainer = state.dishka_container
+    return container
+
+
+class Processor(Protocol):
+    async def process(self) -> int: ...
+
+
+def run_processor(client: TestClient, processor_type: type[Processor]) -> int:
+    # Resolved from the app's own container, so it shares the cache that
+    # serves the requests.
+    async def process() -> int:
+        request = Request(
+            {"type": "http", "method": "GET", "path": "/", "headers": []}
+        )
+        async with app_container(client)(
+            context={Request: request}
+        ) as request_container:
+            processor = await request_container.get(processor_type)
+            return await processor.process()
+
+    return client.portal.call(process)  # type: ignore[union-attr]
+
+
+def insert_meetup(
+    client: TestClient,
+    start_date: date,
+    finish_date: date,
+    status: MeetupStatus = MeetupStatus.COMING,
+    next_transition_at: date | None = None,
+) -> MeetupId:
+    meetup_id = MeetupId(uuid7())
+
+    async def insert() -> None:
+        engine = await app_container(client).get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(
+                MEETUPS_TABLE.insert().values(
+                    meetup_id=meetup_id,
+                    user_id=uuid7(),
+                    title="Meetup",
+                    description="Meetup",
+                    address="Main st. 1",
+                    city="Berlin",
+                    country="Germany",
+                    start_date=start_date,
+                    finish_date=finish_date,
+                    status=status,
+                    posted_at=datetime.now(UTC),
+                    next_transition_at=next_transition_at,
+                )
+            )
+
+    client.portal.call(insert)  # type: ignore[union-attr]
+
+    return meetup_id
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from meetups.domain.meetup.meetup_status import MeetupStatus
+from meetups.infrastructure.meetup_archive_processor import (
+    MeetupArchiveProcessor,
+)
+from tests.conftest import ADMIN_HEADERS, insert_meetup, run_processor
+
+
+def test_archive_then_get_drops_meetup_from_default_listing(
+    client: TestClient,
+) -> None:
+    long_ago = datetime.now(UTC).date() - timedelta(days=365)
+    meetup_id = insert_meetup(
+        client, long_ago, long_ago, status=MeetupStatus.COMPLETED
+    )
+
+    listing = client.get("/meetups/all", headers=ADMIN_HEADERS)
+    assert [meetup["meetup_id"] for meetup in listing.json()["result"]] == [
+        str(meetup_id)
+    ]
+
+    assert run_processor(client, MeetupArchiveProcessor) == 1
+
+    listing_after = client.get("/meetups/all", headers=ADMIN_HEADERS)
+    with_archive = client.get(
+        "/meetups/all?include_archived=true", headers=ADMIN_HEADERS
+    )
+
+    assert listing_after.headers["ETag"] != listing.headers["ETag"]
+    assert listing_after.json()["result"] == []
+    assert [
+        meetup["meetup_id"] for meetup in with_archive.json()["result"]
+    ] == [str(meetup_id)]
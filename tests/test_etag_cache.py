@@ -0,0 +1,80 @@
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from meetups.domain.meetup.meetup import Meetup
+from meetups.infrastructure.cache.cache_backend import CacheBackend
+from meetups.infrastructure.cache.meetup_cache_tags import meetup_tag
+from meetups.infrastructure.persistence.adapters.sql_change_versions import (
+    SqlChangeVersions,
+)
+from meetups.infrastructure.persistence.sql_tables import MEETUPS_TABLE
+from tests.conftest import ADMIN_HEADERS, app_container, insert_meetup
+
+
+def rename_meetups_elsewhere(client: TestClient, title: str) -> None:
+    # A write that never reaches this process's cache, as one made by
+    # another API or taskiq worker would.
+    async def rename() -> None:
+        engine = await app_container(client).get(AsyncEngine)
+        async with engine.begin() as connection:
+            await connection.execute(
+                MEETUPS_TABLE.update().values(title=title)
+            )
+            await SqlChangeVersions(connection).bump([Meetup])
+
+    client.portal.call(rename)  # type: ignore[union-attr]
+
+
+def test_etag_never_tags_a_stale_cached_body(client: TestClient) -> None:
+    start_date = datetime.now(UTC).date() + timedelta(days=7)
+    insert_meetup(client, start_date, start_date)
+    listing = client.get("/meetups/all", headers=ADMIN_HEADERS)
+
+    rename_meetups_elsewhere(client, "Renamed")
+
+    listing_after = client.get("/meetups/all", headers=ADMIN_HEADERS)
+    assert listing_after.headers["ETag"] != listing.headers["ETag"]
+    assert listing_after.json()["result"][0]["title"] == "Renamed"
+
+    not_modified = client.get(
+        "/meetups/all",
+        headers={
+            **ADMIN_HEADERS,
+            "If-None-Match": listing_after.headers["ETag"],
+        },
+    )
+    assert not_modified.status_code == 304
+
+
+def test_lookup_sees_a_write_announced_by_another_process(
+    client: TestClient,
+) -> None:
+    start_date = datetime.now(UTC).date() + timedelta(days=7)
+    meetup_id = insert_meetup(client, start_date, start_date)
+    client.get(f"/meetups/{meetup_id}", headers=ADMIN_HEADERS)
+
+    rename_meetups_elsewhere(client, "Renamed")
+
+    # What the invalidation listener does when the writer's NOTIFY arrives.
+    async def evict() -> None:
+        cache_backend = await app_container(client).get(CacheBackend)
+        await cache_backend.invalidate([meetup_tag(meetup_id)])
+
+    client.portal.call(evict)  # type: ignore[union-attr]
+
+    lookup = client.get(f"/meetups/{meetup_id}", headers=ADMIN_HEADERS)
+    assert lookup.json()["result"]["title"] == "Renamed"
+
+
+def test_metrics_render_cache_stats(client: TestClient) -> None:
+    start_date = datetime.now(UTC).date() + timedelta(days=7)
+    insert_meetup(client, start_date, start_date)
+    client.get("/meetups/all", headers=ADMIN_HEADERS)
+    client.get("/meetups/all", headers=ADMIN_HEADERS)
+
+    metrics = client.get("/metrics").text
+    assert "meetups_cache_hits_total 1" in metrics
+    assert "meetups_cache_misses_total 1" in metrics
+    assert "meetups_cache_evictions_total 0" in metrics
@@ -0,0 +1,46 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from meetups.infrastructure.tracing.adapters.file_span_exporter import (
+    FileSpanExporter,
+)
+from meetups.infrastructure.tracing.tracer import Tracer
+
+
+def test_spans_are_written_by_close(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    exporter = FileSpanExporter(str(path))
+    tracer = Tracer(exporter)
+
+    with tracer.span("request"), tracer.span("query"):
+        pass
+    exporter.close()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["query", "request"]
+    assert spans[0]["parent_span_id"] == spans[1]["span_id"]
+
+
+def test_unwritable_path_fails_on_construction(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        FileSpanExporter(str(tmp_path / "missing" / "traces.jsonl"))
+
+
+@pytest.mark.skipif(not Path("/dev/full").exists(), reason="needs /dev/full")
+def test_refused_writes_never_block_close() -> None:
+    exporter = FileSpanExporter("/dev/full", max_queued=1, close_timeout=1)
+    tracer = Tracer(exporter)
+
+    with tracer.span("request"):
+        pass
+    # Lets the writer hit the full disk before the queue fills up.
+    time.sleep(0.1)
+    with tracer.span("request"):
+        pass
+
+    started_at = time.monotonic()
+    exporter.close()
+    assert time.monotonic() - started_at < 1
@@ -0,0 +1,57 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from tests.conftest import ADMIN_HEADERS
+
+
+def new_meetup(
+    title: str = "Python meetup", finish_date: str = "2030-01-02"
+) -> dict[str, Any]:
+    return {
+        "title": title,
+        "description": "Talks and pizza",
+        "time": {"start": "2030-01-01", "finish_date": finish_date},
+        "location": {
+            "address": "Main st. 1",
+            "city": "Berlin",
+            "country": "DE",
+        },
+    }
+
+
+def test_single_and_bulk_adds_share_the_meetup_rules(
+    client: TestClient,
+) -> None:
+    for invalid_meetup in (
+        new_meetup(title="  "),
+        new_meetup(finish_date="2029-12-31"),
+    ):
+        single = client.post(
+            "/meetups/", json=invalid_meetup, headers=ADMIN_HEADERS
+        )
+        bulk = client.post(
+            "/meetups/bulk",
+            json={"meetups": [new_meetup(), invalid_meetup]},
+            headers=ADMIN_HEADERS,
+        )
+
+        assert single.status_code == 422
+        assert bulk.status_code == 201
+        [error] = bulk.json()["result"]["errors"]
+        assert error == {"index": 1, "message": single.json()["error"]["title"]}
+
+
+def test_bulk_add_without_a_valid_meetup_is_rejected(
+    client: TestClient,
+) -> None:
+    response = client.post(
+        "/meetups/bulk",
+        json={"meetups": [new_meetup(title=""), new_meetup(title=" ")]},
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == 422
+    result = response.json()["error"]["data"]
+    assert result["succeeded"] == []
+    assert [error["index"] for error in result["errors"]] == [0, 1]
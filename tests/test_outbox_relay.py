@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pytest
+
+from meetups.bootstrap.entrypoints.api import bootstrap_application
+
+
+def test_embedded_relay_is_refused_without_skip_locked(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The process_outbox cron task drains the same outbox, and SQLite
+    # cannot keep the two on disjoint rows.
+    monkeypatch.setenv(
+        "DATABASE_URI", f"sqlite+aiosqlite:///{tmp_path / 'meetups.db'}"
+    )
+    monkeypatch.setenv("OUTBOX_EMBEDDED_RELAY", "true")
+
+    with pytest.raises(ValueError, match="SKIP LOCKED"):
+        bootstrap_application()
@@ -0,0 +1,22 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import ADMIN_HEADERS
+
+
+@pytest.mark.parametrize(
+    "query", ["limit=0", "limit=-1", "limit=101", "offset=-1"]
+)
+def test_out_of_range_pages_are_rejected(
+    client: TestClient, query: str
+) -> None:
+    response = client.get(f"/meetups/all?{query}", headers=ADMIN_HEADERS)
+    assert response.status_code == 422
+
+
+def test_empty_page_has_no_next_cursor(client: TestClient) -> None:
+    response = client.get("/meetups/all?limit=1", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    assert response.json()["result"] == []
+    assert response.json()["next_cursor"] is None
@@ -0,0 +1,25 @@
+import warnings
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.conftest import ADMIN_HEADERS, insert_meetup
+
+
+@pytest.mark.parametrize(
+    "path", ["/meetups/all", "/meetups/search?q=Meetup"]
+)
+def test_cached_listings_serialize_without_warnings(
+    client: TestClient, path: str
+) -> None:
+    start_date = datetime.now(UTC).date() + timedelta(days=7)
+    insert_meetup(client, start_date, start_date)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # The second request is served from the cache.
+        responses = [client.get(path, headers=ADMIN_HEADERS) for _ in "ab"]
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert responses[0].json() == responses[1].json()
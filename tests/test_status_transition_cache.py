@@ -0,0 +1,56 @@
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from meetups.infrastructure.meetup_status_transition_processor import (
+    MeetupStatusTransitionProcessor,
+)
+from tests.conftest import ADMIN_HEADERS, insert_meetup, run_processor
+
+
+def test_status_transition_then_get_serves_new_status(
+    client: TestClient,
+) -> None:
+    today = datetime.now(UTC).date()
+    meetup_id = insert_meetup(
+        client, today, today + timedelta(days=1), next_transition_at=today
+    )
+
+    # Warm the cache with the COMING meetup.
+    listing = client.get("/meetups/all", headers=ADMIN_HEADERS)
+    lookup = client.get(f"/meetups/{meetup_id}", headers=ADMIN_HEADERS)
+    assert listing.json()["result"][0]["status"] == "COMING"
+    assert lookup.json()["result"]["status"] == "COMING"
+
+    assert run_processor(client, MeetupStatusTransitionProcessor) == 1
+
+    listing_after = client.get("/meetups/all", headers=ADMIN_HEADERS)
+    lookup_after = client.get(f"/meetups/{meetup_id}", headers=ADMIN_HEADERS)
+    filtered_after = client.get(
+        "/meetups/all?status=STARTED", headers=ADMIN_HEADERS
+    )
+
+    assert listing_after.headers["ETag"] != listing.headers["ETag"]
+    assert listing_after.json()["result"][0]["status"] == "STARTED"
+    assert lookup_after.json()["result"]["status"] == "STARTED"
+    assert [
+        meetup["meetup_id"] for meetup in filtered_after.json()["result"]
+    ] == [str(meetup_id)]
+
+
+def test_status_transition_then_stale_etag_gets_new_body(
+    client: TestClient,
+) -> None:
+    today = datetime.now(UTC).date()
+    insert_meetup(
+        client, today, today + timedelta(days=1), next_transition_at=today
+    )
+    etag = client.get("/meetups/all", headers=ADMIN_HEADERS).headers["ETag"]
+
+    run_processor(client, MeetupStatusTransitionProcessor)
+
+    response = client.get(
+        "/meetups/all", headers={**ADMIN_HEADERS, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["result"][0]["status"] == "STARTED"